@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import regex as re
 import yaml
@@ -22,6 +22,8 @@ class ComputeResources:
     memory_frequency: float = 3200e6
     memory_width: int = 64
     memory_channels: int = 4
+    name: str = ""
+    attached_gpus: list = field(default_factory=list)
 
     def get_memory_bandwidth(self) -> float:
         """
@@ -108,25 +110,31 @@ def create_gpu_resource(
     )
 
 
-def create_compute_resources_from_yaml(yaml_file):
-    loader = yaml.SafeLoader
-    loader.add_implicit_resolver(
-        "tag:yaml.org,2002:float",
-        re.compile(
-            """^(?:
+class _Loader(yaml.SafeLoader):
+    """SafeLoader that also resolves exponent floats in hardware YAML."""
+
+
+# Resolve exponent floats such as 1e9, which YAML 1.1 would load as strings.
+# Registered once, on a private loader, so yaml.SafeLoader is left untouched.
+_Loader.add_implicit_resolver(
+    "tag:yaml.org,2002:float",
+    re.compile(
+        """^(?:
      [-+]?(?:[0-9][0-9_]*)\\.[0-9_]*(?:[eE][-+]?[0-9]+)?
     |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
     |\\.[0-9_]+(?:[eE][-+][0-9]+)?
     |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*
     |[-+]?\\.(?:inf|Inf|INF)
     |\\.(?:nan|NaN|NAN))$""",
-            re.X,
-        ),
-        list("-+0123456789."),
-    )
+        re.X,
+    ),
+    list("-+0123456789."),
+)
+
 
+def create_compute_resources_from_yaml(yaml_file):
     with open(yaml_file) as file:
-        data = yaml.safe_load(file)
+        data = yaml.load(file, Loader=_Loader)
     hardware_type = data.get("hardware", "CPU")
     if hardware_type == "CPU":
         return create_compute_resources(
@@ -5,6 +5,8 @@ This module provides predefined hardware configurations for various
 CPUs and GPUs, which can be used in latency estimation.
 """
 
+import copy
+import functools
 import os
 
 import yaml
@@ -23,6 +25,26 @@ def _load_hardware(filename: str) -> ComputeResources:
     """
     Load hardware configuration from YAML file.
 
+    Parsed configurations are cached per file; each call returns a fresh copy
+    so callers may modify the resource without affecting later loads.
+
+    Args:
+        filename: Name of YAML file in hardware directory
+
+    Returns:
+        ComputeResources: Configured compute resource
+    """
+    resource = copy.copy(_load_hardware_cached(filename))
+    # copy.copy shares the list with the cached template
+    resource.attached_gpus = list(resource.attached_gpus)
+    return resource
+
+
+@functools.lru_cache(maxsize=None)
+def _load_hardware_cached(filename: str) -> ComputeResources:
+    """
+    Parse a hardware YAML file once and return the resulting resource.
+
     Args:
         filename: Name of YAML file in hardware directory
 
@@ -5,7 +5,7 @@ This module provides components for the visual design of adaptive optics pipelin
 with emphasis on network and multi-compute node configurations.
 """
 
-from .main_window import PipelineDesignerApp
+from .main_window import PipelineDesignerApp, run_designer
 from .undo_stack import (
     AddComponentCommand,
     AddConnectionCommand,
@@ -19,6 +19,7 @@ from .undo_stack import (
 
 __all__ = [
     "PipelineDesignerApp",
+    "run_designer",
     "AddComponentCommand",
     "RemoveComponentCommand",
     "MoveComponentCommand",
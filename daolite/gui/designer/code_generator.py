@@ -11,6 +11,18 @@ from daolite.common import ComponentType
 
 from .component_block import ComponentBlock
 
+# Import line each pipeline component type needs in the generated code
+_COMPONENT_IMPORTS = {
+    ComponentType.CENTROIDER: "from daolite.pipeline.centroider import Centroider",
+    ComponentType.RECONSTRUCTION: (
+        "from daolite.pipeline.reconstruction import Reconstruction"
+    ),
+    ComponentType.CONTROL: "from daolite.pipeline.control import FullFrameControl",
+    ComponentType.CALIBRATION: (
+        "from daolite.pipeline.calibration import PixelCalibration"
+    ),
+}
+
 
 class CodeGenerator:
     """
@@ -110,12 +122,24 @@ class CodeGenerator:
         # ALWAYS add hardware import - it's required for standard compute resources
         self.import_statements.add("from daolite.compute import hardware")
 
-        # Track which camera functions are used
+        # One pass collects camera functions, component imports and the
+        # transfer types used by network components
         used_camera_funcs = set()
+        has_network = False
+        has_pcie = False
         for component in self.components:
-            if component.component_type == ComponentType.CAMERA:
+            component_type = component.component_type
+            if component_type == ComponentType.CAMERA:
                 camera_func = component.params.get("camera_function", "PCOCamLink")
                 used_camera_funcs.add(camera_func)
+            elif component_type == ComponentType.NETWORK:
+                transfer_type = component.params.get("transfer_type", "").lower()
+                if transfer_type == "pcie":
+                    has_pcie = True
+                elif transfer_type == "network":
+                    has_network = True
+            elif component_type in _COMPONENT_IMPORTS:
+                self.import_statements.add(_COMPONENT_IMPORTS[component_type])
 
         if used_camera_funcs:
             cam_imports = ", ".join(sorted(used_camera_funcs))
@@ -130,46 +154,10 @@ class CodeGenerator:
             if "simulate_camera_readout" not in imp
         }
 
-        # Check for component types and add relevant imports
-        has_network = False
-        for component in self.components:
-            # Add component-specific imports
-            if component.component_type == ComponentType.CENTROIDER:
-                self.import_statements.add(
-                    "from daolite.pipeline.centroider import Centroider"
-                )
-
-            elif component.component_type == ComponentType.RECONSTRUCTION:
-                self.import_statements.add(
-                    "from daolite.pipeline.reconstruction import Reconstruction"
-                )
-
-            elif component.component_type == ComponentType.CONTROL:
-                self.import_statements.add(
-                    "from daolite.pipeline.control import FullFrameControl"
-                )
-
-            elif component.component_type == ComponentType.CALIBRATION:
-                self.import_statements.add(
-                    "from daolite.pipeline.calibration import PixelCalibration"
-                )
-
-            elif component.component_type == ComponentType.NETWORK:
-                has_network = True
-
         # For visualization
         self.import_statements.add("import matplotlib.pyplot as plt")
 
         # Add imports for transfer functions
-        has_network = False
-        has_pcie = False
-        for component in self.components:
-            if component.component_type == ComponentType.NETWORK:
-                transfer_type = component.params.get("transfer_type", "").lower()
-                if transfer_type == "pcie":
-                    has_pcie = True
-                elif transfer_type == "network":
-                    has_network = True
         for transfer in getattr(self, "generated_transfer_components", []):
             ttype = transfer.get("transfer_type", "").lower()
             if ttype == "pcie":
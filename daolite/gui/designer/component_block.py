@@ -57,6 +57,8 @@ class ComponentBlock(QGraphicsItem):
         self.setFlag(QGraphicsItem.ItemSendsScenePositionChanges)
         self.setAcceptedMouseButtons(Qt.LeftButton)
         self.setAcceptHoverEvents(True)  # Enable hover events for detailed tooltips
+        # Set when the block moves; lets the scene skip drop handling on clicks
+        self._moved_since_press = False
 
     def set_theme(self, theme):
         self.theme = theme
@@ -186,6 +188,17 @@ class ComponentBlock(QGraphicsItem):
             self.output_ports.append(output_port)
 
     def boundingRect(self) -> QRectF:
+        # Include the port circles, drop shadow and selection pen, which are
+        # painted outside self.size, so partial viewport updates stay clean
+        return self.size.adjusted(-12, -4, 12, 6)
+
+    def layout_rect(self) -> QRectF:
+        """
+        Return the block body in local coordinates.
+
+        Drop detection, overlap tests and container layout use this rather
+        than boundingRect(), which is padded for painting.
+        """
         return self.size
 
     def paint(self, painter: QPainter, option, widget):
@@ -361,65 +374,66 @@ class ComponentBlock(QGraphicsItem):
         }
         return descs.get(self.component_type, "AO pipeline component")
 
-    def _update_all_transfer_indicators(self):
-        if not self.scene():
-            return
-        from .connection import Connection
+    def _attached_connections(self):
+        """Return this block's connections from the scene's per-block index."""
+        scene = self.scene()
+        if not hasattr(scene, "connections_for"):
+            return ()
+        return tuple(scene.connections_for(self))
+
+    def _invalidate_port_positions(self):
+        for port in self.input_ports + self.output_ports:
+            port.invalidate_scene_position()
+
+    def update_name_labels(self):
+        """
+        Repaint this block and the connected blocks whose port labels show its name.
+        """
+        self.update()
+        for port in self.input_ports + self.output_ports:
+            for block, _ in port.connected_to:
+                block.update()
+
+    def _update_connection_paths(self):
+        for connection in self._attached_connections():
+            connection.update_path()
 
-        for item in self.scene().items():
-            if isinstance(item, Connection):
-                if item.start_block == self or item.end_block == self:
-                    item.update_transfer_indicators()
+    def _update_all_transfer_indicators(self):
+        for connection in self._attached_connections():
+            connection.update_transfer_indicators()
 
     def itemChange(self, change, value):
+        # Keep the scene's component registry in sync
+        if change == QGraphicsItem.ItemSceneChange:
+            if hasattr(self.scene(), "unregister_component"):
+                self.scene().unregister_component(self)
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            if hasattr(self.scene(), "register_component"):
+                self.scene().register_component(self)
+        if change in (
+            QGraphicsItem.ItemSceneHasChanged,
+            QGraphicsItem.ItemParentHasChanged,
+        ):
+            self._invalidate_port_positions()
         if change == QGraphicsItem.ItemPositionChange and self.scene():
-            for port in self.input_ports + self.output_ports:
-                for comp, port2 in port.connected_to:
-                    for item in self.scene().items():
-                        from .connection import Connection
-
-                        if isinstance(item, Connection):
-                            if (
-                                item.start_block == self or item.end_block == self
-                            ) and (item.start_port == port or item.end_port == port):
-                                item.update_path()
-            self.scene().update()
+            self._update_connection_paths()
             self._update_all_transfer_indicators()
         elif change == QGraphicsItem.ItemScenePositionHasChanged and self.scene():
-            for port in self.input_ports + self.output_ports:
-                for comp, port2 in port.connected_to:
-                    for item in self.scene().items():
-                        from .connection import Connection
-
-                        if isinstance(item, Connection):
-                            if (
-                                item.start_block == self or item.end_block == self
-                            ) and (item.start_port == port or item.end_port == port):
-                                item.update_path()
-            self.scene().update()
+            self._moved_since_press = True
+            self._invalidate_port_positions()
+            self._update_connection_paths()
             self._update_all_transfer_indicators()
         elif change == QGraphicsItem.ItemParentChange and self.scene():
-            from .connection import Connection
-
-            self.scene().update()
+            # Repaint only where the block was drawn before reparenting
+            self.scene().update(self.sceneBoundingRect())
             self._update_all_transfer_indicators()
         elif change == QGraphicsItem.ItemParentHasChanged and self.scene():
-            for port in self.input_ports + self.output_ports:
-                for comp, port2 in port.connected_to:
-                    for item in self.scene().items():
-                        from .connection import Connection
-
-                        if isinstance(item, Connection):
-                            if (
-                                item.start_block == self or item.end_block == self
-                            ) and (item.start_port == port or item.end_port == port):
-                                item.update_path()
-            self.scene().update()
+            self._update_connection_paths()
+            self.scene().update(self.sceneBoundingRect())
             self._update_all_transfer_indicators()
         elif change == QGraphicsItem.ItemSelectedChange and self.scene():
-            for item in self.scene().items():
-                if hasattr(item, "set_highlight"):
-                    item.set_highlight(False)
+            if hasattr(self.scene(), "clear_container_highlights"):
+                self.scene().clear_container_highlights()
         return super().itemChange(change, value)
 
     def contextMenuEvent(self, event: QGraphicsSceneContextMenuEvent):
@@ -448,8 +462,7 @@ class ComponentBlock(QGraphicsItem):
         if dlg.exec_():
             name = dlg.getText()
             self.name = name
-            if self.scene():
-                self.scene().update()
+            self.update_name_labels()
 
     def _on_configure(self):
         print("[DEBUG] _on_configure called")
@@ -473,6 +486,8 @@ class ComponentBlock(QGraphicsItem):
             app = self.scene().parent()
             print(f"[DEBUG] App (scene parent): {app}")
             prev_selected = None
+            if hasattr(app, "_flush_selection"):
+                app._flush_selection()
             if hasattr(app, "selected_component"):
                 print(f"[DEBUG] App has selected_component: {app.selected_component}")
                 prev_selected = app.selected_component
@@ -492,10 +507,9 @@ class ComponentBlock(QGraphicsItem):
 
     def _on_delete(self):
         if self.scene():
-            for connection in list(self.scene().connections):
-                if connection.start_block == self or connection.end_block == self:
-                    connection.disconnect()
-                    self.scene().connections.remove(connection)
+            for connection in list(self.scene().connections_for(self)):
+                connection.disconnect()
+                self.scene().remove_connection(connection)
             self.scene().removeItem(self)
 
     def find_port_at_point(self, point: QPointF) -> Optional[Port]:
@@ -527,6 +541,8 @@ class ComponentBlock(QGraphicsItem):
         if self.scene() and self.scene().parent():
             app = self.scene().parent()
             prev_selected = None
+            if hasattr(app, "_flush_selection"):
+                app._flush_selection()
             if hasattr(app, "selected_component"):
                 prev_selected = app.selected_component
                 app.selected_component = self
@@ -13,6 +13,18 @@ from daolite.compute import ComputeResources
 from .component_block import ComponentBlock
 
 
+def _layout_rect(item: QGraphicsItem) -> QRectF:
+    """
+    Return the rect an item occupies for layout, in its parent's coordinates.
+
+    Blocks paint ports and shadows outside their body, so layout uses their
+    layout_rect() rather than the painted boundingRect().
+    """
+    if hasattr(item, "layout_rect"):
+        return item.mapRectToParent(item.layout_rect())
+    return item.mapRectToParent(item.boundingRect())
+
+
 class ComponentContainer(QGraphicsItem):
     """
     Base class for compute resource containers (CPU and GPU boxes).
@@ -27,9 +39,12 @@ class ComponentContainer(QGraphicsItem):
         self.name = name
         self.compute = compute
         self.child_items: List[QGraphicsItem] = []
+        self._cached_scene_rect = None
         self.size = QRectF(0, 0, 250, 180)
         self.setFlag(QGraphicsItem.ItemIsMovable)
         self.setFlag(QGraphicsItem.ItemIsSelectable)
+        # Needed for ItemPositionHasChanged, which invalidates the cached rect
+        self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
         self.setZValue(z_value)
         self._highlight = False  # Visual indicator for drag-over
         self.box_color = QColor(100, 150, 200)  # Default color - will be overridden
@@ -47,22 +62,77 @@ class ComponentContainer(QGraphicsItem):
             if hasattr(child, "set_theme"):
                 child.set_theme(theme)
 
+    @property
+    def size(self) -> QRectF:
+        return self._size
+
+    @size.setter
+    def size(self, rect: QRectF):
+        self._size = rect
+        self.invalidate_scene_rect()
+
+    def scene_rect_cached(self) -> QRectF:
+        """
+        Return sceneBoundingRect(), cached until the container moves or resizes.
+        """
+        rect = self._cached_scene_rect
+        if rect is None:
+            rect = self._cached_scene_rect = self.sceneBoundingRect()
+        return rect
+
+    def invalidate_scene_rect(self):
+        """
+        Drop the cached scene rect of this container and of nested containers.
+        """
+        self._cached_scene_rect = None
+        scene = self.scene()
+        if hasattr(scene, "mark_container_bounds_dirty"):
+            scene.mark_container_bounds_dirty()
+        for child in self.childItems():
+            if isinstance(child, ComponentContainer):
+                child.invalidate_scene_rect()
+
+    def prepareGeometryChange(self):
+        # Resizes mutate self.size in place, so invalidate here as well
+        self.invalidate_scene_rect()
+        super().prepareGeometryChange()
+
+    _GEOMETRY_CHANGES = (
+        QGraphicsItem.ItemPositionHasChanged,
+        QGraphicsItem.ItemTransformHasChanged,
+        QGraphicsItem.ItemRotationHasChanged,
+        QGraphicsItem.ItemScaleHasChanged,
+        QGraphicsItem.ItemParentHasChanged,
+        QGraphicsItem.ItemSceneHasChanged,
+    )
+
+    def itemChange(self, change, value):
+        if change in self._GEOMETRY_CHANGES:
+            self.invalidate_scene_rect()
+        # Keep the scene's container registry in sync
+        if change == QGraphicsItem.ItemSceneChange:
+            if hasattr(self.scene(), "unregister_container"):
+                self.scene().unregister_container(self)
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            if hasattr(self.scene(), "register_container"):
+                self.scene().register_container(self)
+        return super().itemChange(change, value)
+
     def set_highlight(self, value: bool):
         self._highlight = value
         self.update()
 
     def _update_all_transfer_indicators(self):
-        if not self.scene():
+        scene = self.scene()
+        if not hasattr(scene, "connections_for"):
             return
-        from .connection import ComponentBlock, Connection
-
-        blocks = [
-            child for child in self.childItems() if isinstance(child, ComponentBlock)
-        ]
-        for item in self.scene().items():
-            if isinstance(item, Connection):
-                if item.start_block in blocks or item.end_block in blocks:
-                    item.update_transfer_indicators()
+        # Look connections up per child block instead of scanning the scene
+        connections = {}
+        for child in self.childItems():
+            if isinstance(child, ComponentBlock):
+                connections.update(dict.fromkeys(scene.connections_for(child)))
+        for connection in connections:
+            connection.update_transfer_indicators()
 
     def contextMenuEvent(self, event):
         menu = QMenu()
@@ -313,6 +383,24 @@ class ComponentContainer(QGraphicsItem):
 
         super().mouseReleaseEvent(event)
 
+    def acquire_child(self, block: QGraphicsItem):
+        """
+        Take ownership of a block dropped into this container.
+
+        Assigns the container's compute resource and tracks the block in
+        child_items; the caller is responsible for reparenting.
+        """
+        block.compute = self.compute
+        if block not in self.child_items:
+            self.child_items.append(block)
+
+    def release_child(self, block: QGraphicsItem):
+        """
+        Stop tracking a block dragged out of this container.
+        """
+        if block in self.child_items:
+            self.child_items.remove(block)
+
     def add_child(self, item: QGraphicsItem):
         item.setParentItem(self)
         self.child_items.append(item)
@@ -329,16 +417,13 @@ class ComponentContainer(QGraphicsItem):
         iter_count = 0
 
         def child_key(child):
-            c_rect = child.mapToParent(child.boundingRect()).boundingRect()
+            c_rect = _layout_rect(child)
             return (c_rect.top(), c_rect.left())
 
         while changed and iter_count < max_iter:
             changed = False
             sorted_children = sorted(self.child_items, key=child_key)
-            child_rects = [
-                child.mapToParent(child.boundingRect()).boundingRect()
-                for child in sorted_children
-            ]
+            child_rects = [_layout_rect(child) for child in sorted_children]
             for i, rect1 in enumerate(child_rects):
                 for j, rect2 in enumerate(child_rects):
                     if i == j:
@@ -370,7 +455,7 @@ class ComponentContainer(QGraphicsItem):
                     break
             iter_count += 1
         for child in self.child_items:
-            c_rect = child.mapToParent(child.boundingRect()).boundingRect()
+            c_rect = _layout_rect(child)
             dx = dy = 0
             if c_rect.left() < 0:
                 dx = -c_rect.left() + 10
@@ -386,7 +471,7 @@ class ComponentContainer(QGraphicsItem):
 
     def _expand_for_children(self, margin=10):
         for child in self.child_items:
-            c_rect = child.mapToParent(child.boundingRect()).boundingRect()
+            c_rect = _layout_rect(child)
             expand_w = c_rect.right() + margin - self.size.width()
             expand_h = c_rect.bottom() + margin - self.size.height()
             if expand_w > 0 or expand_h > 0:
@@ -400,7 +485,7 @@ class ComponentContainer(QGraphicsItem):
                 self.update()
 
     def snap_child_fully_inside(self, child):
-        c_rect = child.mapToParent(child.boundingRect()).boundingRect()
+        c_rect = _layout_rect(child)
         changed = False
         margin = 10
         if c_rect.right() > self.size.width():
@@ -434,18 +519,14 @@ class ComponentContainer(QGraphicsItem):
         overlaps = False
         for sibling in self.childItems():
             if sibling is not child and isinstance(sibling, ComponentBlock):
-                sibling_rect = sibling.mapToParent(
-                    sibling.boundingRect()
-                ).boundingRect()
+                sibling_rect = _layout_rect(sibling)
                 if c_rect.intersects(sibling_rect):
                     overlaps = True
                     break
         if overlaps:
             for sibling in self.childItems():
                 if sibling is not child and isinstance(sibling, ComponentBlock):
-                    sibling_rect = sibling.mapToParent(
-                        sibling.boundingRect()
-                    ).boundingRect()
+                    sibling_rect = _layout_rect(sibling)
                     if c_rect.intersects(sibling_rect):
                         dx = sibling_rect.right() - c_rect.left() + margin
                         dy = sibling_rect.bottom() - c_rect.top() + margin
@@ -453,7 +534,7 @@ class ComponentContainer(QGraphicsItem):
                             child.setX(child.x() + dx)
                         else:
                             child.setY(child.y() + dy)
-                        c_rect = child.mapToParent(child.boundingRect()).boundingRect()
+                        c_rect = _layout_rect(child)
                         changed = True
         if changed:
             self.prepareGeometryChange()
@@ -479,8 +560,7 @@ class ComponentContainer(QGraphicsItem):
             if dlg.exec_():
                 name = dlg.getText()
                 self.name = name
-                if self.scene():
-                    self.scene().update()
+                self.update()
             event.accept()
             return
         else:
@@ -572,7 +652,7 @@ class ComputeBox(ComponentContainer):
             if hasattr(self.compute, "attached_gpus") and self.compute.attached_gpus:
                 tooltip += "<br><b>Attached GPUs:</b><br>"
                 for i, gpu in enumerate(self.compute.attached_gpus):
-                    name = getattr(gpu, "name", f"GPU {i+1}")
+                    name = getattr(gpu, "name", "") or f"GPU {i+1}"
                     tooltip += f"• {name}<br>"
 
                     # Add GPU metrics if available
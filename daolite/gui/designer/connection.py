@@ -4,17 +4,27 @@ Connection classes for the daolite pipeline designer.
 This module provides graphical representations of connections between components.
 """
 
+import math
 from typing import List, Optional, Tuple
 
-from PyQt5.QtCore import QPointF, Qt
-from PyQt5.QtGui import QBrush, QColor, QFont, QPainterPath, QPen
+from PyQt5.QtCore import QPointF, QRectF, QSizeF, Qt
+from PyQt5.QtGui import (
+    QBrush,
+    QColor,
+    QFont,
+    QFontMetricsF,
+    QPainter,
+    QPainterPath,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+)
 from PyQt5.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QFormLayout,
     QGraphicsPathItem,
     QGraphicsRectItem,
-    QGraphicsTextItem,
     QLineEdit,
     QMenu,
     QVBoxLayout,
@@ -32,6 +42,18 @@ class TransferIndicator(QGraphicsRectItem):
     These indicators appear on connections crossing resource boundaries.
     """
 
+    # Shared paint resources keyed by transfer type (amber PCIe, blue Network)
+    _PCIE_BRUSH = QBrush(QColor(255, 200, 50, 220))
+    _PCIE_PEN = QPen(QColor(200, 130, 0), 1.5)
+    _NETWORK_BRUSH = QBrush(QColor(100, 200, 255, 220))
+    _NETWORK_PEN = QPen(QColor(0, 130, 200), 1.5)
+
+    _LABEL_FONT = QFont("Arial", 6)
+    # Where the label text starts, matching the old child text item's margin
+    _LABEL_ORIGIN = QPointF(6, 4)
+    # Painted extent per transfer type; the label can overhang the badge
+    _BOUNDS = {}
+
     def __init__(self, transfer_type, parent=None):
         super().__init__(parent)
         self.transfer_type = transfer_type  # "PCIe" or "Network"
@@ -40,16 +62,23 @@ class TransferIndicator(QGraphicsRectItem):
         self.setCacheMode(self.DeviceCoordinateCache)
         self.setAcceptHoverEvents(True)  # Enable hover events for tooltips
 
-        # Create label
-        self.label = QGraphicsTextItem(self)
-        self.label.setPlainText(transfer_type)
-        self.label.setFont(QFont("Arial", 6))
-        # Center text in the indicator
-        self.label.setPos(2, 0)
-
         # Associate with a connection
         self.connection = None
 
+    def _label_rect(self):
+        metrics = QFontMetricsF(self._LABEL_FONT)
+        return QRectF(
+            self._LABEL_ORIGIN,
+            QSizeF(metrics.horizontalAdvance(self.transfer_type), metrics.height()),
+        )
+
+    def boundingRect(self):
+        bounds = self._BOUNDS.get(self.transfer_type)
+        if bounds is None:
+            bounds = self.rect().united(self._label_rect()).adjusted(-1, -1, 1, 1)
+            self._BOUNDS[self.transfer_type] = bounds
+        return bounds
+
     def _generate_detailed_tooltip(self) -> str:
         """Generate a detailed tooltip showing transfer type and specs."""
         if not self.connection:
@@ -144,19 +173,50 @@ class TransferIndicator(QGraphicsRectItem):
         self.setToolTip(self._generate_detailed_tooltip())
         super().hoverEnterEvent(event)
 
-    def paint(self, painter, option, widget):
-        """Paint the transfer indicator with appropriate styling."""
+    def _badge_pixmap(self, scale):
+        """
+        Return the rendered badge and label, shared by all indicators of a type.
+
+        Pixmaps are keyed by zoom bucket so the text stays sharp when zoomed in.
+        """
+        key = f"ti:{self.transfer_type}:{scale}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+
+        bounds = self.boundingRect()
+        pixmap = QPixmap(
+            math.ceil(bounds.width() * scale), math.ceil(bounds.height() * scale)
+        )
+        pixmap.setDevicePixelRatio(scale)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        painter.translate(-bounds.topLeft())
         # Different colors for different transfer types
         if self.transfer_type == "PCIe":
-            brush = QBrush(QColor(255, 200, 50, 220))  # amber, more opaque
-            pen = QPen(QColor(200, 130, 0), 1.5)
+            brush, pen = self._PCIE_BRUSH, self._PCIE_PEN
         else:  # Network
-            brush = QBrush(QColor(100, 200, 255, 220))  # light blue, more opaque
-            pen = QPen(QColor(0, 130, 200), 1.5)
-
+            brush, pen = self._NETWORK_BRUSH, self._NETWORK_PEN
         painter.setPen(pen)
         painter.setBrush(brush)
         painter.drawRoundedRect(self.rect(), 4, 4)
+        painter.setPen(Qt.black)
+        painter.setFont(self._LABEL_FONT)
+        painter.drawText(
+            self._label_rect(), Qt.AlignLeft | Qt.AlignTop, self.transfer_type
+        )
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def paint(self, painter, option, widget):
+        """Paint the transfer indicator with appropriate styling."""
+        # Round the zoom up to a power of two so few pixmaps cover all zooms
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        scale = 2 ** max(0, math.ceil(math.log2(max(lod, 1.0))))
+        painter.drawPixmap(self.boundingRect().topLeft(), self._badge_pixmap(scale))
 
     def set_connection(self, connection):
         """Associate this indicator with a specific connection."""
@@ -196,6 +256,15 @@ class Connection(QGraphicsPathItem):
     Represents data flow between components with a configurable path.
     """
 
+    # Pens shared by all connections instead of being rebuilt per paint
+    _DEFAULT_PEN = QPen(QColor(60, 60, 60), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+    _PATH_PEN = QPen(QColor(0, 180, 255), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+    _SELECTED_PEN = QPen(QColor(255, 80, 80), 6, Qt.SolidLine)
+    _GLOW_PEN = QPen(QColor(0, 180, 255, 80), 10, Qt.SolidLine)
+    _HIGHLIGHT_PEN = QPen(
+        QColor(255, 170, 0), 5, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin
+    )
+
     def __init__(
         self,
         start_block: Optional[ComponentBlock] = None,
@@ -221,15 +290,20 @@ class Connection(QGraphicsPathItem):
 
         # For tracking transfer indicators
         self.transfer_indicators: List[Tuple[str, QPointF]] = []
+        # TransferIndicator items shown in the scene for this connection, and
+        # the inputs they were built from (see connection_manager)
+        self.indicator_items: List[TransferIndicator] = []
+        self.indicator_signature = None
 
         # Set up appearance
-        self.setPen(
-            QPen(QColor(60, 60, 60), 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-        )
+        self.setPen(self._DEFAULT_PEN)
         self.setZValue(-1)  # Below components
         self.setFlag(self.ItemIsSelectable, True)  # Make connection selectable
         self.setAcceptHoverEvents(True)  # Enable hover events for tooltips
 
+        # Highlighted when an attached component is selected
+        self._highlighted = False
+
         # For tracking during creation
         self.temp_end_point: Optional[QPointF] = None
 
@@ -406,9 +480,7 @@ class Connection(QGraphicsPathItem):
         self.setPath(path)
 
         # Make the connection more prominent (thicker, brighter)
-        self.setPen(
-            QPen(QColor(0, 180, 255), 4, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
-        )
+        self.setPen(self._PATH_PEN)
 
     def update_transfer_indicators(self):
         """Update the positions of all transfer indicators when components move."""
@@ -519,14 +591,9 @@ class Connection(QGraphicsPathItem):
         """Remove connection between ports."""
         # Remove any associated transfer indicators first
         if self.scene():
-            # Find and remove all transfer indicators associated with this connection
-            for item in self.scene().items():
-                if (
-                    isinstance(item, TransferIndicator)
-                    and hasattr(item, "connection")
-                    and item.connection is self
-                ):
-                    self.scene().removeItem(item)
+            from .connection_manager import remove_connection_indicators
+
+            remove_connection_indicators(self.scene(), self)
 
         if self.start_port and self.end_port:
             # Remove from start port connections
@@ -588,22 +655,39 @@ class Connection(QGraphicsPathItem):
 
         return True
 
+    def boundingRect(self):
+        # The glow pen is wider than the item pen; cover it so partial
+        # viewport updates repaint the whole stroke when the path moves
+        margin = (self._GLOW_PEN.widthF() - self.pen().widthF()) / 2
+        return super().boundingRect().adjusted(-margin, -margin, margin, margin)
+
     def paint(self, painter, option, widget=None):
         """Custom paint method to highlight the connection if selected."""
         # Always prominent, extra highlight if selected
         if self.isSelected():
-            painter.setPen(QPen(QColor(255, 80, 80), 6, Qt.SolidLine))
+            painter.setPen(self._SELECTED_PEN)
+        elif self._highlighted:
+            painter.setPen(self._HIGHLIGHT_PEN)
         else:
             painter.setPen(self.pen())
 
+        # The view doesn't save painter state between items, so reset the brush
+        painter.setBrush(Qt.NoBrush)
+
         # Optional: subtle shadow/glow
         painter.save()
-        painter.setPen(QPen(QColor(0, 180, 255, 80), 10, Qt.SolidLine))
+        painter.setPen(self._GLOW_PEN)
         painter.drawPath(self.path())
         painter.restore()
 
         painter.drawPath(self.path())
 
+    def highlight_connection(self, value: bool):
+        """Highlight this connection, e.g. when an attached block is selected."""
+        if self._highlighted != value:
+            self._highlighted = value
+            self.update()
+
     def add_transfer_indicator(self, indicator_type, position):
         """Add a transfer indicator to this connection."""
         # This method will be called by PipelineScene to associate indicators with connections
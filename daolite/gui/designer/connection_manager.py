@@ -6,6 +6,7 @@ between components in different compute resources.
 """
 
 import logging
+from functools import lru_cache
 
 from PyQt5.QtCore import QLineF, QPointF
 
@@ -19,24 +20,190 @@ from .data_transfer import determine_transfer_chain
 logger = logging.getLogger("ConnectionManager")
 
 
+def find_boundary_intersection(start_pos, end_pos, container):
+    """
+    Return where the segment start_pos -> end_pos crosses a container's edge.
+
+    The segment is clipped to the container's scene rect in one Liang-Barsky
+    pass. Of the crossings, the one nearest end_pos is returned: the exit
+    point when the segment leaves the rect, otherwise the entry point. None
+    if the segment misses the rect or lies wholly inside it.
+    """
+    if not container:
+        return None
+    rect = container.scene_rect_cached()
+    x1, y1 = start_pos.x(), start_pos.y()
+    dx, dy = end_pos.x() - x1, end_pos.y() - y1
+    t0, t1 = 0.0, 1.0
+    for p, q in (
+        (-dx, x1 - rect.left()),
+        (dx, rect.right() - x1),
+        (-dy, y1 - rect.top()),
+        (dy, rect.bottom() - y1),
+    ):
+        if p == 0:
+            # Parallel to this edge: outside its half-plane means no overlap
+            if q < 0:
+                return None
+        elif p < 0:
+            t0 = max(t0, q / p)
+        else:
+            t1 = min(t1, q / p)
+    if t0 > t1:
+        return None
+    if t1 < 1.0:
+        t = t1
+    elif t0 > 0.0:
+        t = t0
+    else:
+        return None
+    return QPointF(x1 + t * dx, y1 + t * dy)
+
+
+def _container_geometry(block):
+    """Return the identity and scene rect of every container holding a block."""
+    geometry = []
+    parent = block.parentItem()
+    while parent is not None:
+        rect = parent.scene_rect_cached()
+        geometry.append((id(parent), rect.x(), rect.y(), rect.width(), rect.height()))
+        parent = parent.parentItem()
+    return tuple(geometry)
+
+
+def _indicator_signature(connection):
+    """
+    Return everything a connection's indicators are derived from.
+
+    That is the endpoint positions, the containers around each end with
+    their geometry, and each end's component type and compute resource.
+    Returns None for a connection whose ports are not both set.
+    """
+    src_block = connection.start_block
+    dst_block = connection.end_block
+    if not connection.start_port or not connection.end_port:
+        return None
+    start_pos = connection.start_port.get_scene_position()
+    end_pos = connection.end_port.get_scene_position()
+    return (
+        start_pos.x(),
+        start_pos.y(),
+        end_pos.x(),
+        end_pos.y(),
+        _container_geometry(src_block),
+        _container_geometry(dst_block),
+        src_block.component_type,
+        dst_block.component_type,
+        id(src_block.get_compute_resource()),
+        id(dst_block.get_compute_resource()),
+    )
+
+
+@lru_cache(maxsize=256)
+def _is_gpu_container_name(name):
+    """Return True if a container name reads as a GPU (including AMD MI parts)."""
+    lowered = name.lower()
+    return "gpu" in lowered or ("mi" in lowered and "amd" in lowered)
+
+
+def _runs_on_gpu(comp, res):
+    """Return True if a component runs on a GPU."""
+    # Check hardware field
+    if res and getattr(res, "hardware", "").lower() == "gpu":
+        return True
+    # Check parent container type, then its name
+    parent = comp.parentItem() if hasattr(comp, "parentItem") else None
+    if parent is None:
+        return False
+    if isinstance(parent, GPUBox):
+        return True
+    name = getattr(parent, "name", None)
+    return bool(name) and _is_gpu_container_name(name)
+
+
+def _get_compute_box(comp):
+    """Return the ComputeBox holding a component, directly or via a GPUBox."""
+    parent = comp.parentItem() if hasattr(comp, "parentItem") else None
+    if parent and isinstance(parent, ComputeBox):
+        return parent
+    if parent and isinstance(parent, GPUBox):
+        grandparent = parent.parentItem() if hasattr(parent, "parentItem") else None
+        if grandparent and isinstance(grandparent, ComputeBox):
+            return grandparent
+    return None
+
+
+def remove_connection_indicators(scene, connection):
+    """Remove the transfer indicators previously added for a connection."""
+    for indicator in connection.indicator_items:
+        if indicator.scene() is scene:
+            scene.removeItem(indicator)
+    connection.indicator_items.clear()
+    connection.transfer_indicators.clear()
+    connection.indicator_signature = None
+
+
 def update_connection_indicators(scene, connection):
     """
     Update or create transfer indicators for a connection that crosses resource boundaries.
 
+    Indicators are rebuilt only when something they are derived from has
+    changed since the last update, so no-op drops cost a signature check.
+
     Args:
         scene: The graphics scene containing the connection
         connection: The connection to update indicators for
     """
+    signature = _indicator_signature(connection)
+    if (
+        signature is not None
+        and signature == connection.indicator_signature
+        and all(ind.scene() is scene for ind in connection.indicator_items)
+    ):
+        return
+
+    # No updates_suspended() here: it repaints the whole viewport on exit,
+    # which on every drag step would undo the localized item repaints.
+    # Bulk callers (drop handling, loading) already suspend updates.
+    _rebuild_connection_indicators(scene, connection, signature)
+
+
+def _rebuild_connection_indicators(scene, connection, signature):
+    """Replace a connection's transfer indicators; see update_connection_indicators."""
+    plan = _plan_connection_indicators(connection)
+    current = connection.indicator_items
+    if [kind for kind, _ in plan] == [ind.transfer_type for ind in current] and all(
+        ind.scene() is scene for ind in current
+    ):
+        # Same indicators as before, e.g. mid-drag: move them in place rather
+        # than removing and re-adding items, and only when they really moved
+        for indicator, (_, pos) in zip(current, plan):
+            if indicator.pos() != pos:
+                indicator.setPos(pos)
+        connection.indicator_signature = signature
+        return
+
     # Remove any existing indicators for this connection
-    for item in scene.items():
-        if (
-            isinstance(item, TransferIndicator)
-            and hasattr(item, "connection")
-            and item.connection == connection
-        ):
-            logger.debug("Removing existing transfer indicator for connection")
-            scene.removeItem(item)
+    remove_connection_indicators(scene, connection)
+    connection.indicator_signature = signature
+
+    # Add all the indicators to the scene
+    for kind, pos in plan:
+        indicator = TransferIndicator(kind)
+        indicator.setPos(pos)
+        indicator.set_connection(connection)
+        scene.addItem(indicator)
+        connection.indicator_items.append(indicator)
+        logger.debug("Added %s indicator to scene", kind)
+
 
+def _plan_connection_indicators(connection):
+    """
+    Return the (transfer type, scene position) of each indicator a connection needs.
+
+    Positions are rounded to whole pixels, so sub-pixel nudges of a block
+    leave its indicators where they are.
+    """
     # Create new indicators based on source and destination resources
     src_block = connection.start_block
     dst_block = connection.end_block
@@ -45,11 +212,11 @@ def update_connection_indicators(scene, connection):
 
     if not hasattr(connection, "start_port") or not hasattr(connection, "end_port"):
         logger.warning("Connection missing start_port or end_port attributes")
-        return
+        return []
 
     if not connection.start_port or not connection.end_port:
         logger.warning("Connection has null start_port or end_port")
-        return
+        return []
 
     # Get transfer chain to determine needed indicators
     transfer_chain = determine_transfer_chain(src_block, dst_block)
@@ -57,92 +224,19 @@ def update_connection_indicators(scene, connection):
     # Early exit for local transfers (no indicators needed)
     if not transfer_chain:
         logger.debug(
-            f"No transfer indicators needed for local transfer between {src_block.name} and {dst_block.name}"
+            "No transfer indicators needed for local transfer between %s and %s",
+            src_block.name,
+            dst_block.name,
         )
-        return
+        return []
 
     logger.debug(
-        f"Transfer chain between {src_block.name} and {dst_block.name}: {transfer_chain}"
+        "Transfer chain between %s and %s: %s",
+        src_block.name,
+        dst_block.name,
+        transfer_chain,
     )
 
-    # Helper function to determine if a component runs on a GPU
-    def is_gpu(comp, res):
-        # Check hardware field
-        if res and getattr(res, "hardware", "").lower() == "gpu":
-            return True
-        # Check parent container type
-        parent = comp.parentItem() if hasattr(comp, "parentItem") else None
-        if parent and isinstance(parent, GPUBox):
-            return True
-        # Check if the parent name contains 'gpu' (case insensitive)
-        if (
-            parent
-            and hasattr(parent, "name")
-            and parent.name
-            and "gpu" in parent.name.lower()
-        ):
-            return True
-        # Special handling for AMD MI series which are GPUs
-        if (
-            parent
-            and hasattr(parent, "name")
-            and parent.name
-            and "mi" in parent.name.lower()
-            and "amd" in parent.name.lower()
-        ):
-            return True
-        return False
-
-    # Helper to get parent ComputeBox - returns None if not found
-    def get_compute_box(comp):
-        parent = comp.parentItem() if hasattr(comp, "parentItem") else None
-        if parent and isinstance(parent, ComputeBox):
-            return parent
-        if parent and isinstance(parent, GPUBox):
-            grandparent = parent.parentItem() if hasattr(parent, "parentItem") else None
-            if grandparent and isinstance(grandparent, ComputeBox):
-                return grandparent
-        return None
-
-    # --- NEW: Robust boundary intersection ---
-    def find_boundary_intersection(start_pos, end_pos, container):
-        """Return the intersection point of the line (start_pos, end_pos) with the container's bounding rect, or None."""
-        if not container:
-            return None
-        rect = container.mapToScene(container.boundingRect()).boundingRect()
-        line = QLineF(start_pos, end_pos)
-        candidates = []
-        # Top
-        top = QLineF(rect.topLeft(), rect.topRight())
-        pt = QPointF()
-        if line.intersect(top, pt) == QLineF.BoundedIntersection:
-            candidates.append(QPointF(pt))
-        # Right
-        right = QLineF(rect.topRight(), rect.bottomRight())
-        pt = QPointF()
-        if line.intersect(right, pt) == QLineF.BoundedIntersection:
-            candidates.append(QPointF(pt))
-        # Bottom
-        bottom = QLineF(rect.bottomLeft(), rect.bottomRight())
-        pt = QPointF()
-        if line.intersect(bottom, pt) == QLineF.BoundedIntersection:
-            candidates.append(QPointF(pt))
-        # Left
-        left = QLineF(rect.topLeft(), rect.bottomLeft())
-        pt = QPointF()
-        if line.intersect(left, pt) == QLineF.BoundedIntersection:
-            candidates.append(QPointF(pt))
-        if not candidates:
-            return None
-        # Return the intersection closest to end_pos (for outgoing), or start_pos (for incoming)
-        return min(candidates, key=lambda p: QLineF(p, end_pos).length())
-
-    # --- NEW: Minimal indicator position logic ---
-    def calculate_indicator_position(point, line, indicator_type):
-        """Return the position for the indicator: exactly at the point, or fallback along the line."""
-        # No offset by default; can add a small offset if needed for clarity
-        return QPointF(point)
-
     # Get connection endpoints in scene coordinates
     start_pos = connection.start_port.get_scene_position()
     end_pos = connection.end_port.get_scene_position()
@@ -157,79 +251,87 @@ def update_connection_indicators(scene, connection):
     dst_is_gpu_container = isinstance(dst_parent, GPUBox)
 
     # Determine component types and locations
-    src_is_gpu = is_gpu(src_block, src_compute)
-    dst_is_gpu = is_gpu(dst_block, dst_compute)
-    src_compute_box = get_compute_box(src_block)
-    dst_compute_box = get_compute_box(dst_block)
+    src_is_gpu = _runs_on_gpu(src_block, src_compute)
+    dst_is_gpu = _runs_on_gpu(dst_block, dst_compute)
+    src_compute_box = _get_compute_box(src_block)
+    dst_compute_box = _get_compute_box(dst_block)
     different_computers = (
         src_compute_box and dst_compute_box and src_compute_box != dst_compute_box
     )
 
-    # Log containers with their actual types
-    src_container_name = getattr(src_parent, "name", "None") if src_parent else "None"
-    dst_container_name = getattr(dst_parent, "name", "None") if dst_parent else "None"
-    src_container_type = "GPU" if src_is_gpu_container else "CPU"
-    dst_container_type = "GPU" if dst_is_gpu_container else "CPU"
-    logger.debug(
-        f"Connection container path: {src_container_name}({src_container_type}) → {dst_container_name}({dst_container_type})"
-    )
-
     # Check if source is a camera component
     is_camera_connection = src_block.component_type == ComponentType.CAMERA
-    if is_camera_connection:
-        logger.debug(f"Camera connection detected: {src_block.name} → {dst_block.name}")
-
     # Check if destination is a DM component (new special case)
     is_dm_connection = dst_block.component_type == ComponentType.DM
+
+    logger.debug(
+        "Connection container path: %s(%s) → %s(%s)",
+        getattr(src_parent, "name", "None") if src_parent else "None",
+        "GPU" if src_is_gpu_container else "CPU",
+        getattr(dst_parent, "name", "None") if dst_parent else "None",
+        "GPU" if dst_is_gpu_container else "CPU",
+    )
+    if is_camera_connection:
+        logger.debug(
+            "Camera connection detected: %s → %s", src_block.name, dst_block.name
+        )
     if is_dm_connection:
-        logger.debug(f"DM connection detected: {src_block.name} → {dst_block.name}")
+        logger.debug("DM connection detected: %s → %s", src_block.name, dst_block.name)
 
     # Create appropriate transfer indicators based on the container types and component types
     transfer_indicators = []
 
-    # SPECIAL CASE: Always add Network indicator for DM components receiving from any compute
-    if is_dm_connection and src_parent:
-        logger.debug("Adding Network transfer indicator for connection to DM")
-
-        # Find intersection with source compute box boundary
-        src_compute_boundary = None
-
-        # First try to find the compute box
-        if src_compute_box:
-            src_compute_boundary = find_boundary_intersection(
-                start_pos, end_pos, src_compute_box
-            )
-
-        # Place on the compute box boundary if found
-        if src_compute_boundary:
+    def _append(kind, point):
+        """Queue an indicator at a point rounded to whole pixels."""
+        transfer_indicators.append((kind, QPointF(round(point.x()), round(point.y()))))
+
+    def _place(kind, a, b, container, fallback):
+        """
+        Queue an indicator where the segment a -> b crosses the container's edge,
+        or at the given fraction along the connection if it doesn't cross.
+        """
+        point = find_boundary_intersection(a, b, container)
+        if point is None:
+            point = connection_line.pointAt(fallback)
             logger.debug(
-                f"Network transfer indicator added for DM at source compute box boundary: {src_compute_boundary.x():.1f}, {src_compute_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                src_compute_boundary, connection_line, "Network"
+                "%s indicator placed %.2f along the connection: %.1f, %.1f",
+                kind,
+                fallback,
+                point.x(),
+                point.y(),
             )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
         else:
-            # If no intersection found, place indicator at 2/3 along the connection line
-            point = connection_line.pointAt(2 / 3)
             logger.debug(
-                f"Placing Network indicator along line for DM connection at {point.x():.1f}, {point.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-
-            # Use the helper function for better positioning
-            indicator_pos = calculate_indicator_position(
-                point, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
+                "%s indicator placed on %s boundary: %.1f, %.1f",
+                kind,
+                getattr(container, "name", "container"),
+                point.x(),
+                point.y(),
+            )
+        _append(kind, point)
+
+    def _place_network(fallback):
+        """
+        Queue a Network indicator between two computers: midway between their
+        boundary crossings, on whichever crossing exists, or at the fallback.
+        """
+        src_boundary = find_boundary_intersection(start_pos, end_pos, src_compute_box)
+        dst_boundary = find_boundary_intersection(end_pos, start_pos, dst_compute_box)
+        if src_boundary is not None and dst_boundary is not None:
+            point = (src_boundary + dst_boundary) / 2
+        elif src_boundary is not None:
+            point = src_boundary
+        elif dst_boundary is not None:
+            point = dst_boundary
+        else:
+            point = connection_line.pointAt(fallback)
+        logger.debug("Network indicator placed at %.1f, %.1f", point.x(), point.y())
+        _append("Network", point)
 
-        # If source is GPU, also add PCIe indicator
-        src_is_gpu_container = isinstance(src_parent, GPUBox)
+    # SPECIAL CASE: Always add Network indicator for DM components receiving from any compute
+    if is_dm_connection and src_parent:
+        logger.debug("Adding Network transfer indicator for connection to DM")
+        _place("Network", start_pos, end_pos, src_compute_box, 2 / 3)
 
         # More robust check for GPU source
         is_source_gpu = src_is_gpu or src_is_gpu_container
@@ -246,77 +348,24 @@ def update_connection_indicators(scene, connection):
             ):
                 is_source_gpu = True
                 logger.debug(
-                    f"Detected GPU source from container name: {src_parent.name}"
+                    "Detected GPU source from container name: %s", src_parent.name
                 )
 
         # Explicitly log GPU detection status
         logger.debug(
-            f"Source GPU detection: src_is_gpu={src_is_gpu}, src_is_gpu_container={src_is_gpu_container}, final determination={is_source_gpu}"
+            "Source GPU detection: src_is_gpu=%s, src_is_gpu_container=%s, final determination=%s",
+            src_is_gpu,
+            src_is_gpu_container,
+            is_source_gpu,
         )
 
         if is_source_gpu:
-            logger.debug(
-                f"Adding PCIe indicator for GPU source to DM connection: {src_block.name}"
-            )
-            # First try to find GPU container
-            gpu_container = None
-            if isinstance(src_parent, GPUBox):
-                gpu_container = src_parent
-                logger.debug(
-                    f"Found GPU container: {gpu_container.name if hasattr(gpu_container, 'name') else 'unnamed'}"
-                )
-
-            # If we found a GPU container, place at its boundary
-            if gpu_container:
-                gpu_boundary = find_boundary_intersection(
-                    start_pos, end_pos, gpu_container
-                )
-                if gpu_boundary:
-                    logger.debug(
-                        f"PCIe transfer indicator added for GPU->DM at GPU boundary: {gpu_boundary.x():.1f}, {gpu_boundary.y():.1f}"
-                    )
-                    indicator = TransferIndicator("PCIe")
-                    indicator_pos = calculate_indicator_position(
-                        gpu_boundary, connection_line, "PCIe"
-                    )
-                    indicator.setPos(indicator_pos)
-                    indicator.set_connection(connection)
-                    transfer_indicators.append(indicator)
-                else:
-                    # Fallback: place PCIe indicator at 1/3 along the connection line
-                    point = connection_line.pointAt(1 / 3)
-                    logger.debug(
-                        f"Placing PCIe indicator along line for GPU->DM (no boundary) at {point.x():.1f}, {point.y():.1f}"
-                    )
-                    indicator = TransferIndicator("PCIe")
-
-                    # Use the helper function for better positioning
-                    indicator_pos = calculate_indicator_position(
-                        point, connection_line, "PCIe"
-                    )
-                    indicator.setPos(indicator_pos)
-                    indicator.set_connection(connection)
-                    transfer_indicators.append(indicator)
-            else:
-                # No GPU container found, but source is a GPU resource
-                # Place at 1/3 along the connection line
-                point = connection_line.pointAt(1 / 3)
-                logger.debug(
-                    f"Placing PCIe indicator along line for GPU->DM (no GPU container) at {point.x():.1f}, {point.y():.1f}"
-                )
-                indicator = TransferIndicator("PCIe")
-
-                # Use the helper function for better positioning
-                indicator_pos = calculate_indicator_position(
-                    point, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-                logger.debug("Added PCIe indicator for GPU source without container")
+            # Place at the GPU box boundary, or 1/3 along the line without one
+            gpu_container = src_parent if src_is_gpu_container else None
+            _place("PCIe", start_pos, end_pos, gpu_container, 1 / 3)
         else:
             logger.debug(
-                f"No PCIe indicator needed - source is not GPU: {src_block.name}"
+                "No PCIe indicator needed - source is not GPU: %s", src_block.name
             )
 
     # SPECIAL CASE: Always add Network indicator for camera components connecting to any compute
@@ -324,47 +373,7 @@ def update_connection_indicators(scene, connection):
         logger.debug(
             "Adding Network transfer indicator for camera connection to compute"
         )
-
-        # Find intersection with destination compute box boundary
-        dst_compute_boundary = None
-
-        # First try to find the compute box itself
-        if dst_compute_box:
-            dst_compute_boundary = find_boundary_intersection(
-                start_pos, end_pos, dst_compute_box
-            )
-
-        # Place on the compute box boundary if found
-        if dst_compute_boundary:
-            logger.debug(
-                f"Network transfer indicator added for camera at destination compute box boundary: {dst_compute_boundary.x():.1f}, {dst_compute_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                dst_compute_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        else:
-            # If no intersection found, place indicator at 1/3 along the connection line - offset from connection
-            point = connection_line.pointAt(1 / 3)
-            logger.debug(
-                f"Placing Network indicator along line for camera connection at {point.x():.1f}, {point.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-
-            # Use the helper function for better positioning
-            indicator_pos = calculate_indicator_position(
-                point, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-
-        # If destination is GPU, also add PCIe indicator
-        # FIXED: Enhanced GPU detection for destination to check multiple conditions
-        dst_is_gpu_container = isinstance(dst_parent, GPUBox)
+        _place("Network", start_pos, end_pos, dst_compute_box, 1 / 3)
 
         # More robust check for GPU destination - check all possible ways it could be a GPU
         is_dest_gpu = dst_is_gpu or dst_is_gpu_container
@@ -381,530 +390,74 @@ def update_connection_indicators(scene, connection):
             ):
                 is_dest_gpu = True
                 logger.debug(
-                    f"Detected GPU destination from container name: {dst_parent.name}"
+                    "Detected GPU destination from container name: %s", dst_parent.name
                 )
 
         # Explicitly log GPU detection status
         logger.debug(
-            f"Destination GPU detection: dst_is_gpu={dst_is_gpu}, dst_is_gpu_container={dst_is_gpu_container}, final determination={is_dest_gpu}"
+            "Destination GPU detection: dst_is_gpu=%s, dst_is_gpu_container=%s, final determination=%s",
+            dst_is_gpu,
+            dst_is_gpu_container,
+            is_dest_gpu,
         )
 
         if is_dest_gpu:
-            logger.debug(
-                f"Adding PCIe indicator for camera connection to GPU destination: {dst_block.name}"
-            )
             # First try to find GPU container
             gpu_container = None
-            if isinstance(dst_parent, GPUBox):
+            if dst_is_gpu_container:
                 gpu_container = dst_parent
-                logger.debug(
-                    f"Found GPU container: {gpu_container.name if hasattr(gpu_container, 'name') else 'unnamed'}"
-                )
 
             # Check for nested GPU (component inside GPUBox inside ComputeBox)
-            elif dst_compute_box and any(
-                isinstance(child, GPUBox) for child in dst_compute_box.childItems()
-            ):
+            elif dst_compute_box:
                 for child in dst_compute_box.childItems():
-                    if isinstance(child, GPUBox):
-                        if dst_block in child.childItems():
-                            gpu_container = child
-                            logger.debug(
-                                f"Found nested GPU container: {gpu_container.name if hasattr(gpu_container, 'name') else 'unnamed'}"
-                            )
-                            break
-
-            # If we found a GPU container, place at its boundary
-            if gpu_container:
-                gpu_boundary = find_boundary_intersection(
-                    end_pos, start_pos, gpu_container
-                )
-                if gpu_boundary:
-                    logger.debug(
-                        f"PCIe transfer indicator added for camera->GPU at GPU boundary: {gpu_boundary.x():.1f}, {gpu_boundary.y():.1f}"
-                    )
-                    indicator = TransferIndicator("PCIe")
-                    indicator_pos = calculate_indicator_position(
-                        gpu_boundary, connection_line, "PCIe"
-                    )
-                    indicator.setPos(indicator_pos)
-                    indicator.set_connection(connection)
-                    transfer_indicators.append(indicator)
-                else:
-                    # Fallback: place PCIe indicator at 2/3 along the connection line
-                    point = connection_line.pointAt(2 / 3)
-                    logger.debug(
-                        f"Placing PCIe indicator along line for camera->GPU (no boundary) at {point.x():.1f}, {point.y():.1f}"
-                    )
-                    indicator = TransferIndicator("PCIe")
-
-                    # Use the helper function for better positioning
-                    indicator_pos = calculate_indicator_position(
-                        point, connection_line, "PCIe"
-                    )
-                    indicator.setPos(indicator_pos)
-                    indicator.set_connection(connection)
-                    transfer_indicators.append(indicator)
-            else:
-                # IMPROVED FALLBACK: No GPU container found, but destination is a GPU resource
-                # Place at 2/3 along the connection line with prominent offset to make it visible
-                point = connection_line.pointAt(2 / 3)
-                logger.debug(
-                    f"Placing PCIe indicator along line for camera->GPU (no GPU container) at {point.x():.1f}, {point.y():.1f}"
-                )
-                indicator = TransferIndicator("PCIe")
+                    if isinstance(child, GPUBox) and dst_block in child.childItems():
+                        gpu_container = child
+                        break
 
-                # Use the helper function for better positioning
-                indicator_pos = calculate_indicator_position(
-                    point, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-                logger.debug(
-                    "Added PCIe indicator for GPU destination without container"
-                )
+            # Place at the GPU box boundary, or 2/3 along the line without one
+            _place("PCIe", end_pos, start_pos, gpu_container, 2 / 3)
         else:
             logger.debug(
-                f"No PCIe indicator needed - destination is not GPU: {dst_block.name}"
+                "No PCIe indicator needed - destination is not GPU: %s",
+                dst_block.name,
             )
 
     # GPU → GPU (different computers)
     elif src_is_gpu and dst_is_gpu and different_computers:
         # Chain: PCIe (GPU1→host) → Network (host1→host2) → PCIe (host2→GPU2)
-
-        # 1. PCIe from GPU1 to host1
         if src_is_gpu_container:
-            # Find the exact boundary intersection with the GPU box
-            src_gpu_boundary = find_boundary_intersection(
-                start_pos, end_pos, src_parent
-            )
-            if src_gpu_boundary:
-                logger.debug(
-                    f"PCIe transfer indicator added at source GPU boundary: {src_gpu_boundary.x():.1f}, {src_gpu_boundary.y():.1f}"
-                )
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    src_gpu_boundary, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-            else:
-                # Fallback: place at 1/6 along the line
-                point = connection_line.pointAt(1 / 6)
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    point, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-
-        # 2. Network from host1 to host2
-        # Find boundaries of both compute boxes
-        src_comp_boundary = find_boundary_intersection(
-            start_pos, end_pos, src_compute_box
-        )
-        dst_comp_boundary = find_boundary_intersection(
-            end_pos, start_pos, dst_compute_box
-        )
-
-        # Place network indicator at either boundary intersection or midpoint
-        if src_comp_boundary and dst_comp_boundary:
-            # Place at midpoint between the two computer boundaries
-            midpoint = QPointF(
-                (src_comp_boundary.x() + dst_comp_boundary.x()) / 2,
-                (src_comp_boundary.y() + dst_comp_boundary.y()) / 2,
-            )
-            logger.debug(
-                f"Network transfer indicator added at midpoint between compute boxes: {midpoint.x():.1f}, {midpoint.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                midpoint, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        elif src_comp_boundary:
-            # Place at source compute box boundary
-            logger.debug(
-                f"Network transfer indicator added at source compute boundary: {src_comp_boundary.x():.1f}, {src_comp_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                src_comp_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        elif dst_comp_boundary:
-            # Place at destination compute box boundary
-            logger.debug(
-                f"Network transfer indicator added at destination compute boundary: {dst_comp_boundary.x():.1f}, {dst_comp_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                dst_comp_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        else:
-            # Fallback: place at 1/2 along the line
-            point = connection_line.pointAt(0.5)
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                point, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-
-        # 3. PCIe from host2 to GPU2
+            _place("PCIe", start_pos, end_pos, src_parent, 1 / 6)
+        _place_network(0.5)
         if dst_is_gpu_container:
-            dst_gpu_boundary = find_boundary_intersection(
-                end_pos, start_pos, dst_parent
-            )
-            if dst_gpu_boundary:
-                logger.debug(
-                    f"PCIe transfer indicator added at dest GPU boundary: {dst_gpu_boundary.x():.1f}, {dst_gpu_boundary.y():.1f}"
-                )
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    dst_gpu_boundary, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-            else:
-                # Fallback: place at 5/6 along the line
-                point = connection_line.pointAt(5 / 6)
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    point, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
+            _place("PCIe", end_pos, start_pos, dst_parent, 5 / 6)
 
     # GPU → CPU (different computers)
     elif src_is_gpu and not dst_is_gpu and different_computers:
         # Chain: PCIe (GPU→host) → Network (host→host)
-
-        # 1. PCIe from GPU to host
         if src_is_gpu_container:
-            src_gpu_boundary = find_boundary_intersection(
-                start_pos, end_pos, src_parent
-            )
-            if src_gpu_boundary:
-                logger.debug(
-                    f"PCIe transfer indicator added at source GPU boundary: {src_gpu_boundary.x():.1f}, {src_gpu_boundary.y():.1f}"
-                )
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    src_gpu_boundary, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-            else:
-                # Fallback: place at 1/3 along the line
-                point = connection_line.pointAt(1 / 3)
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    point, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-
-        # 2. Network from host1 to host2
-        # Find intersection with compute box boundaries
-        src_comp_boundary = find_boundary_intersection(
-            start_pos, end_pos, src_compute_box
-        )
-        dst_comp_boundary = find_boundary_intersection(
-            end_pos, start_pos, dst_compute_box
-        )
-
-        # Place network indicator at either boundary intersection or midpoint
-        if src_comp_boundary and dst_comp_boundary:
-            # Place at midpoint between the two computer boundaries
-            midpoint = QPointF(
-                (src_comp_boundary.x() + dst_comp_boundary.x()) / 2,
-                (src_comp_boundary.y() + dst_comp_boundary.y()) / 2,
-            )
-            logger.debug(
-                f"Network transfer indicator added at midpoint between compute boxes: {midpoint.x():.1f}, {midpoint.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                midpoint, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        elif src_comp_boundary:
-            # Place at source compute box boundary
-            logger.debug(
-                f"Network transfer indicator added at source compute boundary: {src_comp_boundary.x():.1f}, {src_comp_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                src_comp_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        elif dst_comp_boundary:
-            # Place at destination compute box boundary
-            logger.debug(
-                f"Network transfer indicator added at destination compute boundary: {dst_comp_boundary.x():.1f}, {dst_comp_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                dst_comp_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        else:
-            # Fallback: place at 2/3 along the line
-            point = connection_line.pointAt(2 / 3)
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                point, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
+            _place("PCIe", start_pos, end_pos, src_parent, 1 / 3)
+        _place_network(2 / 3)
 
     # CPU → GPU (different computers)
     elif not src_is_gpu and dst_is_gpu and different_computers:
         # Chain: Network (host→host) → PCIe (host→GPU)
-
-        # 1. Network from host1 to host2
-        src_comp_boundary = find_boundary_intersection(
-            start_pos, end_pos, src_compute_box
-        )
-        dst_comp_boundary = find_boundary_intersection(
-            end_pos, start_pos, dst_compute_box
-        )
-
-        # Place network indicator at either boundary intersection or midpoint
-        if src_comp_boundary and dst_comp_boundary:
-            # Place at midpoint between the two computer boundaries
-            midpoint = QPointF(
-                (src_comp_boundary.x() + dst_comp_boundary.x()) / 2,
-                (src_comp_boundary.y() + dst_comp_boundary.y()) / 2,
-            )
-            logger.debug(
-                f"Network transfer indicator added at midpoint between compute boxes: {midpoint.x():.1f}, {midpoint.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                midpoint, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        elif src_comp_boundary:
-            # Place at source compute box boundary
-            logger.debug(
-                f"Network transfer indicator added at source compute boundary: {src_comp_boundary.x():.1f}, {src_comp_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                src_comp_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        elif dst_comp_boundary:
-            # Place at destination compute box boundary
-            logger.debug(
-                f"Network transfer indicator added at destination compute boundary: {dst_comp_boundary.x():.1f}, {dst_comp_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                dst_comp_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        else:
-            # Fallback: place at 1/3 along the line
-            point = connection_line.pointAt(1 / 3)
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                point, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-
-        # 2. PCIe from host2 to GPU
+        _place_network(1 / 3)
         if dst_is_gpu_container:
-            dst_gpu_boundary = find_boundary_intersection(
-                end_pos, start_pos, dst_parent
-            )
-            if dst_gpu_boundary:
-                logger.debug(
-                    f"PCIe transfer indicator added at dest GPU boundary: {dst_gpu_boundary.x():.1f}, {dst_gpu_boundary.y():.1f}"
-                )
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    dst_gpu_boundary, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-            else:
-                # Fallback: place at 2/3 along the line
-                point = connection_line.pointAt(2 / 3)
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    point, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
+            _place("PCIe", end_pos, start_pos, dst_parent, 2 / 3)
 
     # CPU → CPU (different computers)
     elif not src_is_gpu and not dst_is_gpu and different_computers:
         # Chain: Network (host→host)
-        src_comp_boundary = find_boundary_intersection(
-            start_pos, end_pos, src_compute_box
-        )
-        dst_comp_boundary = find_boundary_intersection(
-            end_pos, start_pos, dst_compute_box
-        )
-
-        # Place network indicator at either boundary intersection or midpoint
-        if src_comp_boundary and dst_comp_boundary:
-            # Place at midpoint between the two computer boundaries
-            midpoint = QPointF(
-                (src_comp_boundary.x() + dst_comp_boundary.x()) / 2,
-                (src_comp_boundary.y() + dst_comp_boundary.y()) / 2,
-            )
-            logger.debug(
-                f"Network transfer indicator added at midpoint between compute boxes: {midpoint.x():.1f}, {midpoint.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                midpoint, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        elif src_comp_boundary:
-            # Place at source compute box boundary
-            logger.debug(
-                f"Network transfer indicator added at source compute boundary: {src_comp_boundary.x():.1f}, {src_comp_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                src_comp_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        elif dst_comp_boundary:
-            # Place at destination compute box boundary
-            logger.debug(
-                f"Network transfer indicator added at destination compute boundary: {dst_comp_boundary.x():.1f}, {dst_comp_boundary.y():.1f}"
-            )
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                dst_comp_boundary, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
-        else:
-            # Fallback: place at midpoint of the line
-            point = connection_line.pointAt(0.5)
-            indicator = TransferIndicator("Network")
-            indicator_pos = calculate_indicator_position(
-                point, connection_line, "Network"
-            )
-            indicator.setPos(indicator_pos)
-            indicator.set_connection(connection)
-            transfer_indicators.append(indicator)
+        _place_network(0.5)
 
     # CPU ↔ GPU (same computer) - Check based on container types
-    elif (src_is_gpu_container and not dst_is_gpu_container) or (
-        not src_is_gpu_container and dst_is_gpu_container
-    ):
-
+    elif src_is_gpu_container != dst_is_gpu_container:
         logger.debug("Adding PCIe transfer indicator for CPU-GPU container connection")
-
-        # Find GPU container
-        gpu_container = src_parent if src_is_gpu_container else dst_parent
-
-        # Find intersection with GPU container boundary
-        if gpu_container:
-            # Determine which direction we're going
-            start = start_pos if src_is_gpu_container else end_pos
-            end = end_pos if src_is_gpu_container else start_pos
-
-            # Get the intersection point with the GPU box boundary
-            gpu_boundary = find_boundary_intersection(start, end, gpu_container)
-            if gpu_boundary:
-                logger.debug(
-                    f"PCIe transfer indicator added at GPU box boundary: {gpu_boundary.x():.1f}, {gpu_boundary.y():.1f}"
-                )
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    gpu_boundary, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-            else:
-                # Fallback: place at midpoint of the line
-                point = connection_line.pointAt(0.5)
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    point, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
-                logger.debug(
-                    "Failed to find GPU boundary intersection, placed PCIe at midpoint instead"
-                )
+        # Cross the GPU box boundary going outwards from the GPU side
+        if src_is_gpu_container:
+            _place("PCIe", start_pos, end_pos, src_parent, 0.5)
         else:
-            # Traditional CPU-GPU transfer based on hardware type
-            if (
-                src_compute
-                and dst_compute
-                and (
-                    (
-                        getattr(src_compute, "hardware", "CPU") == "CPU"
-                        and getattr(dst_compute, "hardware", "CPU") == "GPU"
-                    )
-                    or (
-                        getattr(src_compute, "hardware", "CPU") == "GPU"
-                        and getattr(dst_compute, "hardware", "CPU") == "CPU"
-                    )
-                )
-            ):
-
-                # No container found, place at midpoint
-                logger.debug(
-                    "Adding PCIe transfer indicator at midpoint (no containers)"
-                )
-                point = connection_line.pointAt(0.5)
-                indicator = TransferIndicator("PCIe")
-                indicator_pos = calculate_indicator_position(
-                    point, connection_line, "PCIe"
-                )
-                indicator.setPos(indicator_pos)
-                indicator.set_connection(connection)
-                transfer_indicators.append(indicator)
+            _place("PCIe", end_pos, start_pos, dst_parent, 0.5)
 
     # GPU -> GPU on same GPU (add a GPU-Local indicator)
     elif (
@@ -916,27 +469,17 @@ def update_connection_indicators(scene, connection):
         logger.debug(
             "Adding GPU-Local transfer indicator for GPU-to-GPU connection on same GPU"
         )
-
-        # Place at midpoint of the line
-        point = connection_line.pointAt(0.5)
-        indicator = TransferIndicator("GPU-Local")
-        indicator_pos = calculate_indicator_position(
-            point, connection_line, "GPU-Local"
-        )
-        indicator.setPos(indicator_pos)
-        indicator.set_connection(connection)
-        transfer_indicators.append(indicator)
+        _place("GPU-Local", start_pos, end_pos, None, 0.5)
 
     # Local CPU-to-CPU on same computer - no indicator needed
     elif not transfer_chain or (
         len(transfer_chain) == 1 and transfer_chain[0] == "Local"
     ):
         logger.debug(
-            f"No transfer indicator needed for local RAM transfer between {src_block.name} and {dst_block.name}"
+            "No transfer indicator needed for local RAM transfer between %s and %s",
+            src_block.name,
+            dst_block.name,
         )
-        return
+        return []
 
-    # Add all the indicators to the scene
-    for indicator in transfer_indicators:
-        scene.addItem(indicator)
-        logger.debug(f"Added {indicator.transfer_type} indicator to scene")
+    return transfer_indicators
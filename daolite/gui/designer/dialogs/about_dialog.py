@@ -6,6 +6,7 @@ This module provides a styled about dialog with information about the applicatio
 
 import importlib.metadata
 import os
+from functools import lru_cache
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import (
@@ -20,6 +21,77 @@ from PyQt5.QtWidgets import (
 
 from ..style_utils import set_app_style
 
+# Static tab contents, built once at import rather than on every dialog open
+_DESCRIPTION_HTML = """
+            <p>A visual tool for designing Adaptive Optics pipelines with emphasis on 
+            network and multi-compute node configurations.</p>
+            
+            <p>Part of the daolite package for estimating latency in 
+            Adaptive Optics Real-time Control Systems.</p>
+            
+            <p><b>Features:</b></p>
+            <ul>
+                <li>Visual pipeline design</li>
+                <li>Component parameter configuration</li>
+                <li>CPU and GPU resource management</li>
+                <li>Latency estimation</li>
+                <li>Code generation</li>
+                <li>JSON import/export</li>
+            </ul>
+        """
+
+_DOCUMENTATION_HTML = """
+            <h2>Documentation</h2>
+            
+            <p><b>Online Documentation:</b> 
+            <a href="https://daolite.readthedocs.io">https://daolite.readthedocs.io</a></p>
+            
+            <p><b>GitHub Wiki:</b>
+            <a href="https://github.com/davetbarr/daolite/wiki">https://github.com/davetbarr/daolite/wiki</a></p>
+            
+            <h3>Local Documentation</h3>
+            <p>You can generate local documentation by running:</p>
+            <pre>cd docs && make html</pre>
+            <p>Then open <code>docs/build/html/index.html</code> in your browser.</p>
+        """
+
+_CITATION_HTML = """
+            <h2>How to Cite</h2>
+            
+            <p>If you use daolite in your research, please cite it as follows:</p>
+            
+            <pre>
+Barr, D. (2023). daolite: A Python package for estimating latency 
+in Adaptive Optics Real-time Control Systems. 
+GitHub: https://github.com/davetbarr/daolite
+            </pre>
+            
+            <h3>BibTeX</h3>
+            <pre>
+@software{daolite,
+  author = {Barr, David},
+  title = {daolite: A Python package for estimating latency in Adaptive Optics Real-time Control Systems},
+  year = {2023},
+  url = {https://github.com/davetbarr/daolite}
+}
+            </pre>
+        """
+
+
+@lru_cache(maxsize=None)
+def _read_project_file(filename):
+    """Return the contents of a file in the project root, or None if unreadable."""
+    try:
+        root_dir = os.path.dirname(
+            os.path.dirname(
+                os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            )
+        )
+        with open(os.path.join(root_dir, filename), "r") as f:
+            return f.read()
+    except Exception:
+        return None
+
 
 class AboutDialog(QDialog):
     """
@@ -89,25 +161,7 @@ class AboutDialog(QDialog):
         description = QTextBrowser()
         description.setReadOnly(True)
         description.setOpenExternalLinks(True)
-        description.setHtml(
-            """
-            <p>A visual tool for designing Adaptive Optics pipelines with emphasis on 
-            network and multi-compute node configurations.</p>
-            
-            <p>Part of the daolite package for estimating latency in 
-            Adaptive Optics Real-time Control Systems.</p>
-            
-            <p><b>Features:</b></p>
-            <ul>
-                <li>Visual pipeline design</li>
-                <li>Component parameter configuration</li>
-                <li>CPU and GPU resource management</li>
-                <li>Latency estimation</li>
-                <li>Code generation</li>
-                <li>JSON import/export</li>
-            </ul>
-        """
-        )
+        description.setHtml(_DESCRIPTION_HTML)
         about_layout.addWidget(description)
 
         tab_widget.addTab(about_widget, "About")
@@ -149,22 +203,7 @@ class AboutDialog(QDialog):
         doc_links = QTextBrowser()
         doc_links.setReadOnly(True)
         doc_links.setOpenExternalLinks(True)
-        doc_links.setHtml(
-            """
-            <h2>Documentation</h2>
-            
-            <p><b>Online Documentation:</b> 
-            <a href="https://daolite.readthedocs.io">https://daolite.readthedocs.io</a></p>
-            
-            <p><b>GitHub Wiki:</b>
-            <a href="https://github.com/davetbarr/daolite/wiki">https://github.com/davetbarr/daolite/wiki</a></p>
-            
-            <h3>Local Documentation</h3>
-            <p>You can generate local documentation by running:</p>
-            <pre>cd docs && make html</pre>
-            <p>Then open <code>docs/build/html/index.html</code> in your browser.</p>
-        """
-        )
+        doc_links.setHtml(_DOCUMENTATION_HTML)
         doc_layout.addWidget(doc_links)
 
         tab_widget.addTab(doc_widget, "Documentation")
@@ -175,29 +214,7 @@ class AboutDialog(QDialog):
 
         citation_text = QTextBrowser()
         citation_text.setReadOnly(True)
-        citation_text.setHtml(
-            """
-            <h2>How to Cite</h2>
-            
-            <p>If you use daolite in your research, please cite it as follows:</p>
-            
-            <pre>
-Barr, D. (2023). daolite: A Python package for estimating latency 
-in Adaptive Optics Real-time Control Systems. 
-GitHub: https://github.com/davetbarr/daolite
-            </pre>
-            
-            <h3>BibTeX</h3>
-            <pre>
-@software{daolite,
-  author = {Barr, David},
-  title = {daolite: A Python package for estimating latency in Adaptive Optics Real-time Control Systems},
-  year = {2023},
-  url = {https://github.com/davetbarr/daolite}
-}
-            </pre>
-        """
-        )
+        citation_text.setHtml(_CITATION_HTML)
         citation_layout.addWidget(citation_text)
 
         tab_widget.addTab(citation_widget, "Citation")
@@ -209,22 +226,10 @@ GitHub: https://github.com/davetbarr/daolite
         license_text = QTextBrowser()
         license_text.setReadOnly(True)
 
-        # Try to read LICENSE file
-        license_content = "Please see the LICENSE file in the repository."
-        try:
-            # Attempt to find the LICENSE file
-            script_dir = os.path.dirname(
-                os.path.dirname(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-                )
-            )
-            license_path = os.path.join(script_dir, "LICENSE")
-
-            if os.path.exists(license_path):
-                with open(license_path, "r") as f:
-                    license_content = f.read()
-        except Exception:
-            pass
+        license_content = (
+            _read_project_file("LICENSE")
+            or "Please see the LICENSE file in the repository."
+        )
 
         license_text.setPlainText(license_content)
         license_layout.addWidget(license_text)
@@ -251,29 +256,15 @@ GitHub: https://github.com/davetbarr/daolite
         Returns:
             The extracted attribute value or the default value
         """
-        try:
-            # Try to find setup.py in parent directories
-            script_dir = os.path.dirname(
-                os.path.dirname(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-                )
-            )
-            setup_path = os.path.join(script_dir, "setup.py")
-
-            if os.path.exists(setup_path):
-                with open(setup_path, "r") as f:
-                    setup_content = f.read()
-
-                # Simple regex-free parser for setup attributes
-                for line in setup_content.split("\n"):
-                    line = line.strip()
-                    if line.startswith(f"{attr_name}=") or f"{attr_name} =" in line:
-                        value = line.split("=", 1)[1].strip()
-                        # Remove quotes and commas
-                        value = value.strip("\"'").rstrip(",").strip("\"'")
-                        return value
-
-        except Exception:
-            pass
+        setup_content = _read_project_file("setup.py")
+        if setup_content:
+            # Simple regex-free parser for setup attributes
+            for line in setup_content.split("\n"):
+                line = line.strip()
+                if line.startswith(f"{attr_name}=") or f"{attr_name} =" in line:
+                    value = line.split("=", 1)[1].strip()
+                    # Remove quotes and commas
+                    value = value.strip("\"'").rstrip(",").strip("\"'")
+                    return value
 
         return default_value
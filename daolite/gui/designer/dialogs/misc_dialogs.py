@@ -1,8 +1,11 @@
+import os
+
 from PyQt5.QtWidgets import (
     QDialog,
     QDialogButtonBox,
     QLabel,
     QLineEdit,
+    QMessageBox,
     QPushButton,
     QTextEdit,
     QVBoxLayout,
@@ -11,6 +14,20 @@ from PyQt5.QtWidgets import (
 from ..style_utils import set_app_style
 
 
+def show_file_message(parent, icon, title, text, path):
+    """
+    Show a message about a file, naming it by basename only.
+
+    The full path goes in the collapsed detailed text, so deep paths do not
+    stretch the message box.
+    """
+    box = QMessageBox(
+        icon, title, f"{text} {os.path.basename(path)}", QMessageBox.Ok, parent
+    )
+    box.setDetailedText(path)
+    return box.exec_()
+
+
 class ShortcutHelpDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -1,5 +1,13 @@
 import inspect
+from functools import lru_cache
 
+from PyQt5.QtCore import QLocale, Qt
+from PyQt5.QtGui import (
+    QDoubleValidator,
+    QIntValidator,
+    QStandardItem,
+    QStandardItemModel,
+)
 from PyQt5.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -14,19 +22,85 @@ from PyQt5.QtWidgets import (
 )
 
 import daolite.compute.hardware as hardware
-from daolite.compute import create_compute_resources
 
 from ..style_utils import set_app_style
 
 
+@lru_cache(maxsize=None)
+def _preset_factories(*prefixes):
+    """
+    Return (label, factory) pairs for the hardware presets with these prefixes.
+    The module scan runs once per prefix set and is shared by every dialog.
+    """
+    presets = []
+    for name, func in inspect.getmembers(hardware, inspect.isfunction):
+        if not name.startswith(prefixes):
+            continue
+        label = name.replace("_", " ").title()
+        try:
+            label = func().name or label
+        except Exception:
+            pass
+        presets.append((label, func))
+    return tuple(presets)
+
+
+def _make_combo(presets):
+    """
+    Build a combo box backed by a single model. Each preset carries its factory
+    as item data; the trailing "Custom…" entry carries None.
+    """
+    combo = QComboBox()
+    model = QStandardItemModel(combo)
+    for label, func in presets + (("Custom…", None),):
+        item = QStandardItem(label)
+        item.setData(func, Qt.UserRole)
+        model.appendRow(item)
+    combo.setModel(model)
+    combo.view().setUniformItemSizes(True)
+    return combo
+
+
+def _make_edit(default, kind):
+    """Build a line edit that only accepts input int()/float() can parse."""
+    edit = QLineEdit(default)
+    if kind is int:
+        validator = QIntValidator(1, 1_000_000, edit)
+    else:
+        validator = QDoubleValidator(0.0, 1e30, 6, edit)
+        validator.setNotation(QDoubleValidator.ScientificNotation)
+    # The C locale matches Python's number syntax ("2.6e9", not "2,6e9")
+    validator.setLocale(QLocale.c())
+    edit.setValidator(validator)
+    return edit
+
+
 class ResourceSelectionDialog(QDialog):
     """
     Dialog for selecting or configuring compute resources.
     Cleaned up: CPU dropdown (with custom), optional GPU (with custom),
     and only shows custom fields when needed.
     Now supports editing: pass existing_resource to pre-populate fields.
+    A single instance can be reused; reset() restores it between uses.
     """
 
+    # (attribute, label, default text, value type) for the custom CPU and GPU fields
+    _CPU_FIELDS = (
+        ("cores_edit", "Cores:", "16", int),
+        ("freq_edit", "Core Frequency (Hz):", "2.6e9", float),
+        ("flops_edit", "FLOPS per cycle:", "32", int),
+        ("mem_channels_edit", "Memory Channels:", "4", int),
+        ("mem_width_edit", "Memory Width (bits):", "64", int),
+        ("mem_freq_edit", "Memory Frequency (Hz):", "3200e6", float),
+        ("network_edit", "Network Speed (bps):", "100e9", float),
+    )
+    _GPU_FIELDS = (
+        ("gpu_flops_edit", "FLOPS:", "1e12", float),
+        ("gpu_mem_bw_edit", "Memory Bandwidth (B/s):", "300e9", float),
+        ("gpu_network_edit", "Network Speed (bps):", "100e9", float),
+        ("gpu_time_in_driver_edit", "Time in Driver (us):", "8", float),
+    )
+
     def __init__(self, parent=None, existing_resource=None):
         super().__init__(parent)
         self.setWindowTitle("Configure Computer Resource")
@@ -41,47 +115,12 @@ class ResourceSelectionDialog(QDialog):
         layout.addLayout(name_layout)
 
         # --- Dynamic CPU list ---
-        cpu_factories = [
-            (name, func)
-            for name, func in inspect.getmembers(hardware, inspect.isfunction)
-            if name.startswith("amd_") or name.startswith("intel_")
-        ]
-        self.cpu_names = []
-        self.cpu_funcs = []
-        for name, func in cpu_factories:
-            try:
-                res = func()
-                label = getattr(res, "name", name.replace("_", " ").title())
-            except Exception:
-                label = name.replace("_", " ").title()
-            self.cpu_names.append(label)
-            self.cpu_funcs.append(func)
-        self.cpu_names.append("Custom…")
         layout.addWidget(QLabel("CPU Model:"))
-        self.cpu_combo = QComboBox()
-        self.cpu_combo.addItems(self.cpu_names)
+        self.cpu_combo = _make_combo(_preset_factories("amd_", "intel_"))
         layout.addWidget(self.cpu_combo)
 
-        # Custom CPU fields (hidden by default)
-        self.cpu_custom_fields = QFormLayout()
-        self.cores_edit = QLineEdit("16")
-        self.cpu_custom_fields.addRow("Cores:", self.cores_edit)
-        self.freq_edit = QLineEdit("2.6e9")
-        self.cpu_custom_fields.addRow("Core Frequency (Hz):", self.freq_edit)
-        self.flops_edit = QLineEdit("32")
-        self.cpu_custom_fields.addRow("FLOPS per cycle:", self.flops_edit)
-        self.mem_channels_edit = QLineEdit("4")
-        self.cpu_custom_fields.addRow("Memory Channels:", self.mem_channels_edit)
-        self.mem_width_edit = QLineEdit("64")
-        self.cpu_custom_fields.addRow("Memory Width (bits):", self.mem_width_edit)
-        self.mem_freq_edit = QLineEdit("3200e6")
-        self.cpu_custom_fields.addRow("Memory Frequency (Hz):", self.mem_freq_edit)
-        self.network_edit = QLineEdit("100e9")
-        self.cpu_custom_fields.addRow("Network Speed (bps):", self.network_edit)
-        self.cpu_custom_fields_widget = QWidget()
-        self.cpu_custom_fields_widget.setLayout(self.cpu_custom_fields)
-        self.cpu_custom_fields_widget.setVisible(False)
-        layout.addWidget(self.cpu_custom_fields_widget)
+        # Custom CPU fields are built on first use
+        self.cpu_custom_fields_widget = None
         self.cpu_name_string = self.cpu_combo.currentText()
 
         # --- Add GPU checkbox ---
@@ -89,43 +128,12 @@ class ResourceSelectionDialog(QDialog):
         layout.addWidget(self.add_gpu_checkbox)
 
         # --- GPU dropdown (hidden by default) ---
-        gpu_factories = [
-            (name, func)
-            for name, func in inspect.getmembers(hardware, inspect.isfunction)
-            if name.startswith("nvidia_") or name.startswith("amd_mi")
-        ]
-        self.gpu_names = []
-        self.gpu_funcs = []
-        for name, func in gpu_factories:
-            try:
-                res = func()
-                label = getattr(res, "name", name.replace("_", " ").title())
-            except Exception:
-                label = name.replace("_", " ").title()
-            self.gpu_names.append(label)
-            self.gpu_funcs.append(func)
-        self.gpu_names.append("Custom…")
-        self.gpu_combo = QComboBox()
-        self.gpu_combo.addItems(self.gpu_names)
+        self.gpu_combo = _make_combo(_preset_factories("nvidia_", "amd_mi"))
         self.gpu_combo.setVisible(False)
         layout.addWidget(self.gpu_combo)
 
-        # Custom GPU fields (hidden by default)
-        self.gpu_custom_fields = QFormLayout()
-        self.gpu_flops_edit = QLineEdit("1e12")
-        self.gpu_custom_fields.addRow("FLOPS:", self.gpu_flops_edit)
-        self.gpu_mem_bw_edit = QLineEdit("300e9")
-        self.gpu_custom_fields.addRow("Memory Bandwidth (B/s):", self.gpu_mem_bw_edit)
-        self.gpu_network_edit = QLineEdit("100e9")
-        self.gpu_custom_fields.addRow("Network Speed (bps):", self.gpu_network_edit)
-        self.gpu_time_in_driver_edit = QLineEdit("8")
-        self.gpu_custom_fields.addRow(
-            "Time in Driver (us):", self.gpu_time_in_driver_edit
-        )
-        self.gpu_custom_fields_widget = QWidget()
-        self.gpu_custom_fields_widget.setLayout(self.gpu_custom_fields)
-        self.gpu_custom_fields_widget.setVisible(False)
-        layout.addWidget(self.gpu_custom_fields_widget)
+        # Custom GPU fields are built on first use
+        self.gpu_custom_fields_widget = None
 
         # --- Button row ---
         button_layout = QHBoxLayout()
@@ -144,27 +152,52 @@ class ResourceSelectionDialog(QDialog):
         self.add_gpu_checkbox.toggled.connect(self._on_add_gpu_toggled)
         self.gpu_combo.currentIndexChanged.connect(self._on_gpu_changed)
 
-        # State
+        # After all widgets are created, pre-populate if editing
+        self.reset(existing_resource)
+
+        # Apply styling after all UI elements and connections are created
+        set_app_style(self)
+
+    def reset(self, existing_resource=None):
+        """
+        Return the dialog to its initial state, pre-populated from
+        existing_resource when one is given.
+        """
         self.result_type = None
         self.result_index = None
+        self.name_edit.setText("Computer")
+        self.cpu_combo.setCurrentIndex(0)
+        self.add_gpu_checkbox.setChecked(False)
+        self.gpu_combo.setCurrentIndex(0)
+        self.cpu_name_string = self.cpu_combo.currentText()
+        self._set_custom_visible(
+            self._CPU_FIELDS,
+            self.cpu_combo,
+            "cpu",
+            self.cpu_combo.currentData() is None,
+        )
+        self._set_custom_visible(self._GPU_FIELDS, self.gpu_combo, "gpu", False)
+        for fields, widget in (
+            (self._CPU_FIELDS, self.cpu_custom_fields_widget),
+            (self._GPU_FIELDS, self.gpu_custom_fields_widget),
+        ):
+            if widget is not None:
+                for attr, _, default, _ in fields:
+                    getattr(self, attr).setText(default)
 
-        # After all widgets are created, pre-populate if editing
         if existing_resource is not None:
             # Set name
-            self.name_edit.setText(getattr(existing_resource, "name", "Computer"))
+            self.name_edit.setText(getattr(existing_resource, "name", "") or "Computer")
             # Try to match CPU in dropdown
-            cpu_name = getattr(existing_resource, "name", None)
-            cpu_idx = None
-            for i, label in enumerate(self.cpu_names):
-                if label == cpu_name:
-                    cpu_idx = i
-                    break
-            if cpu_idx is not None:
+            cpu_idx = self.cpu_combo.findText(
+                str(getattr(existing_resource, "name", ""))
+            )
+            if cpu_idx >= 0 and self.cpu_combo.itemData(cpu_idx) is not None:
                 self.cpu_combo.setCurrentIndex(cpu_idx)
             else:
                 # Custom CPU
-                self.cpu_combo.setCurrentIndex(len(self.cpu_names) - 1)
-                self.cpu_custom_fields_widget.setVisible(True)
+                self.cpu_combo.setCurrentIndex(self.cpu_combo.count() - 1)
+                self._set_custom_visible(self._CPU_FIELDS, self.cpu_combo, "cpu", True)
                 # Fill custom fields if present
                 self.cores_edit.setText(str(getattr(existing_resource, "cores", "16")))
                 self.freq_edit.setText(
@@ -191,18 +224,15 @@ class ResourceSelectionDialog(QDialog):
                 self.add_gpu_checkbox.setChecked(True)
                 self.gpu_combo.setVisible(True)
                 gpu = attached_gpus[0]
-                gpu_name = getattr(gpu, "name", None)
-                gpu_idx = None
-                for i, label in enumerate(self.gpu_names):
-                    if label == gpu_name:
-                        gpu_idx = i
-                        break
-                if gpu_idx is not None:
+                gpu_idx = self.gpu_combo.findText(str(getattr(gpu, "name", "")))
+                if gpu_idx >= 0 and self.gpu_combo.itemData(gpu_idx) is not None:
                     self.gpu_combo.setCurrentIndex(gpu_idx)
                 else:
                     # Custom GPU
-                    self.gpu_combo.setCurrentIndex(len(self.gpu_names) - 1)
-                    self.gpu_custom_fields_widget.setVisible(True)
+                    self.gpu_combo.setCurrentIndex(self.gpu_combo.count() - 1)
+                    self._set_custom_visible(
+                        self._GPU_FIELDS, self.gpu_combo, "gpu", True
+                    )
                     self.gpu_flops_edit.setText(str(getattr(gpu, "flops", "1e12")))
                     self.gpu_mem_bw_edit.setText(
                         str(getattr(gpu, "memory_bandwidth", "300e9"))
@@ -214,29 +244,87 @@ class ResourceSelectionDialog(QDialog):
                         str(getattr(gpu, "time_in_driver", "8"))
                     )
 
-        # Apply styling after all UI elements and connections are created
-        set_app_style(self)
+    def _ensure_custom_fields(self, fields, anchor_combo, attr_prefix):
+        """
+        Build a set of custom fields below anchor_combo the first time they are
+        needed, and store their widget as <attr_prefix>_custom_fields_widget.
+        """
+        widget_attr = f"{attr_prefix}_custom_fields_widget"
+        widget = getattr(self, widget_attr)
+        if widget is None:
+            form = QFormLayout()
+            for attr, label, default, kind in fields:
+                edit = _make_edit(default, kind)
+                edit.textChanged.connect(self._validate_custom)
+                setattr(self, attr, edit)
+                form.addRow(label, edit)
+            widget = QWidget()
+            widget.setLayout(form)
+            widget.setVisible(False)
+            layout = self.layout()
+            layout.insertWidget(layout.indexOf(anchor_combo) + 1, widget)
+            set_app_style(widget)
+            setattr(self, widget_attr, widget)
+        return widget
+
+    def _set_custom_visible(self, fields, anchor_combo, attr_prefix, visible):
+        if visible:
+            widget = self._ensure_custom_fields(fields, anchor_combo, attr_prefix)
+        else:
+            widget = getattr(self, f"{attr_prefix}_custom_fields_widget")
+        if widget is not None:
+            widget.setVisible(visible)
+        self._validate_custom()
+
+    def _validate_custom(self):
+        """Only allow accepting once every custom field in use holds a valid number."""
+        fields = ()
+        if self.cpu_combo.currentData() is None:
+            fields += self._CPU_FIELDS
+        if self.add_gpu_checkbox.isChecked() and self.gpu_combo.currentData() is None:
+            fields += self._GPU_FIELDS
+        self.add_btn.setEnabled(
+            all(
+                getattr(self, attr).hasAcceptableInput()
+                for attr, _, _, _ in fields
+                if hasattr(self, attr)
+            )
+        )
 
     def _on_cpu_changed(self, idx):
-        self.cpu_custom_fields_widget.setVisible(idx == len(self.cpu_names) - 1)
+        self._set_custom_visible(
+            self._CPU_FIELDS,
+            self.cpu_combo,
+            "cpu",
+            self.cpu_combo.itemData(idx) is None,
+        )
         self.cpu_name_string = self.cpu_combo.currentText()
 
     def _on_add_gpu_toggled(self, checked):
         self.gpu_combo.setVisible(checked)
-        self.gpu_custom_fields_widget.setVisible(
-            checked and self.gpu_combo.currentIndex() == len(self.gpu_names) - 1
+        self._set_custom_visible(
+            self._GPU_FIELDS,
+            self.gpu_combo,
+            "gpu",
+            checked and self.gpu_combo.currentData() is None,
         )
 
     def _on_gpu_changed(self, idx):
-        self.gpu_custom_fields_widget.setVisible(
-            idx == len(self.gpu_names) - 1 and self.add_gpu_checkbox.isChecked()
+        self._set_custom_visible(
+            self._GPU_FIELDS,
+            self.gpu_combo,
+            "gpu",
+            self.gpu_combo.itemData(idx) is None and self.add_gpu_checkbox.isChecked(),
         )
 
     def get_selected_resource(self):
         # CPU
-        cpu_idx = self.cpu_combo.currentIndex()
-        if cpu_idx == len(self.cpu_names) - 1:
+        cpu_func = self.cpu_combo.currentData()
+        if cpu_func is None:
             # Custom CPU
+            from daolite.compute import create_compute_resources
+
+            self._ensure_custom_fields(self._CPU_FIELDS, self.cpu_combo, "cpu")
             cpu_resource = create_compute_resources(
                 cores=int(self.cores_edit.text()),
                 core_frequency=float(self.freq_edit.text()),
@@ -248,17 +336,17 @@ class ResourceSelectionDialog(QDialog):
                 time_in_driver=5,
             )
         else:
-            cpu_func = self.cpu_funcs[cpu_idx]
             cpu_resource = cpu_func()
         cpu_resource.name = self.name_edit.text().strip()
         # GPU
         attached_gpus = []
         if self.add_gpu_checkbox.isChecked():
-            gpu_idx = self.gpu_combo.currentIndex()
-            if gpu_idx == len(self.gpu_names) - 1:
+            gpu_func = self.gpu_combo.currentData()
+            if gpu_func is None:
                 # Custom GPU
                 from daolite.compute.base_resources import create_gpu_resource
 
+                self._ensure_custom_fields(self._GPU_FIELDS, self.gpu_combo, "gpu")
                 gpu_resource = create_gpu_resource(
                     flops=float(self.gpu_flops_edit.text()),
                     memory_bandwidth=float(self.gpu_mem_bw_edit.text()),
@@ -266,7 +354,6 @@ class ResourceSelectionDialog(QDialog):
                     time_in_driver=float(self.gpu_time_in_driver_edit.text()),
                 )
             else:
-                gpu_func = self.gpu_funcs[gpu_idx]
                 gpu_resource = gpu_func()
             attached_gpus.append(gpu_resource)
         # Always update attached_gpus, even if empty (removes GPU if unchecked)
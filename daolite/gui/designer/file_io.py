@@ -6,8 +6,10 @@ This module handles saving and loading pipeline designs to/from files.
 
 import json
 import logging
+import os
+from functools import lru_cache
 
-from PyQt5.QtCore import QRectF
+from PyQt5.QtCore import QObject, QRectF, QRunnable, pyqtSignal
 
 from daolite.common import ComponentType
 from daolite.compute import create_compute_resources
@@ -21,6 +23,25 @@ from .connection_manager import update_connection_indicators
 # Set up logging
 logger = logging.getLogger("FileIO")
 
+# Keyword arguments create_compute_resources accepts from a saved "compute" entry
+_RESOURCE_PARAMS = frozenset(
+    {
+        "hardware",
+        "cores",
+        "core_frequency",
+        "flops_per_cycle",
+        "memory_channels",
+        "memory_width",
+        "memory_frequency",
+        "network_speed",
+        "time_in_driver",
+        "core_fudge",
+        "mem_fudge",
+        "network_fudge",
+        "adjust",
+    }
+)
+
 
 def _to_dict_recursive(obj):
     if hasattr(obj, "to_dict") and callable(obj.to_dict):
@@ -49,8 +70,8 @@ def save_pipeline_to_file(scene, components, connections, filename):
     """
     data = {"containers": [], "components": [], "connections": [], "transfers": []}
 
-    # Save compute and GPU boxes first
-    for item in scene.items():
+    # Save compute and GPU boxes first, from the scene's container registry
+    for item in scene.containers():
         if isinstance(item, ComputeBox):
             container_data = {
                 "type": "ComputeBox",
@@ -264,6 +285,54 @@ def save_pipeline_to_file(scene, components, connections, filename):
         return False
 
 
+def read_pipeline_file(filename):
+    """
+    Parse a pipeline design file without touching any scene.
+
+    Safe to call from a worker thread. Decoded files are cached until they
+    change on disk, and the cached dict is shared, so treat it as read-only.
+
+    Args:
+        filename: Path to the JSON file
+
+    Returns:
+        dict: The decoded pipeline data
+    """
+    path = os.path.realpath(filename)
+    stat = os.stat(path)
+    return _parse_pipeline_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_pipeline_cached(path, mtime_ns, size):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class PipelineParseTask(QRunnable):
+    """
+    Parse a pipeline design file on a QThreadPool worker.
+
+    ``signals.finished`` is emitted with ``(data, error)``; connect it from
+    the GUI thread so the scene is only built there.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(object, object)
+
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            data, error = read_pipeline_file(self.filename), None
+        except Exception as e:
+            data, error = None, e
+        self.signals.finished.emit(data, error)
+
+
 def load_pipeline(scene, filename, component_counts):
     """
     Load pipeline design from a JSON file.
@@ -273,6 +342,29 @@ def load_pipeline(scene, filename, component_counts):
         filename: Path to the JSON file
         component_counts: Dictionary to update with component counts
 
+    Returns:
+        bool: True if load was successful, False otherwise
+    """
+    try:
+        data = read_pipeline_file(filename)
+    except Exception as e:
+        logger.error(f"Error loading pipeline: {str(e)}")
+        return False
+    if not load_pipeline_data(scene, data, component_counts):
+        return False
+    logger.info("Pipeline loaded from %s", filename)
+    return True
+
+
+def load_pipeline_data(scene, data, component_counts):
+    """
+    Rebuild a pipeline design from already-decoded data.
+
+    Args:
+        scene: The QGraphicsScene to load the pipeline into
+        data: Pipeline data as returned by read_pipeline_file
+        component_counts: Dictionary to update with component counts
+
     Returns:
         bool: True if load was successful, False otherwise
     """
@@ -281,10 +373,6 @@ def load_pipeline(scene, filename, component_counts):
         scene.clear()
         scene.connections = []
 
-        # Load data from file
-        with open(filename, "r") as f:
-            data = json.load(f)
-
         # Recreate compute and GPU boxes first
         compute_boxes = {}  # Map names to objects
         gpu_boxes = {}  # Map names to objects
@@ -299,25 +387,11 @@ def load_pipeline(scene, filename, component_counts):
                 # Create compute resource if provided
                 compute_resource = None
                 if "compute" in container:
-                    compute_dict = container["compute"].copy()
                     # Always reconstruct from parameters if present
-                    valid_params = {
-                        "hardware",
-                        "cores",
-                        "core_frequency",
-                        "flops_per_cycle",
-                        "memory_channels",
-                        "memory_width",
-                        "memory_frequency",
-                        "network_speed",
-                        "time_in_driver",
-                        "core_fudge",
-                        "mem_fudge",
-                        "network_fudge",
-                        "adjust",
-                    }
                     filtered_dict = {
-                        k: v for k, v in compute_dict.items() if k in valid_params
+                        k: v
+                        for k, v in container["compute"].items()
+                        if k in _RESOURCE_PARAMS
                     }
                     try:
                         compute_resource = create_compute_resources(**filtered_dict)
@@ -341,24 +415,10 @@ def load_pipeline(scene, filename, component_counts):
                     # Create GPU resource if provided
                     gpu_resource = None
                     if "compute" in gpu_data:
-                        gpu_dict = gpu_data["compute"].copy()
-                        valid_params = {
-                            "hardware",
-                            "cores",
-                            "core_frequency",
-                            "flops_per_cycle",
-                            "memory_channels",
-                            "memory_width",
-                            "memory_frequency",
-                            "network_speed",
-                            "time_in_driver",
-                            "core_fudge",
-                            "mem_fudge",
-                            "network_fudge",
-                            "adjust",
-                        }
                         filtered_dict = {
-                            k: v for k, v in gpu_dict.items() if k in valid_params
+                            k: v
+                            for k, v in gpu_data["compute"].items()
+                            if k in _RESOURCE_PARAMS
                         }
                         try:
                             if "hardware" not in filtered_dict:
@@ -372,8 +432,8 @@ def load_pipeline(scene, filename, component_counts):
                     gpu_box = GPUBox(gpu_name, gpu_resource=gpu_resource)
                     gpu_box.size = QRectF(0, 0, gpu_size[0], gpu_size[1])
                     gpu_box.setPos(gpu_pos[0], gpu_pos[1])
+                    # Parenting to an in-scene box adds the GPU to the scene
                     compute_box.add_child(gpu_box)
-                    scene.addItem(gpu_box)
                     gpu_boxes[gpu_name] = gpu_box
 
         # Map to keep track of component names to objects
@@ -394,12 +454,12 @@ def load_pipeline(scene, filename, component_counts):
 
             # Create component
             component = ComponentBlock(comp_type, name)
-            component.params = params
+            # Copy so edits to the block don't leak into the parse cache
+            component.params = dict(params)
 
             # Find parent container
             parent_type = comp_data.get("parent_type", None)
             parent_name = comp_data.get("parent_name", None)
-            comp_data.get("gpu_parent_name", None)
 
             # Add to scene with proper parenting
             if parent_type == "ComputeBox" and parent_name in compute_boxes:
@@ -408,10 +468,8 @@ def load_pipeline(scene, filename, component_counts):
                 component.setPos(pos[0], pos[1])
                 if hasattr(parent, "compute"):
                     component.compute = parent.compute
-                if (
-                    hasattr(parent, "child_items")
-                    and component not in parent.child_items
-                ):
+                # Fresh block, so it cannot already be tracked by the parent
+                if hasattr(parent, "child_items"):
                     parent.child_items.append(component)
             elif parent_type == "GPUBox" and parent_name in gpu_boxes:
                 parent = gpu_boxes[parent_name]
@@ -419,16 +477,15 @@ def load_pipeline(scene, filename, component_counts):
                 component.setPos(pos[0], pos[1])
                 if hasattr(parent, "gpu_resource"):
                     component.compute = parent.gpu_resource
-                if (
-                    hasattr(parent, "child_items")
-                    and component not in parent.child_items
-                ):
+                # Fresh block, so it cannot already be tracked by the parent
+                if hasattr(parent, "child_items"):
                     parent.child_items.append(component)
             else:
                 # No parent or parent not found
                 component.setPos(pos[0], pos[1])
 
-            scene.addItem(component)
+            if component.scene() is not scene:
+                scene.addItem(component)
             components[name] = component
 
             # Update component counts
@@ -446,21 +503,15 @@ def load_pipeline(scene, filename, component_counts):
                 ):
                     comp_number = int(name_without_prefix)
                 # Update the counter, ensure comp_type is a valid key
-                if comp_type in component_counts:
-                    component_counts[comp_type] = max(
-                        component_counts[comp_type], comp_number
-                    )
-                else:
-                    component_counts[comp_type] = comp_number
+                component_counts[comp_type] = max(
+                    component_counts.get(comp_type, 0), comp_number
+                )
             except Exception as e:
                 logger.debug(
-                    f"Could not update component count from name {name}: {str(e)}"
+                    "Could not update component count from name %s: %s", name, e
                 )
                 # Just increment the count if we can't parse the name
-                if comp_type in component_counts:
-                    component_counts[comp_type] += 1
-                else:
-                    component_counts[comp_type] = 1
+                component_counts[comp_type] = component_counts.get(comp_type, 0) + 1
 
         # Create transfer components in the scene first
         # This ensures they exist when connections are created
@@ -495,7 +546,7 @@ def load_pipeline(scene, filename, component_counts):
             transfer_comp.setVisible(False)
             scene.addItem(transfer_comp)
 
-            logger.debug(f"Created transfer component: {transfer_name}")
+            logger.debug("Created transfer component: %s", transfer_name)
 
         # Create connections with proper transfer chains
         connection_map = {}  # Map to store connections for transfer setup
@@ -528,7 +579,7 @@ def load_pipeline(scene, filename, component_counts):
                     # Create connection
                     connection = Connection(start_block, start_port)
                     if connection.complete_connection(end_block, end_port):
-                        scene.connections.append(connection)
+                        scene.add_connection(connection)
                         scene.addItem(connection)
 
                         # Store connection for transfer setup
@@ -624,7 +675,6 @@ def load_pipeline(scene, filename, component_counts):
         for connection in scene.connections:
             update_connection_indicators(scene, connection)
 
-        logger.info(f"Pipeline loaded from {filename}")
         return True
     except Exception as e:
         logger.error(f"Error loading pipeline: {str(e)}")
@@ -1,4 +1,6 @@
-from PyQt5.QtCore import Qt
+import os
+
+from PyQt5.QtCore import Qt, QThreadPool, QTimer, pyqtSlot
 from PyQt5.QtGui import QCursor, QKeySequence
 from PyQt5.QtWidgets import (
     QApplication,
@@ -7,24 +9,33 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QUndoStack,
     QUndoView,
-    QWidget,
 )
 
 from daolite.common import ComponentType
 from daolite.compute.hardware import amd_epyc_7763, nvidia_rtx_4090
-from daolite.config import CameraConfig, OpticsConfig
 
-from .code_generator import CodeGenerator
 from .component_block import ComponentBlock
-from .component_container import ComputeBox, GPUBox
-from .dialogs.misc_dialogs import ShortcutHelpDialog, StyledTextInputDialog
+from .component_container import ComponentContainer, ComputeBox, GPUBox
+from .dialogs.misc_dialogs import (
+    ShortcutHelpDialog,
+    StyledTextInputDialog,
+    show_file_message,
+)
 from .dialogs.parameter_dialog import ComponentParametersDialog
 from .dialogs.resource_dialog import ResourceSelectionDialog
+from .file_io import PipelineParseTask, load_pipeline_data, save_pipeline_to_file
 from .menu import create_menu
+from .pipeline_executor import ExecutionMethod, run_pipeline
 from .scene import PipelineScene
-from .style_utils import get_saved_theme, save_theme, set_app_style
+from .style_utils import (
+    get_quick_save_path,
+    get_saved_theme,
+    save_theme,
+    set_app_style,
+)
 from .toolbar import create_toolbar
 from .undo_stack import (
     AddComponentCommand,
@@ -42,21 +53,19 @@ class PipelineDesignerApp(QMainWindow):
     network and multi-compute node configurations.
     """
 
+    # Hardware preset used for new components; anything unlisted gets a CPU.
+    _DEFAULT_COMPUTE_FACTORY = {
+        ComponentType.CENTROIDER: nvidia_rtx_4090,
+        ComponentType.RECONSTRUCTION: nvidia_rtx_4090,
+    }
+
     def __init__(self, json_path=None):
         print("[DEBUG] PipelineDesignerApp.__init__ called")
         self.theme = get_saved_theme()
         self.pipeline_title = (
             "AO Pipeline"  # Ensure pipeline_title is always initialized
         )
-        self.component_counts = {
-            ComponentType.CAMERA: 0,
-            ComponentType.CALIBRATION: 0,
-            ComponentType.CENTROIDER: 0,
-            ComponentType.RECONSTRUCTION: 0,
-            ComponentType.CONTROL: 0,
-            ComponentType.NETWORK: 0,
-            ComponentType.DM: 0,  # Add DeformableMirror component counting
-        }
+        self.component_counts = {t: 0 for t in ComponentType}
         super().__init__()
         self.setWindowTitle("Pipeline Designer")
         self.setGeometry(100, 100, 800, 600)
@@ -64,29 +73,58 @@ class PipelineDesignerApp(QMainWindow):
         print(f"[DEBUG] Scene created with parent: {self.scene.parent()}")
         # Use our custom PipelineView instead of QGraphicsView
         self.view = PipelineView(self.scene, self)
+        self.scene.set_primary_view(self.view)
         self.setCentralWidget(self.view)
         self.undo_stack = QUndoStack(self)
         self.execution_method = QComboBox()
+        # Item order matches pipeline_executor.ExecutionMethod
         self.execution_method.addItems(["Python", "JSON"])
         self.execution_method.setCurrentText("Python")
+        self._quick_save_path = get_quick_save_path()
+        # Load, load-error and resource dialogs, built on first use and reused
+        self._load_dialog = None
+        self._load_error_box = None
+        self._resource_dialog = None
+        self._lazy_initialized = False
         self.init_ui()
         print(f"[DEBUG] json_path: {json_path}")
         if json_path:
+            # Parsing runs in the background, so the window paints first
             self.load_pipeline(json_path)
 
         # Initialize selected_component attribute
         self.selected_component = None
+        # Connections highlighted for the current selection
+        self._highlighted = set()
+        # Rubber-band and multi-select emit selectionChanged once per item;
+        # coalesce the burst into a single refresh.
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(30)
+        self._selection_timer.timeout.connect(self._update_selection)
+        self.scene.selectionChanged.connect(self._selection_timer.start)
 
     def init_ui(self):
         print("[DEBUG] PipelineDesignerApp.init_ui called")
         # Set up undo/redo actions before creating the menu that references them
         self._setup_undo_redo_actions()
+        self.statusBar().showMessage("Ready")
+
+    def _initialize_deferred_ui(self):
+        """Build the toolbar, menus and styling the first time the window is shown."""
+        if self._lazy_initialized:
+            return
+        print("[DEBUG] PipelineDesignerApp._initialize_deferred_ui called")
+        self._lazy_initialized = True
         self._create_toolbar()
         self.create_menu()
         self._create_undo_view()
-        self.statusBar().showMessage("Ready")
         self.set_theme(get_saved_theme())
 
+    def showEvent(self, event):
+        self._initialize_deferred_ui()
+        super().showEvent(event)
+
     def _create_undo_view(self):
         """Create a dock widget with an undo history view."""
         print("[DEBUG] PipelineDesignerApp._create_undo_view called")
@@ -154,31 +192,45 @@ class PipelineDesignerApp(QMainWindow):
 
     def generate_code(self):
         print("[DEBUG] PipelineDesignerApp.generate_code called")
+        from .code_generator import CodeGenerator
+
         generator = CodeGenerator(self.scene)
         code = generator.generate()
         dialog = StyledTextInputDialog("Generated Code", code, self)
         dialog.exec_()
 
+    def _get_resource_dialog(self, existing_resource=None):
+        """
+        Return the shared resource dialog, reset for a new selection.
+
+        The dialog is built on first use and reused afterwards, so its combo
+        boxes and form fields aren't rebuilt every time a resource is chosen.
+        """
+        if self._resource_dialog is None:
+            self._resource_dialog = ResourceSelectionDialog(self)
+        self._resource_dialog.reset(existing_resource)
+        return self._resource_dialog
+
     def select_resource(self):
         print("[DEBUG] PipelineDesignerApp.select_resource called")
-        dialog = ResourceSelectionDialog(self)
+        dialog = self._get_resource_dialog()
         if dialog.exec_() == QMessageBox.Accepted:
             resource = dialog.get_selected_resource()
             print(f"[DEBUG] Selected resource: {resource}")
 
     def _add_compute_box(self):
         print("[DEBUG] PipelineDesignerApp._add_compute_box called")
-        dlg = ResourceSelectionDialog(self)
+        dlg = self._get_resource_dialog()
         if dlg.exec_():
             cpu = dlg.cpu_name()
             compute_resource = dlg.get_selected_resource()
-            cpu_name = getattr(compute_resource, "name", "Computer")
+            cpu_name = compute_resource.name or "Computer"
             compute_box = ComputeBox(
                 cpu_name, compute=compute_resource, cpu_resource=cpu
             )
 
             # Get the center of the current view in scene coordinates
-            view_center = self.view.mapToScene(self.view.viewport().rect().center())
+            view_center = self.view.get_scene_center_point()
 
             # Center the compute box at this position by accounting for its size
             compute_box.setPos(
@@ -186,21 +238,26 @@ class PipelineDesignerApp(QMainWindow):
                 view_center.y() - compute_box.size.height() / 2,
             )
 
+            # Parent the GPUs before the box enters the scene so the whole
+            # subtree is inserted in one addItem call
+            gpu_boxes = []
+            if compute_resource.attached_gpus:
+                for idx, gpu_resource in enumerate(compute_resource.attached_gpus):
+                    gpu_name = gpu_resource.name or f"GPU{idx+1}"
+                    gpu_box = GPUBox(gpu_name, gpu_resource=gpu_resource)
+                    gpu_box.setPos(30, 60 + 40 * idx)
+                    compute_box.add_child(gpu_box)
+                    gpu_boxes.append(gpu_box)
+
             command = AddComponentCommand(self.scene, compute_box)
             self.undo_stack.push(command)
             print(
                 f"[DEBUG] Added compute_box: {compute_box} at center position: {compute_box.pos()}"
             )
-
-            if hasattr(compute_resource, "attached_gpus"):
-                for idx, gpu_resource in enumerate(compute_resource.attached_gpus):
-                    gpu_name = getattr(gpu_resource, "name", f"GPU{idx+1}")
-                    gpu_box = GPUBox(gpu_name, gpu_resource=gpu_resource)
-                    gpu_box.setPos(30, 60 + 40 * idx)
-                    compute_box.add_child(gpu_box)
-                    command = AddComponentCommand(self.scene, gpu_box)
-                    self.undo_stack.push(command)
-                    print(f"[DEBUG] Added gpu_box: {gpu_box}")
+            for gpu_box in gpu_boxes:
+                command = AddComponentCommand(self.scene, gpu_box)
+                self.undo_stack.push(command)
+                print(f"[DEBUG] Added gpu_box: {gpu_box}")
 
     def _add_gpu_box(self):
         print("[DEBUG] PipelineDesignerApp._add_gpu_box called")
@@ -224,7 +281,7 @@ class PipelineDesignerApp(QMainWindow):
             return
         name = dlg.getText()
         # Prompt for GPU resource
-        dlg = ResourceSelectionDialog(self)
+        dlg = self._get_resource_dialog()
         gpu_resource = None
         if dlg.exec_():
             gpu_resource = dlg.get_selected_resource()
@@ -243,29 +300,90 @@ class PipelineDesignerApp(QMainWindow):
         self.undo_stack.push(command)
         print(f"[DEBUG] Added gpu_box: {gpu_box} at center position: {gpu_box.pos()}")
 
-    def load_pipeline(self, json_path):
+    def load_pipeline(self, json_path, quiet=False):
+        """
+        Load a pipeline file in the background.
+
+        Progress and success are reported on the status bar. Failures raise an
+        error dialog unless quiet is set, which keeps scripted batch loads from
+        stopping on a modal popup.
+        """
         print(
             f"[DEBUG] PipelineDesignerApp.load_pipeline called with json_path={json_path}"
         )
-        try:
-            with open(json_path, "r") as file:
-                data = file.read()
-                self.scene.load_from_json(data)
-                self.statusBar().showMessage(f"Loaded pipeline from {json_path}")
-                print(f"[DEBUG] Loaded pipeline from {json_path}")
-        except Exception as e:
-            print(f"[DEBUG] Failed to load pipeline: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to load pipeline: {e}")
+        self.statusBar().showMessage(
+            f"Loading pipeline from {os.path.basename(json_path)}…"
+        )
+        self._parse_pipeline_async(
+            json_path,
+            lambda data, error: self._apply_loaded_pipeline(
+                json_path, data, error, quiet
+            ),
+        )
 
-    @staticmethod
-    def run(json_path=None):
-        print(f"[DEBUG] PipelineDesignerApp.run called with json_path={json_path}")
-        import sys
+    def _parse_pipeline_async(self, filename, on_parsed):
+        """
+        Parse a pipeline file on a worker thread.
+
+        on_parsed(data, error) is queued back to the GUI thread, where the
+        scene can be rebuilt safely.
+        """
+        task = PipelineParseTask(filename)
+        task.signals.finished.connect(on_parsed, Qt.QueuedConnection)
+        # Keep the task, and so its signals object, alive until it reports back
+        self._parse_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def _apply_loaded_pipeline(self, json_path, data, error, quiet=False):
+        self._parse_task = None
+        loaded = False
+        if error is None:
+            with self.scene.bulk_loading():
+                loaded = load_pipeline_data(self.scene, data, self.component_counts)
+        if loaded:
+            self.statusBar().showMessage(
+                f"Pipeline loaded: {os.path.basename(json_path)}", 3000
+            )
+            print(f"[DEBUG] Loaded pipeline from {json_path}")
+            return True
+        error = error or "invalid pipeline data"
+        print(f"[DEBUG] Failed to load pipeline: {error}")
+        if quiet:
+            self.statusBar().showMessage(f"Failed to load pipeline: {error}", 3000)
+        else:
+            self._show_load_error(f"Failed to load pipeline: {error}")
+        return False
+
+    def _show_load_error(self, message):
+        """Report a failed load in a critical box that is built once and reused."""
+        if self._load_error_box is None:
+            self._load_error_box = QMessageBox(
+                QMessageBox.Critical, "Error", "", QMessageBox.Ok, self
+            )
+        self._load_error_box.setText(message)
+        self._load_error_box.exec_()
 
-        app = QApplication(sys.argv)
-        window = PipelineDesignerApp(json_path=json_path)
-        window.show()
-        sys.exit(app.exec_())
+    def _load_pipeline_file(self, filename):
+        """Load a user-chosen pipeline file behind a busy indicator."""
+        progress = QProgressDialog(
+            f"Loading {os.path.basename(filename)}…", "", 0, 0, self
+        )
+        progress.setCancelButton(None)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+
+        def on_parsed(data, error):
+            progress.close()
+            success = self._apply_loaded_pipeline(filename, data, error)
+            print(f"[DEBUG] Load pipeline success: {success}")
+
+        self._parse_pipeline_async(filename, on_parsed)
+
+    @staticmethod
+    def run(json_path=None, app=None, blocking=True):
+        """Show the designer; see run_designer."""
+        return run_designer(json_path, app=app, blocking=blocking)
 
     def _new_pipeline(self):
         print("[DEBUG] PipelineDesignerApp._new_pipeline called")
@@ -280,7 +398,7 @@ class PipelineDesignerApp(QMainWindow):
             print("[DEBUG] Clearing scene and resetting component counts")
             self.scene.clear()
             self.scene.connections = []
-            self.component_counts = {key: 0 for key in self.component_counts}
+            self.component_counts = {t: 0 for t in ComponentType}
 
     def _save_pipeline(self):
         print("[DEBUG] PipelineDesignerApp._save_pipeline called")
@@ -296,43 +414,55 @@ class PipelineDesignerApp(QMainWindow):
         )
         print(f"[DEBUG] Save pipeline filename: {filename}")
         if filename:
-            from .file_io import save_pipeline_to_file
-
             success = save_pipeline_to_file(
                 self.scene, self._get_all_components(), self.scene.connections, filename
             )
             print(f"[DEBUG] Save pipeline success: {success}")
             if success:
-                QMessageBox.information(
-                    self, "Pipeline Saved", f"Pipeline design saved to {filename}"
+                show_file_message(
+                    self,
+                    QMessageBox.Information,
+                    "Pipeline Saved",
+                    "Pipeline design saved to",
+                    filename,
                 )
             else:
-                QMessageBox.warning(
-                    self, "Save Error", f"Failed to save pipeline to {filename}"
+                show_file_message(
+                    self,
+                    QMessageBox.Warning,
+                    "Save Error",
+                    "Failed to save pipeline to",
+                    filename,
                 )
 
     def _load_pipeline(self):
         print("[DEBUG] PipelineDesignerApp._load_pipeline called")
-        from .file_io import load_pipeline
+        self._open_load_dialog()
 
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Load Pipeline Design", "", "JSON Files (*.json);;All Files (*)"
-        )
+    def _open_load_dialog(self):
+        """
+        Show the shared, non-native "Load Pipeline Design" dialog.
+
+        The dialog is built on first use and opened window-modally, so this
+        returns at once; the chosen file is loaded from fileSelected.
+        """
+        if self._load_dialog is None:
+            dialog = QFileDialog(self, "Load Pipeline Design")
+            dialog.setOption(QFileDialog.DontUseNativeDialog, True)
+            dialog.setFileMode(QFileDialog.ExistingFile)
+            dialog.setNameFilters(["JSON Files (*.json)", "All Files (*)"])
+            dialog.fileSelected.connect(self._on_load_file_selected)
+            self._load_dialog = dialog
+        self._load_dialog.open()
+
+    def _on_load_file_selected(self, filename):
         print(f"[DEBUG] Load pipeline filename: {filename}")
         if filename:
-            success = load_pipeline(self.scene, filename, self.component_counts)
-            print(f"[DEBUG] Load pipeline success: {success}")
-            if success:
-                QMessageBox.information(
-                    self, "Pipeline Loaded", f"Pipeline design loaded from {filename}"
-                )
-            else:
-                QMessageBox.critical(
-                    self, "Load Error", f"Failed to load pipeline from {filename}"
-                )
+            self._load_pipeline_file(filename)
 
     def _rename_selected(self):
         print("[DEBUG] PipelineDesignerApp._rename_selected called")
+        self._flush_selection()
         if not self.selected_component:
             print("[DEBUG] No selected component to rename")
             return
@@ -350,96 +480,100 @@ class PipelineDesignerApp(QMainWindow):
             command = RenameComponentCommand(
                 self.selected_component, old_name, new_name
             )
+            # The command repaints the renamed block itself
             self.undo_stack.push(command)
 
-            # Update the scene
-            self.scene.update()
-
     def _delete_selected(self):
         print("[DEBUG] PipelineDesignerApp._delete_selected called")
-        for item in self.scene.selectedItems():
-            print(f"[DEBUG] Considering item for deletion: {item}")
-            if isinstance(item, ComponentBlock):
-                # First, collect all connections associated with this component
-                connections_to_remove = []
-                for connection in list(self.scene.connections):
-                    if connection.start_block == item or connection.end_block == item:
-                        connections_to_remove.append(connection)
-
-                # Call disconnect() on each connection first
-                # This will ensure that transfer indicators are properly removed
-                for connection in connections_to_remove:
-                    print(f"[DEBUG] About to disconnect connection: {connection}")
-                    connection.disconnect()
-                    print(f"[DEBUG] Disconnected connection: {connection}")
-
-                # After disconnection, remove connections from the scene
-                for connection in connections_to_remove:
-                    if connection in self.scene.connections:
-                        self.scene.connections.remove(connection)
-                        print(
-                            f"[DEBUG] Removed connection from scene.connections: {connection}"
-                        )
-                    self.scene.removeItem(connection)
-                    print(f"[DEBUG] Removed connection from scene: {connection}")
-
-                # Now create and push the remove component command
-                command = RemoveComponentCommand(
-                    self.scene, item, connections_to_remove
-                )
-                self.undo_stack.push(command)
-                print(f"[DEBUG] Removed item: {item}")
-            elif isinstance(item, ComputeBox) or isinstance(item, GPUBox):
-                # Handle container deletion
-                # Create a command to remove the container
-                command = RemoveComponentCommand(self.scene, item)
-                self.undo_stack.push(command)
-                print(f"[DEBUG] Removed container: {item}")
+        selected = self.scene.selectedItems()
+        if not selected:
+            return
+        # One repaint and one undo step for the whole selection
+        with self.scene.updates_suspended():
+            self.undo_stack.beginMacro(f"Delete {len(selected)} item(s)")
+            try:
+                for item in selected:
+                    self._delete_item(item)
+            finally:
+                self.undo_stack.endMacro()
+
+    def _delete_item(self, item):
+        """Remove one selected item, and a block's connections, via the undo stack."""
+        print(f"[DEBUG] Considering item for deletion: {item}")
+        if isinstance(item, ComponentBlock):
+            # First, collect all connections associated with this component
+            connections_to_remove = list(self.scene.connections_for(item))
+
+            # Call disconnect() on each connection first
+            # This will ensure that transfer indicators are properly removed
+            for connection in connections_to_remove:
+                print(f"[DEBUG] About to disconnect connection: {connection}")
+                connection.disconnect()
+                print(f"[DEBUG] Disconnected connection: {connection}")
+
+            # After disconnection, remove connections from the scene
+            for connection in connections_to_remove:
+                if self.scene.has_connection(connection):
+                    self.scene.remove_connection(connection)
+                    print(
+                        f"[DEBUG] Removed connection from scene.connections: {connection}"
+                    )
+                self.scene.removeItem(connection)
+                print(f"[DEBUG] Removed connection from scene: {connection}")
+
+            # Now create and push the remove component command
+            command = RemoveComponentCommand(self.scene, item, connections_to_remove)
+            self.undo_stack.push(command)
+            print(f"[DEBUG] Removed item: {item}")
+        elif isinstance(item, ComponentContainer):
+            # Handle container deletion
+            # Create a command to remove the container
+            command = RemoveComponentCommand(self.scene, item)
+            self.undo_stack.push(command)
+            print(f"[DEBUG] Removed container: {item}")
 
     def _get_default_compute_for_type(self, comp_type: ComponentType):
         print(
             f"[DEBUG] PipelineDesignerApp._get_default_compute_for_type called with comp_type={comp_type}"
         )
-        if comp_type in (ComponentType.CENTROIDER, ComponentType.RECONSTRUCTION):
-            return nvidia_rtx_4090()
-        else:
-            return amd_epyc_7763()
+        factory = self._DEFAULT_COMPUTE_FACTORY.get(comp_type, amd_epyc_7763)
+        # Hardware factories cache the parsed YAML and return a fresh copy
+        return factory()
+
+    def _flush_selection(self):
+        """Apply a pending debounced selection update immediately."""
+        if self._selection_timer.isActive():
+            self._selection_timer.stop()
+            self._update_selection()
 
     def _update_selection(self):
         print("[DEBUG] PipelineDesignerApp._update_selection called")
         selected_items = self.scene.selectedItems()
         print(f"[DEBUG] Selected items: {selected_items}")
+        # Only clear what was highlighted last time and is still in the scene
+        for conn in self._highlighted:
+            if self.scene.has_connection(conn):
+                conn.highlight_connection(False)
+        self._highlighted = set()
         if len(selected_items) == 1 and isinstance(selected_items[0], ComponentBlock):
             self.selected_component = selected_items[0]
-            for item in self.scene.items():
-                if hasattr(item, "set_highlight"):
-                    item.set_highlight(False)
-                if hasattr(item, "highlight_connection"):
-                    item.highlight_connection(False)
-            for conn in getattr(self.scene, "connections", []):
-                if (
-                    conn.start_block == self.selected_component
-                    or conn.end_block == self.selected_component
-                ):
-                    if hasattr(conn, "highlight_connection"):
-                        conn.highlight_connection(True)
+            for conn in self.scene.connections_for(self.selected_component):
+                conn.highlight_connection(True)
+                self._highlighted.add(conn)
         else:
             self.selected_component = None
-            for item in self.scene.items():
-                if hasattr(item, "set_highlight"):
-                    item.set_highlight(False)
-                if hasattr(item, "highlight_connection"):
-                    item.highlight_connection(False)
 
     def _generate_code(self):
         print("[DEBUG] PipelineDesignerApp._generate_code called")
         components = self._get_all_components()
-        print(f"[DEBUG] Components for code generation: {components}")
+        print(f"[DEBUG] Components for code generation: {len(components)}")
         if not components:
             QMessageBox.warning(
                 self, "Empty Pipeline", "No components to generate code from."
             )
             return
+        from .code_generator import CodeGenerator
+
         generator = CodeGenerator(components)
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save Pipeline Code", "", "Python Files (*.py);;All Files (*)"
@@ -447,20 +581,23 @@ class PipelineDesignerApp(QMainWindow):
         print(f"[DEBUG] Code generation filename: {filename}")
         if filename:
             generator.export_to_file(filename)
-            QMessageBox.information(
-                self, "Code Generation Complete", f"Pipeline code saved to {filename}"
+            show_file_message(
+                self,
+                QMessageBox.Information,
+                "Code Generation Complete",
+                "Pipeline code saved to",
+                filename,
             )
 
     def _set_theme(self, theme):
         print(f"[DEBUG] PipelineDesignerApp._set_theme called with theme={theme}")
         self.theme = theme
         save_theme(theme)
-        set_app_style(self, theme)
         self.scene.set_theme(theme)
         self._create_toolbar()
+        # Styles the window and every child, including the rebuilt toolbar
+        set_app_style(self, theme)
         self.update()
-        for widget in self.findChildren(QWidget):
-            set_app_style(widget, theme)
         if hasattr(self, "_theme_actions"):
             for act in self._theme_actions:
                 act.setChecked(act.text().lower().startswith(theme))
@@ -490,8 +627,20 @@ class PipelineDesignerApp(QMainWindow):
         ):
             component.compute = self._get_default_compute_for_type(comp_type)
 
+    @pyqtSlot()
+    def _on_add_component(self):
+        """Add the component type stored on the clicked toolbar button."""
+        self._add_component(self.sender().property("comp_type"))
+
+    @pyqtSlot()
+    def _on_zoom(self):
+        """Scale the view by the factor stored on the clicked toolbar button."""
+        factor = self.sender().property("zoom_factor")
+        self.view.scale(factor, factor)
+
     def _configure_compute(self):
         print("[DEBUG] PipelineDesignerApp._configure_compute called")
+        self._flush_selection()
         if not self.selected_component:
             print("[DEBUG] No selected component to configure compute")
             QMessageBox.information(
@@ -502,6 +651,7 @@ class PipelineDesignerApp(QMainWindow):
 
     def _configure_params(self):
         print("[DEBUG] PipelineDesignerApp._configure_params called")
+        self._flush_selection()
         if not self.selected_component:
             print("[DEBUG] No selected component to configure params")
             QMessageBox.information(
@@ -564,8 +714,6 @@ class PipelineDesignerApp(QMainWindow):
                 self.selected_component, old_params, new_params
             )
             self.undo_stack.push(command)
-
-            self.scene.update()
             print(f"[DEBUG] Updated params for component: {self.selected_component}")
 
     def _check_parameter_propagation(self, source_component, changed_params):
@@ -580,26 +728,27 @@ class PipelineDesignerApp(QMainWindow):
         from .dialogs.parameter_propagation_dialog import ParameterPropagationDialog
         from .parameter_inheritance import find_components_for_parameter_propagation
 
+        # Gather the candidate components once; they do not change between
+        # parameters, only the propagation targets do
+        other_components = self._get_all_components()
+        if not other_components:
+            print("[DEBUG] No other components found in scene")
+            return
+
+        # Exclude the source component
+        other_components = [
+            comp for comp in other_components if comp is not source_component
+        ]
+        if not other_components:
+            print("[DEBUG] No components other than source component")
+            return
+
         # Get all components that might be affected by each parameter change
         for param_name, new_value in changed_params.items():
             print(
                 f"[DEBUG] Checking propagation for parameter {param_name}={new_value}"
             )
 
-            # Find components that can inherit this parameter
-            other_components = self._get_all_components()
-            if not other_components:
-                print("[DEBUG] No other components found in scene")
-                continue
-
-            # Exclude the source component
-            other_components = [
-                comp for comp in other_components if comp != source_component
-            ]
-            if not other_components:
-                print("[DEBUG] No components other than source component")
-                continue
-
             print(
                 f"[DEBUG] Found {len(other_components)} other components to check for propagation"
             )
@@ -655,15 +804,13 @@ class PipelineDesignerApp(QMainWindow):
 
     def _quick_save_pipeline(self):
         print("[DEBUG] PipelineDesignerApp._quick_save_pipeline called")
-        import os
-
-        default_path = os.path.expanduser("~/daolite_quicksave.json")
-        from .file_io import save_pipeline_to_file
-
+        default_path = self._quick_save_path
         save_pipeline_to_file(
             self.scene, self._get_all_components(), self.scene.connections, default_path
         )
-        self.statusBar().showMessage(f"Pipeline quick-saved to {default_path}", 3000)
+        self.statusBar().showMessage(
+            f"Pipeline quick-saved to {os.path.basename(default_path)}", 3000
+        )
         print(f"[DEBUG] Pipeline quick-saved to {default_path}")
 
     def _get_compute_resource(self, item):
@@ -671,23 +818,28 @@ class PipelineDesignerApp(QMainWindow):
             f"[DEBUG] PipelineDesignerApp._get_compute_resource called for item: {item}"
         )
         existing_resource = item.compute if hasattr(item, "compute") else None
-        dlg = ResourceSelectionDialog(self, existing_resource=existing_resource)
+        dlg = self._get_resource_dialog(existing_resource)
         if dlg.exec_():
             new_resource = dlg.get_selected_resource()
             print(f"[DEBUG] New resource selected: {new_resource}")
+            # Blocks configure the container they sit in
+            target = item if isinstance(item, ComponentContainer) else item.parentItem()
+            if new_resource == getattr(target, "compute", None):
+                # ComputeResources is a dataclass, so this compares field values
+                print("[DEBUG] Compute resource unchanged; skipping update")
+                return
             if isinstance(item, ComputeBox):
                 item.compute = new_resource
-                for child in list(item.childItems()):
-                    if isinstance(child, GPUBox):
-                        item.childItems().remove(child)
-                        self.scene.removeItem(child)
-                        print(f"[DEBUG] Removed GPUBox child: {child}")
-                if (
-                    hasattr(new_resource, "attached_gpus")
-                    and new_resource.attached_gpus
-                ):
+                # childItems() returns a copy, so detach through the container
+                gpus_to_remove = [c for c in item.childItems() if isinstance(c, GPUBox)]
+                for child in gpus_to_remove:
+                    child.setParentItem(None)
+                    self.scene.removeItem(child)
+                    item.release_child(child)
+                    print(f"[DEBUG] Removed GPUBox child: {child}")
+                if new_resource.attached_gpus:
                     for idx, gpu_resource in enumerate(new_resource.attached_gpus):
-                        gpu_name = getattr(gpu_resource, "name", f"GPU{idx+1}")
+                        gpu_name = gpu_resource.name or f"GPU{idx+1}"
                         gpu_box = GPUBox(gpu_name, gpu_resource=gpu_resource)
                         gpu_box.setPos(30, 60 + 40 * idx)
                         item.add_child(gpu_box)
@@ -704,9 +856,10 @@ class PipelineDesignerApp(QMainWindow):
                         child.update()
             else:
                 parent = item.parentItem()
-                if parent and isinstance(parent, (ComputeBox, GPUBox)):
+                if isinstance(parent, ComponentContainer):
                     parent.compute = new_resource
-                    item.update()
+                    # The container's area covers the blocks drawn inside it
+                    parent.update()
                 else:
                     print("[DEBUG] No container for compute resource")
                     QMessageBox.warning(
@@ -714,14 +867,12 @@ class PipelineDesignerApp(QMainWindow):
                         "No Container",
                         "This component is not in a compute container. Please add it to a CPU or GPU container first.",
                     )
-            self.scene.update()
+            item.update()
             print(f"[DEBUG] Finished updating compute resource for item: {item}")
 
     def _get_all_components(self):
-        components = [
-            item for item in self.scene.items() if isinstance(item, ComponentBlock)
-        ]
-        print(f"[DEBUG] _get_all_components found: {components}")
+        components = self.scene.components()
+        print(f"[DEBUG] _get_all_components found {len(components)} components")
         return components
 
     def _export_config(self):
@@ -733,58 +884,12 @@ class PipelineDesignerApp(QMainWindow):
                 self, "Empty Pipeline", "No components to export configuration from."
             )
             return
-        camera_component = None
-        actuator_count = 5000
-        for component in components:
-            if component.component_type == ComponentType.CAMERA:
-                camera_component = component
-            elif component.component_type == ComponentType.CONTROL:
-                if "n_actuators" in component.params:
-                    actuator_count = component.params["n_actuators"]
-        if camera_component and camera_component.params:
-            camera_params = camera_component.params
-            CameraConfig(
-                n_pixels=camera_params.get("n_pixels", 1024 * 1024),
-                n_subapertures=camera_params.get("n_subapertures", 80 * 80),
-                pixels_per_subaperture=camera_params.get(
-                    "pixels_per_subaperture", 16 * 16
-                ),
-                bit_depth=camera_params.get("bit_depth", 16),
-                readout_time=camera_params.get("readout_time", 500.0),
-            )
-        else:
-            CameraConfig(
-                n_pixels=1024 * 1024,
-                n_subapertures=80 * 80,
-                pixels_per_subaperture=16 * 16,
-            )
-        OpticsConfig(n_actuators=actuator_count)
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Load Pipeline Design", "", "JSON Files (*.json);;All Files (*)"
-        )
-        print(f"[DEBUG] Export config filename: {filename}")
-        if not filename:
-            print("[DEBUG] Export config cancelled by user")
-            return
-        from .file_io import load_pipeline
-
-        success = load_pipeline(self.scene, filename, self.component_counts)
-        print(f"[DEBUG] Export config load_pipeline success: {success}")
-        if success:
-            QMessageBox.information(
-                self, "Pipeline Loaded", f"Pipeline design loaded from {filename}"
-            )
-        else:
-            QMessageBox.critical(
-                self, "Load Error", f"Failed to load pipeline from {filename}"
-            )
+        self._open_load_dialog()
 
     def _run_pipeline(self):
         print("[DEBUG] PipelineDesignerApp._run_pipeline called")
-        from .pipeline_executor import run_pipeline
-
         components = self._get_all_components()
-        execution_method = self.execution_method.currentText()
+        execution_method = ExecutionMethod(self.execution_method.currentIndex())
         print(f"[DEBUG] Running pipeline with execution_method={execution_method}")
         run_pipeline(self, components, self.scene, execution_method)
 
@@ -835,10 +940,15 @@ class PipelineDesignerApp(QMainWindow):
 
         component = ComponentBlock(component_type, instance_number=count)
 
-        # If position not specified, place at mouse position
+        # If position not specified, place at the mouse when it is over the
+        # canvas, otherwise (e.g. toolbar clicks) at the cached view center
         if pos is None:
-            cursor_pos = self.mapFromGlobal(QCursor.pos())
-            scene_pos = self.view.mapToScene(cursor_pos)
+            viewport = self.view.viewport()
+            cursor_pos = viewport.mapFromGlobal(QCursor.pos())
+            if viewport.rect().contains(cursor_pos):
+                scene_pos = self.view.mapToScene(cursor_pos)
+            else:
+                scene_pos = self.view.get_scene_center_point()
             component.setPos(
                 scene_pos.x() - component.size.width() / 2,
                 scene_pos.y() - component.size.height() / 2,
@@ -846,8 +956,8 @@ class PipelineDesignerApp(QMainWindow):
         else:
             component.setPos(pos)
 
-        # Add to scene
-        self.scene.addItem(component)
+        # Add to scene through the undo stack so the insertion can be undone
+        self.undo_stack.push(AddComponentCommand(self.scene, component))
 
         # Set as selected component
         self.selected_component = component
@@ -855,11 +965,6 @@ class PipelineDesignerApp(QMainWindow):
         # Check if there are parameters that can be inherited from existing components
         self._check_inheritable_parameters(component)
 
-        # Add to history - Fix parameter order (scene, component) and don't add command
-        # for something we've already added to the scene
-        # command = AddComponentCommand(self.scene, component)
-        # self.undo_stack.push(command)
-
         return component
 
     def _check_inheritable_parameters(self, component):
@@ -902,3 +1007,25 @@ class PipelineDesignerApp(QMainWindow):
                     if not hasattr(component, "params"):
                         component.params = {}
                     component.params.update(selected_params)
+
+
+def run_designer(json_path=None, app=None, blocking=True):
+    """
+    Show the designer, reusing an existing QApplication where possible.
+
+    With blocking=True the Qt event loop is run and its exit code returned;
+    with blocking=False the window is returned to an embedding caller that
+    already drives the event loop. Exiting the process is left to the
+    command-line entry point. Being a plain module-level function, this can
+    also be handed to multiprocessing as a spawn target.
+    """
+    print(f"[DEBUG] run_designer called with json_path={json_path}")
+    if app is None:
+        import sys
+
+        app = QApplication.instance() or QApplication(sys.argv)
+    window = PipelineDesignerApp(json_path=json_path)
+    window.show()
+    if blocking:
+        return app.exec_()
+    return window
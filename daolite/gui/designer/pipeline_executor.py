@@ -10,6 +10,7 @@ import os
 import subprocess
 import sys
 import tempfile
+from enum import IntEnum
 
 from PyQt5.QtWidgets import (
     QApplication,
@@ -28,7 +29,59 @@ from .visualization_utils import show_visualization
 logger = logging.getLogger("PipelineExecutor")
 
 
-def run_pipeline(parent, components, scene, execution_method="Python"):
+class ExecutionMethod(IntEnum):
+    """How a designed pipeline is executed; values follow the toolbar combo order."""
+
+    PYTHON = 0
+    JSON = 1
+
+
+def _build_python_command(parent, components, scene, temp_dir, vis_path):
+    """Write a generated script that saves its timing plot; return its command."""
+    py_path = os.path.join(temp_dir, "temp_pipeline.py")
+    generator = CodeGenerator(components)
+    try:
+        generator.export_to_file(py_path)
+        # Add visualization code to the Python file
+        with open(py_path, "a") as f:
+            f.write("\n\n# Visualize pipeline\n")
+            f.write("fig, ax, latency = pipeline.visualize('Pipeline Timing')\n")
+
+            # Save the figure to a file instead of showing it
+            f.write(f"fig.savefig('{vis_path}', dpi=300, bbox_inches='tight')\n")
+            f.write(f"print('\\nVisualization saved to: {vis_path}')\n")
+            f.write("print(f'Total pipeline latency: {latency:.2f} μs')\n")
+            # Don't call plt.show() - instead, just save the figure
+    except Exception as e:
+        QMessageBox.critical(
+            parent,
+            "Code Generation Error",
+            f"Failed to generate Python code: {str(e)}",
+        )
+        return None
+    return [sys.executable, py_path]
+
+
+def _build_json_command(parent, components, scene, temp_dir, vis_path):
+    """Save the design for the JSON runner; return the runner command."""
+    json_path = os.path.join(temp_dir, "temp_pipeline.json")
+    save_pipeline_to_file(scene, components, scene.connections, json_path)
+    return [
+        sys.executable,
+        "-m",
+        "daolite.pipeline.json_runner",
+        json_path,
+        "--save",
+        vis_path,
+        "--no-show",
+    ]
+
+
+# Indexed by ExecutionMethod
+_COMMAND_BUILDERS = (_build_python_command, _build_json_command)
+
+
+def run_pipeline(parent, components, scene, execution_method=ExecutionMethod.PYTHON):
     """
     Run the pipeline and display visualization in a popup window.
 
@@ -36,7 +89,7 @@ def run_pipeline(parent, components, scene, execution_method="Python"):
         parent: Parent widget
         components: List of component blocks
         scene: The QGraphicsScene containing the pipeline
-        execution_method: Either "Python" or "JSON"
+        execution_method: An ExecutionMethod, or its name ("Python" or "JSON")
 
     Returns:
         bool: True if execution was successful, False otherwise
@@ -45,44 +98,21 @@ def run_pipeline(parent, components, scene, execution_method="Python"):
         QMessageBox.warning(parent, "Empty Pipeline", "No components to run.")
         return False
 
+    if isinstance(execution_method, str):
+        execution_method = ExecutionMethod[execution_method.upper()]
+
     # Create a temporary directory for pipeline execution
     with tempfile.TemporaryDirectory() as temp_dir:
-        # For either method, we need to save the pipeline design in JSON format
-        json_path = os.path.join(temp_dir, "temp_pipeline.json")
-        save_pipeline_to_file(scene, components, scene.connections, json_path)
-
-        # For Python method, also create a Python script
-        if execution_method == "Python":
-            py_path = os.path.join(temp_dir, "temp_pipeline.py")
-            generator = CodeGenerator(components)
-            try:
-                generator.export_to_file(py_path)
-                # Add visualization code to the Python file
-                with open(py_path, "a") as f:
-                    f.write("\n\n# Visualize pipeline\n")
-                    f.write(
-                        "fig, ax, latency = pipeline.visualize('Pipeline Timing')\n"
-                    )
-
-                    # Save the figure to a file instead of showing it
-                    vis_path = os.path.join(temp_dir, "visualization.png")
-                    f.write(
-                        f"fig.savefig('{vis_path}', dpi=300, bbox_inches='tight')\n"
-                    )
-                    f.write(f"print('\\nVisualization saved to: {vis_path}')\n")
-                    f.write("print(f'Total pipeline latency: {latency:.2f} μs')\n")
-                    # Don't call plt.show() - instead, just save the figure
-            except Exception as e:
-                QMessageBox.critical(
-                    parent,
-                    "Code Generation Error",
-                    f"Failed to generate Python code: {str(e)}",
-                )
-                return False
-
         # Determine the visualization image path
         vis_path = os.path.join(temp_dir, "visualization.png")
 
+        # Write the method's input file and get the command that runs it
+        cmd = _COMMAND_BUILDERS[execution_method](
+            parent, components, scene, temp_dir, vis_path
+        )
+        if cmd is None:
+            return False
+
         # Create a dialog to show execution progress
         progress_dialog = QDialog(parent)
         progress_dialog.setWindowTitle("Running Pipeline")
@@ -99,24 +129,9 @@ def run_pipeline(parent, components, scene, execution_method="Python"):
         progress_dialog.setLayout(layout)
         progress_dialog.show()
 
-        # Construct the command based on execution method
-        if execution_method == "Python":
-            # Set environment variable to force matplotlib to use Agg backend (non-interactive)
-            my_env = os.environ.copy()
-            my_env["MPLBACKEND"] = "Agg"  # Force non-interactive matplotlib backend
-            cmd = [sys.executable, py_path]
-        else:  # JSON
-            my_env = os.environ.copy()
-            my_env["MPLBACKEND"] = "Agg"  # Force non-interactive matplotlib backend
-            cmd = [
-                sys.executable,
-                "-m",
-                "daolite.pipeline.json_runner",
-                json_path,
-                "--save",
-                vis_path,
-                "--no-show",
-            ]
+        # Force the non-interactive matplotlib backend in the child process
+        my_env = os.environ.copy()
+        my_env["MPLBACKEND"] = "Agg"
 
         # Run the command
         try:
@@ -37,15 +37,24 @@ class Port:
         self.label = label
         self.parent: Optional["ComponentBlock"] = None
         self.rect = QRectF(-9, -9, 18, 18)  # Larger clickable area for port
+        # Scene position, cached while the parent is in a scene and cleared
+        # by the parent whenever it moves
+        self._scene_pos: Optional[QPointF] = None
 
     def get_scene_position(self) -> QPointF:
         """Get the position in scene coordinates."""
         if self.parent:
             if self.parent.scene():
-                return self.parent.mapToScene(self.position)
+                if self._scene_pos is None:
+                    self._scene_pos = self.parent.mapToScene(self.position)
+                return self._scene_pos
             return self.parent.pos() + self.position
         return self.position
 
+    def invalidate_scene_position(self):
+        """Forget the cached scene position after the parent moves."""
+        self._scene_pos = None
+
     def contains_point(self, point: QPointF) -> bool:
         """Check if a point is inside this port."""
         scene_pos = self.get_scene_position()
@@ -3,13 +3,16 @@ PipelineScene for the daolite pipeline designer.
 """
 
 import logging
+from collections import defaultdict
+from contextlib import contextmanager
 
+import numpy as np
 from PyQt5.QtCore import QRectF, Qt
-from PyQt5.QtGui import QColor, QLinearGradient, QPen
+from PyQt5.QtGui import QColor, QLinearGradient, QPen, QTransform
 from PyQt5.QtWidgets import QGraphicsScene
 
 from .component_block import ComponentBlock
-from .component_container import ComputeBox, GPUBox
+from .component_container import ComponentContainer
 from .connection import Connection
 from .connection_manager import update_connection_indicators
 from .port import PortType
@@ -23,32 +26,90 @@ class PipelineScene(QGraphicsScene):
     Handles interactions, connections, and component management.
     """
 
+    # Container count above which drop detection switches to NumPy
+    VECTORIZE_THRESHOLD = 24
+
+    # Pens for the click-to-connect highlight, shared across paints
+    _HIGHLIGHT_PEN = QPen(QColor(255, 60, 60), 3, Qt.DashLine)
+    _GLOW_PENS = tuple(
+        QPen(QColor(255, 100, 100, 100 - i * 30), 1.5, Qt.SolidLine) for i in range(3)
+    )
+
     def __init__(self, parent=None, theme="light"):
         super().__init__(parent)
         print(f"[DEBUG] Scene initialized with parent: {parent}")
         self.setSceneRect(0, 0, 2000, 1500)
+        # Bounded scene rect plus BSP index keeps hit-testing off linear scans
+        self.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self.setBspTreeDepth(0)  # 0 lets Qt pick the depth from the item count
         self.theme = theme
         # Currently active connection during creation
         self.current_connection = None
         self.start_port = None
         self.start_block = None
-        # List of all connections
-        self.connections = []
+        # Ordered set of all connections, plus an index of connections per block
+        self._connections = {}
+        self._conn_index = defaultdict(list)
         # Click-to-connect state
         self.click_connect_mode = False
         self.selected_port = None
         self.selected_block = None
+        # Primary view, cached so hot paths don't rebuild the views() list
+        self._primary_view = None
+        # ComputeBox/GPUBox items, registered by the containers themselves
+        self._containers = []
+        # Nx4 (left, top, right, bottom) array of their scene rects, rebuilt
+        # lazily after any container joins, leaves, moves or resizes
+        self._container_bounds = None
+        # Block being dragged and the container currently highlighted under it
+        self._dragging_block = None
+        self._highlight_box = None
+        # ComponentBlocks, registered by the blocks themselves, in the order
+        # they joined; the tuple handed out by components() is rebuilt lazily
+        self._component_set = {}
+        self._components = ()
+        self._components_dirty = False
 
         # Track moving items for undo/redo
         self.moving_items = {}  # {item: original_position}
         self.item_moved = False
+        # Index method to restore once the current drag ends
+        self._drag_index_method = None
+
+    def set_primary_view(self, view):
+        """
+        Cache the view used for item lookups in mouse handlers.
+        """
+        self._primary_view = view
+
+    def _view(self):
+        """
+        Return the primary view, falling back to the first attached view.
+        """
+        if self._primary_view is None:
+            views = self.views()
+            if views:
+                self._primary_view = views[0]
+        return self._primary_view
+
+    def _view_transform(self):
+        """
+        Return the primary view's transform, cached by the view between zooms.
+        """
+        view = self._view()
+        if view is None:
+            return QTransform()
+        if hasattr(view, "cached_transform"):
+            return view.cached_transform()
+        return view.transform()
 
     def set_theme(self, theme):
         self.theme = theme
         self.update()
-        for item in self.items():
-            if hasattr(item, "set_theme"):
-                item.set_theme(theme)
+        # Blocks and containers are the only themed items, and both are
+        # tracked already, so no per-item probing of the whole scene
+        for item in (*self._containers, *self.components()):
+            item.set_theme(theme)
 
     def dragMoveEvent(self, event):
         event.accept()
@@ -61,16 +122,18 @@ class PipelineScene(QGraphicsScene):
         Handle mouse press events for interaction with the scene.
         """
         # Store original positions of selected items for undo/redo
+        self._end_drag_indexing()
         self.moving_items = {}
         self.item_moved = False
+        self._dragging_block = None
 
         for item in self.selectedItems():
-            if isinstance(item, (ComponentBlock, ComputeBox, GPUBox)):
+            if isinstance(item, (ComponentBlock, ComponentContainer)):
                 self.moving_items[item] = item.pos()
 
         # Connection creation logic
         pos = event.scenePos()
-        item = self.itemAt(pos, self.views()[0].transform())
+        item = self.itemAt(pos, self._view_transform())
         port = None
 
         if event.button() == Qt.LeftButton:
@@ -94,26 +157,30 @@ class PipelineScene(QGraphicsScene):
                             # Only allow output->input or input->output
                             if self.selected_port.port_type != port.port_type:
                                 # Always connect output to input
-                                if self.selected_port.port_type == PortType.INPUT:
-                                    src_block, src_port = item, port
-                                    dst_block, dst_port = (
+                                is_input = (
+                                    self.selected_port.port_type == PortType.INPUT
+                                )
+                                src_block, src_port, dst_block, dst_port = (
+                                    (
+                                        item,
+                                        port,
                                         self.selected_block,
                                         self.selected_port,
                                     )
-                                else:
-                                    src_block, src_port = (
+                                    if is_input
+                                    else (
                                         self.selected_block,
                                         self.selected_port,
+                                        item,
+                                        port,
                                     )
-                                    dst_block, dst_port = item, port
+                                )
 
                                 # Create connection
-                                from .connection import Connection
-
                                 conn = Connection(src_block, src_port)
                                 if conn.complete_connection(dst_block, dst_port):
                                     self.addItem(conn)
-                                    self.connections.append(conn)
+                                    self.add_connection(conn)
 
                                     # Log connection creation
                                     print(
@@ -121,10 +188,6 @@ class PipelineScene(QGraphicsScene):
                                     )
 
                                     # Update connection indicators
-                                    from .connection_manager import (
-                                        update_connection_indicators,
-                                    )
-
                                     update_connection_indicators(self, conn)
 
                                 # Reset state
@@ -146,8 +209,6 @@ class PipelineScene(QGraphicsScene):
                 if isinstance(item, ComponentBlock):
                     port = item.find_port_at_point(pos)
                     if port:
-                        from .connection import Connection
-
                         self.start_port = port
                         self.start_block = item
                         self.current_connection = Connection(item, port)
@@ -166,14 +227,220 @@ class PipelineScene(QGraphicsScene):
                 action = menu.exec_(event.screenPos())
                 if action == delete_action:
                     item.disconnect()
-                    if item in self.connections:
-                        self.connections.remove(item)
+                    self.remove_connection(item)
                     self.removeItem(item)
                     self.update()
                 return
 
         super().mousePressEvent(event)
 
+        # Remember the block if this press starts dragging a single component
+        if event.button() == Qt.LeftButton and isinstance(item, ComponentBlock):
+            selected = self.selectedItems()
+            if len(selected) == 1 and selected[0] is item:
+                self._dragging_block = item
+                item._moved_since_press = False
+
+    def clear(self):
+        """
+        Remove all items, dropping registries that clear() doesn't notify.
+        """
+        self._containers = []
+        self.connections = []
+        self._dragging_block = None
+        self._highlight_box = None
+        self._component_set = {}
+        self._components = ()
+        self._components_dirty = False
+        super().clear()
+
+    @property
+    def connections(self):
+        """
+        All tracked connections, in the order they were added.
+        """
+        return list(self._connections)
+
+    @connections.setter
+    def connections(self, connections):
+        self._connections = dict.fromkeys(connections)
+        self._conn_index = defaultdict(list)
+        for connection in self._connections:
+            for block in (connection.start_block, connection.end_block):
+                if block is not None:
+                    self._conn_index[block].append(connection)
+
+    def has_connection(self, connection):
+        """
+        Return True if the connection is tracked by this scene.
+        """
+        return connection in self._connections
+
+    def add_connection(self, connection):
+        """
+        Track a completed connection and index it by its end blocks.
+        """
+        if connection in self._connections:
+            return
+        self._connections[connection] = None
+        for block in (connection.start_block, connection.end_block):
+            if block is not None:
+                self._conn_index[block].append(connection)
+
+    def remove_connection(self, connection):
+        """
+        Stop tracking a connection.
+        """
+        if connection not in self._connections:
+            return
+        del self._connections[connection]
+        for block in (connection.start_block, connection.end_block):
+            block_connections = self._conn_index.get(block)
+            if block_connections and connection in block_connections:
+                block_connections.remove(connection)
+                if not block_connections:
+                    # Don't keep deleted blocks alive through empty entries
+                    del self._conn_index[block]
+
+    def connections_for(self, block):
+        """
+        Return the connections attached to a block.
+        """
+        return self._conn_index.get(block, [])
+
+    def register_component(self, block):
+        """
+        Track a ComponentBlock added to this scene.
+        """
+        if block not in self._component_set:
+            self._component_set[block] = None
+            self._components_dirty = True
+
+    def unregister_component(self, block):
+        """
+        Stop tracking a ComponentBlock removed from this scene.
+        """
+        if block in self._component_set:
+            del self._component_set[block]
+            self._components_dirty = True
+
+    def components(self):
+        """
+        Return all ComponentBlocks in the scene, in the order they were added.
+
+        The cached tuple itself is returned, so repeated calls cost nothing
+        until a block joins or leaves the scene.
+        """
+        if self._components_dirty:
+            self._components = tuple(self._component_set)
+            self._components_dirty = False
+        return self._components
+
+    def containers(self):
+        """
+        Return all ComputeBoxes and GPUBoxes in the scene, in the order they
+        were added.
+        """
+        return tuple(self._containers)
+
+    def register_container(self, container):
+        """
+        Track a ComputeBox/GPUBox added to this scene.
+        """
+        if container not in self._containers:
+            self._containers.append(container)
+            self._container_bounds = None
+
+    def unregister_container(self, container):
+        """
+        Stop tracking a container removed from this scene.
+        """
+        if container in self._containers:
+            self._containers.remove(container)
+            self._container_bounds = None
+
+    def mark_container_bounds_dirty(self):
+        """
+        Invalidate the container bounds array after a container moves or resizes.
+        """
+        self._container_bounds = None
+
+    def _container_bounds_array(self):
+        """
+        Return the (left, top, right, bottom) rows for all registered containers.
+        """
+        if self._container_bounds is None:
+            self._container_bounds = np.array(
+                [
+                    (r.left(), r.top(), r.right(), r.bottom())
+                    for r in (c.scene_rect_cached() for c in self._containers)
+                ],
+                dtype=float,
+            ).reshape(-1, 4)
+        return self._container_bounds
+
+    def _container_rects(self, exclude=None):
+        """
+        Return (container, scene rect) pairs for all ComputeBox/GPUBox items.
+
+        Scene rects come from each container's cache, so hot loops only walk
+        the transform chain for containers that moved or resized.
+        """
+        return [
+            (item, item.scene_rect_cached())
+            for item in self._containers
+            if item is not exclude
+        ]
+
+    def _find_drop_container(self, block, block_rect):
+        """
+        Find the topmost container overlapping more than 30% of the block area.
+        """
+        min_overlap = 0.3 * block_rect.width() * block_rect.height()
+        if len(self._containers) >= self.VECTORIZE_THRESHOLD:
+            # Many containers: compute every overlap area in one NumPy pass
+            # over the bounds array, which is reused until a container changes
+            xyxy = self._container_bounds_array()
+            overlap_w = np.minimum(xyxy[:, 2], block_rect.right()) - np.maximum(
+                xyxy[:, 0], block_rect.left()
+            )
+            overlap_h = np.minimum(xyxy[:, 3], block_rect.bottom()) - np.maximum(
+                xyxy[:, 1], block_rect.top()
+            )
+            area = np.maximum(overlap_w, 0) * np.maximum(overlap_h, 0)
+            candidates = [
+                self._containers[i]
+                for i in np.flatnonzero(area > min_overlap)
+                if self._containers[i] is not block
+            ]
+        else:
+            candidates = []
+            for container, container_rect in self._container_rects(block):
+                # Cheap reject before computing the overlap
+                if not block_rect.intersects(container_rect):
+                    continue
+                # Overlap size from the edges, without allocating a QRectF
+                overlap_w = min(block_rect.right(), container_rect.right()) - max(
+                    block_rect.left(), container_rect.left()
+                )
+                overlap_h = min(block_rect.bottom(), container_rect.bottom()) - max(
+                    block_rect.top(), container_rect.top()
+                )
+                if overlap_w * overlap_h > min_overlap:
+                    candidates.append(container)
+
+        best, best_key = None, None
+        # Newest containers first, so ties go to the one stacked on top
+        for container in reversed(candidates):
+            # Nested containers (GPUs inside computers) sit above their parent
+            depth, parent = 0, container.parentItem()
+            while parent is not None:
+                depth, parent = depth + 1, parent.parentItem()
+            key = (depth, container.zValue())
+            if best_key is None or key > best_key:
+                best, best_key = container, key
+        return best
+
     def mouseMoveEvent(self, event):
         """
         Handle mouse move events for interaction with the scene.
@@ -183,51 +450,54 @@ class PipelineScene(QGraphicsScene):
             self.current_connection.set_temp_end_point(event.scenePos())
             return
 
+        # Fast path: nothing is being dragged
+        if not event.buttons() & Qt.LeftButton:
+            self._set_highlight_box(None)
+            super().mouseMoveEvent(event)
+            return
+
         # Check if any tracked items have moved
-        if self.moving_items:
+        if self.moving_items and not self.item_moved:
             for item in self.moving_items.keys():
                 if item.pos() != self.moving_items[item]:
                     self.item_moved = True
                     break
 
         # Live highlight for ComputeBox/GPUBox when moving a ComponentBlock
-        selected = self.selectedItems()
-        moving_block = None
-        if len(selected) == 1 and isinstance(selected[0], ComponentBlock):
-            moving_block = selected[0]
-
-        if moving_block and moving_block.isUnderMouse():
-            # Get the block bounding rect in scene coordinates
-            block_rect = moving_block.sceneBoundingRect()
-            highlight_box = None
-
-            # Check all items that might be under the block
-            for item in self.items():
-                if isinstance(item, (ComputeBox, GPUBox)) and item is not moving_block:
-                    # Check if the block significantly overlaps with the container
-                    container_rect = item.sceneBoundingRect()
-                    intersection = block_rect.intersected(container_rect)
-
-                    # If the intersection area is more than 30% of the block area,
-                    # consider it a potential parent
-                    if (intersection.width() * intersection.height()) > 0.3 * (
-                        block_rect.width() * block_rect.height()
-                    ):
-                        highlight_box = item
-                        break
-
+        moving_block = self._dragging_block
+        if self.item_moved or getattr(moving_block, "_moved_since_press", False):
+            self._begin_drag_indexing()
+        if moving_block is not None:
+            # Get the block body rect in scene coordinates
+            block_rect = moving_block.mapRectToScene(moving_block.layout_rect())
             # Highlight the potential parent container
-            for item in self.items():
-                if hasattr(item, "set_highlight"):
-                    item.set_highlight(item is highlight_box)
+            self._set_highlight_box(self._find_drop_container(moving_block, block_rect))
         else:
             # Clear highlights if not dragging a component
-            for item in self.items():
-                if hasattr(item, "set_highlight"):
-                    item.set_highlight(False)
+            self._set_highlight_box(None)
 
         super().mouseMoveEvent(event)
 
+    def _set_highlight_box(self, box):
+        """
+        Move the drag-over highlight to box (or clear it when box is None).
+        """
+        if box is self._highlight_box:
+            return
+        if self._highlight_box is not None:
+            self._highlight_box.set_highlight(False)
+        if box is not None:
+            box.set_highlight(True)
+        self._highlight_box = box
+
+    def clear_container_highlights(self):
+        """
+        Turn off the drop highlight on every container in the scene.
+        """
+        for container in self._containers:
+            container.set_highlight(False)
+        self._highlight_box = None
+
     def mouseReleaseEvent(self, event):
         """
         Handle mouse release events for interaction with the scene.
@@ -235,13 +505,13 @@ class PipelineScene(QGraphicsScene):
         # Handle connection completion if we're in the middle of creating one
         if self.current_connection and event.button() == Qt.LeftButton:
             pos = event.scenePos()
-            item = self.itemAt(pos, self.views()[0].transform())
+            item = self.itemAt(pos, self._view_transform())
             if isinstance(item, ComponentBlock):
                 port = item.find_port_at_point(pos)
                 if port and port is not self.start_port:
                     # Complete the connection
                     if self.current_connection.complete_connection(item, port):
-                        self.connections.append(self.current_connection)
+                        self.add_connection(self.current_connection)
                         connection = self.current_connection
 
                         # Get source and destination blocks and their compute resources
@@ -269,127 +539,84 @@ class PipelineScene(QGraphicsScene):
                 self.start_port = None
                 self.start_block = None
 
-        # Handle drag and drop of components into containers
-        selected = self.selectedItems()
-        moving_block = None
-        if len(selected) == 1 and isinstance(selected[0], ComponentBlock):
-            moving_block = selected[0]
-
-        if moving_block and moving_block.isUnderMouse():
-            # Get the block bounding rect in scene coordinates
-            block_rect = moving_block.sceneBoundingRect()
-            highlight_box = None
-
-            # Check all items that might be under the block
-            for item in self.items():
-                if isinstance(item, (ComputeBox, GPUBox)) and item is not moving_block:
-                    # Check if the block significantly overlaps with the container
-                    container_rect = item.sceneBoundingRect()
-                    intersection = block_rect.intersected(container_rect)
-
-                    # If the intersection area is more than 30% of the block area,
-                    # consider it a potential parent
-                    if (intersection.width() * intersection.height()) > 0.3 * (
-                        block_rect.width() * block_rect.height()
-                    ):
-                        highlight_box = item
-                        break
-
-            # Get the original scene position before any parent changes
-            orig_scene_pos = moving_block.scenePos()
-
-            # Find the best candidate container (computer box or GPU)
-            parent_box = highlight_box
-
-            # Only consider it a drop into container if we found a container
-            if parent_box:
-                # Store any existing parent for undo handling
-                old_parent = moving_block.parentItem()
-
-                # Convert position to parent coordinates
-                local_pos = parent_box.mapFromScene(moving_block.scenePos())
-                moving_block.setParentItem(parent_box)
-                moving_block.setPos(local_pos)
-
-                # Assign compute resource
-                if hasattr(parent_box, "compute"):
-                    moving_block.compute = parent_box.compute
-                elif hasattr(parent_box, "gpu_resource"):
-                    moving_block.compute = parent_box.gpu_resource
-
-                # Add to parent's child_items list if applicable
-                if (
-                    hasattr(parent_box, "child_items")
-                    and moving_block not in parent_box.child_items
-                ):
-                    parent_box.child_items.append(moving_block)
-
-                # Optimize position within the new parent
-                # Check if block is outside parent bounds or overlapping with siblings
-                box_rect = QRectF(
-                    0, 0, parent_box.size.width(), parent_box.size.height()
-                )
-                block_rect = moving_block.boundingRect()
-                block_pos_rect = QRectF(
-                    moving_block.pos().x(),
-                    moving_block.pos().y(),
-                    block_rect.width(),
-                    block_rect.height(),
-                )
+        # Handle drag and drop of components into containers, skipping plain clicks
+        moving_block = self._dragging_block
+        if moving_block is not None and moving_block._moved_since_press:
+            # Reparenting, snapping and indicator rebuilds repaint once at the end
+            with self.updates_suspended():
+                # Get the block body rect in scene coordinates
+                block_rect = moving_block.mapRectToScene(moving_block.layout_rect())
+                # Check all containers that might be under the block
+                highlight_box = self._find_drop_container(moving_block, block_rect)
+
+                # Get the original scene position before any parent changes
+                orig_scene_pos = moving_block.scenePos()
+
+                # Find the best candidate container (computer box or GPU)
+                parent_box = highlight_box
+
+                # Only consider it a drop into container if we found a container
+                if parent_box:
+                    # Store any existing parent for undo handling
+                    old_parent = moving_block.parentItem()
+                    reparented = old_parent is not parent_box
+
+                    if reparented:
+                        # Convert position to parent coordinates
+                        local_pos = parent_box.mapFromScene(moving_block.scenePos())
+                        moving_block.setParentItem(parent_box)
+                        moving_block.setPos(local_pos)
+
+                    # Assign compute resource and track the block as a child
+                    parent_box.acquire_child(moving_block)
+
+                    # Optimize position within the new parent
+                    # Check if block is outside parent bounds or overlapping siblings
+                    box_rect = QRectF(
+                        0, 0, parent_box.size.width(), parent_box.size.height()
+                    )
+                    block_pos_rect = moving_block.mapRectToParent(
+                        moving_block.layout_rect()
+                    )
+
+                    # Check if block is outside parent bounds
+                    is_outside = not box_rect.contains(block_pos_rect)
 
-                # Check if block is outside parent bounds
-                is_outside = not box_rect.contains(block_pos_rect)
-
-                # Check for overlaps with siblings
-                is_overlapping = False
-                for sibling in parent_box.childItems():
-                    if sibling is not moving_block and isinstance(
-                        sibling, ComponentBlock
-                    ):
-                        sibling_rect = QRectF(
-                            sibling.pos().x(),
-                            sibling.pos().y(),
-                            sibling.boundingRect().width(),
-                            sibling.boundingRect().height(),
+                    # Check for overlaps with sibling blocks; intersects() answers
+                    # without building the intersection rect
+                    is_overlapping = any(
+                        block_pos_rect.intersects(
+                            sibling.mapRectToParent(sibling.layout_rect())
                         )
-                        if block_pos_rect.intersects(sibling_rect):
-                            is_overlapping = True
-                            break
+                        for sibling in parent_box.childItems()
+                        if sibling is not moving_block
+                        and type(sibling) is ComponentBlock
+                    )
 
-                # Only adjust position if necessary
-                if is_outside or is_overlapping:
-                    if hasattr(parent_box, "snap_child_fully_inside"):
+                    # Only adjust position if necessary
+                    if is_outside or is_overlapping:
                         parent_box.snap_child_fully_inside(moving_block)
 
-                # Update all connections of this block
-                for connection in self.connections:
-                    if (
-                        connection.start_block == moving_block
-                        or connection.end_block == moving_block
-                    ):
+                    # A change of container, or a snap that moved the block or
+                    # resized its container, invalidates paths and indicators;
+                    # unchanged indicators return early on their signature
+                    for connection in self.connections_for(moving_block):
                         connection.update_path()
                         connection.update_transfer_indicators()
-            else:
-                # We're moving to no parent (dragging out of a container)
-                old_parent = moving_block.parentItem()
-                if old_parent:
-                    # Preserve the exact scene position
-                    moving_block.setParentItem(None)
-                    moving_block.setPos(orig_scene_pos)
-
-                    # Remove from previous parent's child_items list if applicable
-                    if (
-                        hasattr(old_parent, "child_items")
-                        and moving_block in old_parent.child_items
-                    ):
-                        old_parent.child_items.remove(moving_block)
-
-                    # Update all connections
-                    for connection in self.connections:
-                        if (
-                            connection.start_block == moving_block
-                            or connection.end_block == moving_block
-                        ):
+                else:
+                    # We're moving to no parent (dragging out of a container)
+                    old_parent = moving_block.parentItem()
+                    if old_parent:
+                        # Preserve the exact scene position
+                        moving_block.setParentItem(None)
+                        moving_block.setPos(orig_scene_pos)
+
+                        # Remove from previous parent's child_items list if applicable
+                        if isinstance(old_parent, ComponentContainer):
+                            old_parent.release_child(moving_block)
+
+                        # Update all connections
+                        for connection in self.connections_for(moving_block):
                             connection.update_path()
                             connection.update_transfer_indicators()
 
@@ -432,104 +659,162 @@ class PipelineScene(QGraphicsScene):
         # Reset tracking
         self.moving_items = {}
         self.item_moved = False
+        self._dragging_block = None
+        self._set_highlight_box(None)
 
         super().mouseReleaseEvent(event)
+        self._end_drag_indexing()
 
-    def keyPressEvent(self, event):
+    def _begin_drag_indexing(self):
         """
-        Handle key press events for deleting items and undo/redo.
-        Zoom functionality has been moved to PipelineView.
+        Stop maintaining the BSP index while items are dragged.
+
+        Every drag step would otherwise re-index each moving item; the index
+        is rebuilt once from the final positions by _end_drag_indexing.
         """
-        from PyQt5.QtCore import Qt
-        from PyQt5.QtGui import QKeySequence
+        if self._drag_index_method is None:
+            self._drag_index_method = self.itemIndexMethod()
+            self.setItemIndexMethod(QGraphicsScene.NoIndex)
 
-        # Delete selected items
-        if event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
-            from .undo_stack import (
-                CompositeCommand,
-                RemoveComponentCommand,
-                RemoveConnectionCommand,
-            )
+    def _end_drag_indexing(self):
+        """
+        Restore the index method saved by _begin_drag_indexing.
+        """
+        if self._drag_index_method is not None:
+            self.setItemIndexMethod(self._drag_index_method)
+            self._drag_index_method = None
 
-            # Handle component and connection deletion with undo support
-            if hasattr(self.parent(), "undo_stack"):
-                items_to_delete = list(self.selectedItems())
-
-                if items_to_delete:
-                    # If multiple items, use composite command
-                    if len(items_to_delete) > 1:
-                        composite = CompositeCommand("Delete Multiple Items")
-
-                        for item in items_to_delete:
-                            if hasattr(item, "disconnect"):  # Connection
-                                command = RemoveConnectionCommand(self, item)
-                                composite.add_command(command)
-                            elif isinstance(item, (ComponentBlock, ComputeBox, GPUBox)):
-                                # Find connected connections
-                                connections = []
-                                for conn in self.connections:
-                                    if isinstance(item, ComponentBlock) and (
-                                        conn.start_block == item
-                                        or conn.end_block == item
-                                    ):
-                                        connections.append(conn)
-
-                                command = RemoveComponentCommand(
-                                    self, item, connections
-                                )
-                                composite.add_command(command)
+    @contextmanager
+    def updates_suspended(self):
+        """
+        Suspend repaints of the primary view while the scene is edited in bulk.
 
-                        if composite.commands:
-                            self.parent().undo_stack.push(composite)
-                            print(
-                                f"[DEBUG] Pushed composite delete command with {len(composite.commands)} items"
-                            )
-                    else:
-                        # Single item deletion
-                        item = items_to_delete[0]
-                        if hasattr(item, "disconnect"):  # Connection
-                            command = RemoveConnectionCommand(self, item)
-                            self.parent().undo_stack.push(command)
-                        elif isinstance(item, (ComponentBlock, ComputeBox, GPUBox)):
-                            # Find connected connections
-                            connections = []
-                            for conn in self.connections:
-                                if isinstance(item, ComponentBlock) and (
-                                    conn.start_block == item or conn.end_block == item
-                                ):
-                                    connections.append(conn)
+        The view is repainted once when the outermost block exits, so nested
+        uses are safe.
+        """
+        view = self._view()
+        if view is None or not view.updatesEnabled():
+            # No view, or an enclosing block already suspended it
+            yield
+            return
+        view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            view.setUpdatesEnabled(True)
+            view.viewport().update()
+
+    @contextmanager
+    def bulk_loading(self):
+        """
+        Insert many items without maintaining the BSP index per insert.
+
+        Indexing is switched off for the block and rebuilt once on exit, and
+        view repaints are suspended as in updates_suspended. Scene signals are
+        left alone so views still track the growing scene rect.
+        """
+        previous = self.itemIndexMethod()
+        self.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            with self.updates_suspended():
+                yield
+        finally:
+            self.setItemIndexMethod(previous)
+
+    def _delete_selected_items(self):
+        """
+        Delete the selected components, containers and connections.
+        """
+        from .undo_stack import (
+            CompositeCommand,
+            RemoveComponentCommand,
+            RemoveConnectionCommand,
+        )
+
+        # Handle component and connection deletion with undo support
+        if hasattr(self.parent(), "undo_stack"):
+            items_to_delete = list(self.selectedItems())
+
+            if items_to_delete:
+                # If multiple items, use composite command
+                if len(items_to_delete) > 1:
+                    composite = CompositeCommand("Delete Multiple Items")
+
+                    # First pass: components, each taking the connections not
+                    # already claimed by another selected component
+                    claimed = set()
+                    for item in items_to_delete:
+                        if isinstance(item, (ComponentBlock, ComponentContainer)):
+                            connections = [
+                                connection
+                                for connection in self.connections_for(item)
+                                if connection not in claimed
+                            ]
+                            claimed.update(connections)
 
                             command = RemoveComponentCommand(self, item, connections)
-                            self.parent().undo_stack.push(command)
+                            composite.add_command(command)
+
+                    # Second pass: selected connections not removed above
+                    for item in items_to_delete:
+                        if hasattr(item, "disconnect") and item not in claimed:
+                            command = RemoveConnectionCommand(self, item)
+                            composite.add_command(command)
+
+                    if composite.commands:
+                        self.parent().undo_stack.push(composite)
+                        print(
+                            f"[DEBUG] Pushed composite delete command with {len(composite.commands)} items"
+                        )
                 else:
-                    # Old deletion logic as fallback
-                    for item in self.selectedItems():
-                        # Delete connections
-                        if hasattr(item, "disconnect"):
-                            item.disconnect()
-                            if (
-                                hasattr(self, "connections")
-                                and item in self.connections
-                            ):
-                                self.connections.remove(item)
-                            self.removeItem(item)
-                        # Delete components/blocks/containers
-                        elif hasattr(item, "_on_delete"):
-                            item._on_delete()
+                    # Single item deletion
+                    item = items_to_delete[0]
+                    if hasattr(item, "disconnect"):  # Connection
+                        command = RemoveConnectionCommand(self, item)
+                        self.parent().undo_stack.push(command)
+                    elif isinstance(item, (ComponentBlock, ComponentContainer)):
+                        # Find connected connections
+                        connections = list(self.connections_for(item))
+
+                        command = RemoveComponentCommand(self, item, connections)
+                        self.parent().undo_stack.push(command)
             else:
                 # Old deletion logic as fallback
                 for item in self.selectedItems():
                     # Delete connections
                     if hasattr(item, "disconnect"):
                         item.disconnect()
-                        if hasattr(self, "connections") and item in self.connections:
-                            self.connections.remove(item)
+                        self.remove_connection(item)
                         self.removeItem(item)
                     # Delete components/blocks/containers
                     elif hasattr(item, "_on_delete"):
                         item._on_delete()
+        else:
+            # Old deletion logic as fallback
+            for item in self.selectedItems():
+                # Delete connections
+                if hasattr(item, "disconnect"):
+                    item.disconnect()
+                    self.remove_connection(item)
+                    self.removeItem(item)
+                # Delete components/blocks/containers
+                elif hasattr(item, "_on_delete"):
+                    item._on_delete()
+
+        self.update()
+
+    def keyPressEvent(self, event):
+        """
+        Handle key press events for deleting items and undo/redo.
+        Zoom functionality has been moved to PipelineView.
+        """
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtGui import QKeySequence
 
-            self.update()
+        # Delete selected items
+        if event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
+            with self.updates_suspended():
+                self._delete_selected_items()
         # Undo/Redo handled by parent (main window)
         elif event.matches(QKeySequence.Undo) or (
             event.modifiers() & Qt.ControlModifier and event.key() == Qt.Key_Z
@@ -552,17 +837,15 @@ class PipelineScene(QGraphicsScene):
         if self.click_connect_mode and self.selected_port:
             painter.save()
             # Draw a prominent highlight around the selected port
-            painter.setPen(QPen(QColor(255, 60, 60), 3, Qt.DashLine))
+            painter.setPen(PipelineScene._HIGHLIGHT_PEN)
             pos = self.selected_port.get_scene_position()
             painter.drawEllipse(
                 pos, 12, 12
             )  # Draw larger circle to make it more visible
 
             # Add a glow effect
-            for i in range(3):
+            for i, glow_pen in enumerate(PipelineScene._GLOW_PENS):
                 glow_size = 15 + i * 3
-                glow_opacity = 100 - i * 30
-                glow_pen = QPen(QColor(255, 100, 100, glow_opacity), 1.5, Qt.SolidLine)
                 painter.setPen(glow_pen)
                 painter.drawEllipse(pos, glow_size, glow_size)
 
@@ -608,21 +891,14 @@ class PipelineScene(QGraphicsScene):
         Load pipeline design from a JSON string.
         Clears the scene and reconstructs components and connections using the legacy logic from file_io.load_pipeline.
         """
-        import os
-        import tempfile
+        import json
 
-        from .file_io import load_pipeline
+        from .file_io import load_pipeline_data
 
-        # Write the JSON string to a temporary file to reuse load_pipeline logic
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".json", mode="w") as tmp:
-            tmp.write(data)
-            tmp_path = tmp.name
         # Use a dummy component_counts dict (caller can update real one if needed)
         dummy_counts = {}
-        try:
-            load_pipeline(self, tmp_path, dummy_counts)
-        finally:
-            os.remove(tmp_path)
+        with self.bulk_loading():
+            load_pipeline_data(self, json.loads(data), dummy_counts)
 
     def create_connection(self, start_block, start_port, end_block, end_port):
         """
@@ -649,7 +925,7 @@ class PipelineScene(QGraphicsScene):
         else:
             # Fallback for backward compatibility
             self.addItem(connection)
-            self.connections.append(connection)
+            self.add_connection(connection)
             print(f"[DEBUG] Added connection without undo support: {connection}")
 
         return connection
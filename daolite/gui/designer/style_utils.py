@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 from PyQt5.QtCore import QSettings
 from PyQt5.QtWidgets import (
@@ -42,6 +43,15 @@ def detect_system_theme():
     return "light"
 
 
+@lru_cache(maxsize=None)
+def _load_style(style_path):
+    """Read a QSS file once; returns None if it doesn't exist."""
+    if not os.path.exists(style_path):
+        return None
+    with open(style_path, "r") as f:
+        return f.read()
+
+
 def set_app_style(widget: QWidget, theme=None):
     """
     Apply the shared QSS style to a widget/dialog, with theme support.
@@ -58,15 +68,17 @@ def set_app_style(widget: QWidget, theme=None):
     if theme == "system":
         theme = detect_system_theme()
 
-    style_path = get_style_path(theme)
-    if os.path.exists(style_path):
-        with open(style_path, "r") as f:
-            style_content = f.read()
+    style_content = _load_style(get_style_path(theme))
+    if style_content is not None:
+        # Qt re-parses a stylesheet on every setStyleSheet call, so skip
+        # widgets that already carry this exact sheet
+        if widget.styleSheet() != style_content:
             widget.setStyleSheet(style_content)
 
-            # Also apply the style to all existing child widgets
-            # This ensures even dynamically created widgets get proper styling
-            for child in widget.findChildren(QWidget):
+        # Also apply the style to all existing child widgets
+        # This ensures even dynamically created widgets get proper styling
+        for child in widget.findChildren(QWidget):
+            if child.styleSheet() != style_content:
                 child.setStyleSheet(style_content)
 
 
@@ -98,3 +110,12 @@ def get_saved_theme():
 def save_theme(theme):
     settings = QSettings("daolite", "PipelineDesigner")
     settings.setValue("theme", theme)
+
+
+def get_quick_save_path():
+    settings = QSettings("daolite", "PipelineDesigner")
+    path = settings.value("quick_save_path", "")
+    if not path:
+        path = os.path.join(os.path.expanduser("~"), "daolite_quicksave.json")
+        settings.setValue("quick_save_path", path)
+    return path
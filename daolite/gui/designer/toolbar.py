@@ -5,6 +5,40 @@ from PyQt5.QtWidgets import QFrame, QLabel, QMenu, QSizePolicy, QToolBar, QToolB
 from daolite.common import ComponentType
 
 
+# Toolbar stylesheets, kept at module level so they are built once
+_DARK_TOOLBAR_STYLE = """
+    QToolBar {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #27304a, stop:1 #232b3a);
+        border: none;
+        padding: 8px 4px;
+    }
+    QToolBar QLabel, QToolBar QPushButton, QToolBar QToolButton {
+        color: #f2f6fa;
+        font-weight: 500;
+    }
+    QToolBar QToolButton {
+        background: #2d3952;
+        border: 1.5px solid #3a4660;
+        border-radius: 7px;
+        padding: 6px 14px;
+        margin: 2px 0;
+        font-size: 13px;
+    }
+    QToolBar QToolButton:hover {
+        background: #36415a;
+        border: 1.5px solid #4a90e2;
+        color: #b3e1ff;
+    }
+    QToolBar QToolButton:pressed {
+        background: #232b3a;
+    }
+"""
+_LIGHT_TOOLBAR_STYLE = (
+    "QToolBar { background: #e7f2fa; border: none; padding: 8px 4px; } "
+    "QToolBar QLabel, QToolBar QPushButton, QToolBar QToolButton { color: #375a7f; }"
+)
+
+
 def create_toolbar(main_window):
     print("[DEBUG] Entering create_toolbar")
     # Remove any existing toolbars
@@ -20,44 +54,16 @@ def create_toolbar(main_window):
     toolbar.setIconSize(QSize(32, 32))
     toolbar.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
     main_window.addToolBar(Qt.TopToolBarArea, toolbar)
+    # Defer repaints until every widget has been added
+    toolbar.setUpdatesEnabled(False)
     print("[DEBUG] Added toolbar to main window")
 
     theme = getattr(main_window, "theme", "light")
     print(f"[DEBUG] Toolbar theme: {theme}")
     if theme == "dark":
-        toolbar.setStyleSheet(
-            """
-            QToolBar {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #27304a, stop:1 #232b3a);
-                border: none;
-                padding: 8px 4px;
-            }
-            QToolBar QLabel, QToolBar QPushButton, QToolBar QToolButton {
-                color: #f2f6fa;
-                font-weight: 500;
-            }
-            QToolBar QToolButton {
-                background: #2d3952;
-                border: 1.5px solid #3a4660;
-                border-radius: 7px;
-                padding: 6px 14px;
-                margin: 2px 0;
-                font-size: 13px;
-            }
-            QToolBar QToolButton:hover {
-                background: #36415a;
-                border: 1.5px solid #4a90e2;
-                color: #b3e1ff;
-            }
-            QToolBar QToolButton:pressed {
-                background: #232b3a;
-            }
-        """
-        )
+        toolbar.setStyleSheet(_DARK_TOOLBAR_STYLE)
     else:
-        toolbar.setStyleSheet(
-            "QToolBar { background: #e7f2fa; border: none; padding: 8px 4px; } QToolBar QLabel, QToolBar QPushButton, QToolBar QToolButton { color: #375a7f; }"
-        )
+        toolbar.setStyleSheet(_LIGHT_TOOLBAR_STYLE)
     print("[DEBUG] Set toolbar stylesheet")
 
     def add_section_label(text):
@@ -126,7 +132,8 @@ def create_toolbar(main_window):
         btn.setIcon(QIcon.fromTheme(icon))
         btn.setText(label)
         btn.setToolTip(f"Add a {label.lower()} component")
-        btn.clicked.connect(lambda _, t=ctype: main_window._add_component(t))
+        btn.setProperty("comp_type", ctype)
+        btn.clicked.connect(main_window._on_add_component)
         btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
         btn.setStyleSheet("color: #222; font-weight: 500;")
         toolbar.addWidget(btn)
@@ -192,7 +199,8 @@ def create_toolbar(main_window):
     btn_zoom_in.setIcon(QIcon.fromTheme("zoom-in"))
     btn_zoom_in.setText("Zoom In")
     btn_zoom_in.setToolTip("Zoom in on the pipeline view")
-    btn_zoom_in.clicked.connect(lambda: main_window.view.scale(1.2, 1.2))
+    btn_zoom_in.setProperty("zoom_factor", 1.2)
+    btn_zoom_in.clicked.connect(main_window._on_zoom)
     btn_zoom_in.setStyleSheet("color: #222; font-weight: 500;")
     toolbar.addWidget(btn_zoom_in)
     print("[DEBUG] Adding Zoom Out button")
@@ -200,11 +208,13 @@ def create_toolbar(main_window):
     btn_zoom_out.setIcon(QIcon.fromTheme("zoom-out"))
     btn_zoom_out.setText("Zoom Out")
     btn_zoom_out.setToolTip("Zoom out on the pipeline view")
-    btn_zoom_out.clicked.connect(lambda: main_window.view.scale(0.8, 0.8))
+    btn_zoom_out.setProperty("zoom_factor", 0.8)
+    btn_zoom_out.clicked.connect(main_window._on_zoom)
     btn_zoom_out.setStyleSheet("color: #222; font-weight: 500;")
     toolbar.addWidget(btn_zoom_out)
     add_separator()
 
+    toolbar.setUpdatesEnabled(True)
     print("[DEBUG] Exiting create_toolbar")
     main_window.statusBar().showMessage("Ready")
     return toolbar
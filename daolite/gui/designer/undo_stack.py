@@ -24,27 +24,62 @@ class AddComponentCommand(QUndoCommand):
         self.scene = scene
         self.component = component
         self.added = False
+        # Container and connections to restore on redo, recorded by undo()
+        self.parent_item = None
+        self.connections = []
 
     def redo(self):
         """Execute or redo adding the component to the scene."""
         if not self.added:
-            self.scene.addItem(self.component)
+            # Children of an item already in the scene join it automatically
+            if self.component.scene() is not self.scene:
+                self.scene.addItem(self.component)
             self.added = True
-        else:
-            self.component.setVisible(True)
-            # Add back to scene's internal lists if needed
-            if (
-                hasattr(self.scene, "_items")
-                and self.component not in self.scene._items
-            ):
-                self.scene._items.append(self.component)
+            return
+
+        # Re-adding to the container it was removed from also re-adds it
+        # to the scene
+        if self.parent_item is not None and self.parent_item.scene() is self.scene:
+            self.component.setParentItem(self.parent_item)
+            child_items = getattr(self.parent_item, "child_items", None)
+            if child_items is not None and self.component not in child_items:
+                child_items.append(self.component)
+        elif self.component.scene() is not self.scene:
+            self.scene.addItem(self.component)
+
+        # Restore the connections that were removed along with the component
+        for connection in self.connections:
+            # Reconnect the ports while the connection is out of the scene,
+            # then add it back and rebuild its indicators
+            connection.connect(
+                connection.start_block,
+                connection.start_port,
+                connection.end_block,
+                connection.end_port,
+            )
+            self.scene.addItem(connection)
+            if hasattr(self.scene, "add_connection"):
+                self.scene.add_connection(connection)
+            connection.update_transfer_indicators()
 
     def undo(self):
-        """Undo adding the component by removing it from the scene."""
-        self.component.setVisible(False)
-        # Remove from scene's internal lists if needed
-        if hasattr(self.scene, "_items") and self.component in self.scene._items:
-            self.scene._items.remove(self.component)
+        """Undo adding the component by removing it and its connections."""
+        self.parent_item = self.component.parentItem()
+        self.connections = []
+        if hasattr(self.scene, "connections_for"):
+            self.connections = list(self.scene.connections_for(self.component))
+        for connection in self.connections:
+            # Disconnect also removes the transfer indicators
+            connection.disconnect()
+            if hasattr(self.scene, "remove_connection"):
+                self.scene.remove_connection(connection)
+            if connection.scene() is self.scene:
+                self.scene.removeItem(connection)
+
+        if hasattr(self.parent_item, "release_child"):
+            self.parent_item.release_child(self.component)
+        # Leaving the scene also unregisters the block from scene.components()
+        self.scene.removeItem(self.component)
 
 
 class RemoveComponentCommand(QUndoCommand):
@@ -89,11 +124,8 @@ class RemoveComponentCommand(QUndoCommand):
             # Disconnect will remove transfer indicators
             connection.disconnect()
             connection.setVisible(False)
-            if (
-                hasattr(self.scene, "connections")
-                and connection in self.scene.connections
-            ):
-                self.scene.connections.remove(connection)
+            if hasattr(self.scene, "remove_connection"):
+                self.scene.remove_connection(connection)
 
         # Hide child items if this is a container
         for child_data in self.child_items:
@@ -132,11 +164,8 @@ class RemoveComponentCommand(QUndoCommand):
                 )
 
             # Add connection back to scene's connections list if needed
-            if (
-                hasattr(self.scene, "connections")
-                and connection not in self.scene.connections
-            ):
-                self.scene.connections.append(connection)
+            if hasattr(self.scene, "add_connection"):
+                self.scene.add_connection(connection)
 
             # Ensure transfer indicators are recreated immediately
             if hasattr(connection, "update_transfer_indicators"):
@@ -220,17 +249,9 @@ class MoveComponentCommand(QUndoCommand):
         if not scene:
             return connections
 
-        # Look for connections in the scene
-        if hasattr(scene, "connections"):
-            for connection in scene.connections:
-                if (
-                    hasattr(connection, "start_block")
-                    and connection.start_block == component
-                ) or (
-                    hasattr(connection, "end_block")
-                    and connection.end_block == component
-                ):
-                    connections.append(connection)
+        # Look up connections in the scene's per-block index
+        if hasattr(scene, "connections_for"):
+            connections = list(scene.connections_for(component))
 
         return connections
 
@@ -256,13 +277,17 @@ class RenameComponentCommand(QUndoCommand):
     def redo(self):
         """Execute or redo the rename operation."""
         self.component.name = self.new_name
-        if hasattr(self.component, "update"):
+        if hasattr(self.component, "update_name_labels"):
+            self.component.update_name_labels()
+        elif hasattr(self.component, "update"):
             self.component.update()
 
     def undo(self):
         """Undo the rename operation by restoring the original name."""
         self.component.name = self.old_name
-        if hasattr(self.component, "update"):
+        if hasattr(self.component, "update_name_labels"):
+            self.component.update_name_labels()
+        elif hasattr(self.component, "update"):
             self.component.update()
 
 
@@ -292,11 +317,8 @@ class AddConnectionCommand(QUndoCommand):
             self.connection.setVisible(True)
 
         # Add to scene's connections list if needed
-        if (
-            hasattr(self.scene, "connections")
-            and self.connection not in self.scene.connections
-        ):
-            self.scene.connections.append(self.connection)
+        if hasattr(self.scene, "add_connection"):
+            self.scene.add_connection(self.connection)
 
         # Ensure transfer indicators are created immediately
         if hasattr(self.connection, "update_transfer_indicators"):
@@ -306,11 +328,8 @@ class AddConnectionCommand(QUndoCommand):
         """Undo adding the connection by removing it from the scene."""
         self.connection.setVisible(False)
         # Remove from scene's connections list if needed
-        if (
-            hasattr(self.scene, "connections")
-            and self.connection in self.scene.connections
-        ):
-            self.scene.connections.remove(self.connection)
+        if hasattr(self.scene, "remove_connection"):
+            self.scene.remove_connection(self.connection)
 
 
 class RemoveConnectionCommand(QUndoCommand):
@@ -338,11 +357,8 @@ class RemoveConnectionCommand(QUndoCommand):
         self.connection.disconnect()
         self.connection.setVisible(False)
         # Remove from scene's connections list if needed
-        if (
-            hasattr(self.scene, "connections")
-            and self.connection in self.scene.connections
-        ):
-            self.scene.connections.remove(self.connection)
+        if hasattr(self.scene, "remove_connection"):
+            self.scene.remove_connection(self.connection)
 
     def undo(self):
         """Undo removing the connection by adding it back to the scene."""
@@ -351,11 +367,8 @@ class RemoveConnectionCommand(QUndoCommand):
         )
         self.connection.setVisible(True)
         # Add back to scene's connections list if needed
-        if (
-            hasattr(self.scene, "connections")
-            and self.connection not in self.scene.connections
-        ):
-            self.scene.connections.append(self.connection)
+        if hasattr(self.scene, "add_connection"):
+            self.scene.add_connection(self.connection)
 
 
 class ChangeParameterCommand(QUndoCommand):
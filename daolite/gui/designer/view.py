@@ -36,7 +36,12 @@ class PipelineView(QGraphicsView):
         self.setRenderHint(QPainter.Antialiasing, True)
         self.setRenderHint(QPainter.TextAntialiasing, True)
         self.setRenderHint(QPainter.SmoothPixmapTransform, True)
-        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        # Repaint only the regions that changed; items report their full
+        # painted extent in boundingRect() so no full-viewport redraw is needed
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
         self.setDragMode(QGraphicsView.RubberBandDrag)
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
@@ -59,11 +64,57 @@ class PipelineView(QGraphicsView):
         # Current theme
         self._theme = "light"
 
+        # Scene-space viewport center, dropped whenever the view moves
+        self._cached_center = None
+        # View transform, dropped whenever the view zooms
+        self._cached_transform = None
+
     def set_theme(self, theme):
         """Set the view theme."""
         self._theme = theme
         self.viewport().update()
 
+    def _invalidate_center(self):
+        """Forget the cached viewport center after a scroll, resize or zoom."""
+        self._cached_center = None
+
+    def _invalidate_transform(self):
+        """Forget the cached transform, and the center with it, after a zoom."""
+        self._cached_transform = None
+        self._invalidate_center()
+
+    def cached_transform(self):
+        """
+        Return transform(), cached until the view is next zoomed or reset.
+        """
+        if self._cached_transform is None:
+            self._cached_transform = self.transform()
+        return self._cached_transform
+
+    def resizeEvent(self, event):
+        self._invalidate_center()
+        super().resizeEvent(event)
+
+    def scrollContentsBy(self, dx, dy):
+        self._invalidate_center()
+        super().scrollContentsBy(dx, dy)
+
+    def scale(self, sx, sy):
+        self._invalidate_transform()
+        super().scale(sx, sy)
+
+    def resetTransform(self):
+        self._invalidate_transform()
+        super().resetTransform()
+
+    def setTransform(self, matrix, combine=False):
+        self._invalidate_transform()
+        super().setTransform(matrix, combine)
+
+    def fitInView(self, *args, **kwargs):
+        self._invalidate_transform()
+        super().fitInView(*args, **kwargs)
+
     def wheelEvent(self, event):
         """
         Handle mouse wheel events for zooming in and out.
@@ -202,11 +253,11 @@ class PipelineView(QGraphicsView):
         Returns:
             QPointF: The center point in scene coordinates
         """
-        # Get the viewport center
-        viewport_center = self.viewport().rect().center()
-
-        # Convert to scene coordinates
-        return self.mapToScene(viewport_center)
+        if self._cached_center is None:
+            # Convert the viewport center to scene coordinates
+            viewport_center = self.viewport().rect().center()
+            self._cached_center = self.mapToScene(viewport_center)
+        return self._cached_center
 
     def center_on_item(self, item):
         """
@@ -253,15 +304,10 @@ class PipelineView(QGraphicsView):
 
     def zoom_to_fit(self):
         """Zoom to fit all items in the scene."""
-        # Get all items in the scene
         if self.scene():
-            items = self.scene().items()
-            if items:
-                # Calculate the bounding rect of all items
-                rect = QRectF()
-                for item in items:
-                    rect |= item.sceneBoundingRect()
-
+            # Union of every item's scene bounding rect, computed by Qt
+            rect = self.scene().itemsBoundingRect()
+            if not rect.isNull():
                 # Add some padding
                 rect.adjust(-50, -50, 50, 50)
 
@@ -182,8 +182,14 @@ def save_visualization_image(parent, source_path):
             copyfile(source_path, filename)
             from PyQt5.QtWidgets import QMessageBox
 
-            QMessageBox.information(
-                parent, "Image Saved", f"Visualization saved to {filename}"
+            from .dialogs.misc_dialogs import show_file_message
+
+            show_file_message(
+                parent,
+                QMessageBox.Information,
+                "Image Saved",
+                "Visualization saved to",
+                filename,
             )
         except Exception as e:
             from PyQt5.QtWidgets import QMessageBox
@@ -2,17 +2,18 @@ import logging
 import sys
 import tempfile
 
-from daolite.gui.designer.main_window import PipelineDesignerApp
-
-# Set up logging with proper configuration
-logfile = tempfile.NamedTemporaryFile(prefix="daolite_", suffix=".log", delete=False)
-logging.basicConfig(filename=logfile.name, level=logging.INFO, filemode="w")
-print(f"Logging to {logfile.name}")
-
 
 def main():
     from PyQt5.QtWidgets import QApplication, QMessageBox
 
+    # Configure logging here rather than at import, so importing this module
+    # leaves the host application's logging untouched
+    logfile = tempfile.NamedTemporaryFile(
+        prefix="daolite_", suffix=".log", delete=False
+    )
+    logging.basicConfig(filename=logfile.name, level=logging.INFO, filemode="w")
+    print(f"Logging to {logfile.name}")
+
     # Show experimental warning
     print("\n" + "=" * 70)
     print("WARNING: Pipeline Designer GUI is in EXPERIMENTAL phase")
@@ -27,8 +28,8 @@ def main():
     # Get json_path from command line arguments if provided
     json_path = sys.argv[1] if len(sys.argv) > 1 else None
 
-    # Create the application
-    app = QApplication(sys.argv)
+    # Create the application, reusing one if we're embedded in a running Qt app
+    app = QApplication.instance() or QApplication(sys.argv)
 
     # Show GUI warning dialog
     msg = QMessageBox()
@@ -46,12 +47,11 @@ def main():
     if msg.exec_() != QMessageBox.Yes:
         return 0
 
-    # Create and show the main window
-    window = PipelineDesignerApp(json_path=json_path)
-    window.show()
+    # Import the designer only once the user has chosen to continue
+    from daolite.gui.designer.main_window import run_designer
 
-    # Start the application event loop
-    return app.exec_()
+    # Show the main window and start the application event loop
+    return run_designer(json_path, app=app)
 
 
 if __name__ == "__main__":
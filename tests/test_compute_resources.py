@@ -177,6 +177,27 @@ class TestComputeResources(unittest.TestCase):
         self.assertIsInstance(result, ComputeResources)
         self.assertEqual(result.hardware, "GPU")
 
+    def test_hardware_factory_returns_independent_copies(self):
+        """Test cached hardware factories hand out independent resources."""
+        from daolite.compute.hardware import amd_epyc_7763
+
+        first = amd_epyc_7763()
+        second = amd_epyc_7763()
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        first.cores = 1
+        self.assertNotEqual(amd_epyc_7763().cores, 1)
+        first.attached_gpus.append(ComputeResources(hardware="GPU"))
+        self.assertEqual(amd_epyc_7763().attached_gpus, [])
+
+    def test_name_and_attached_gpus_defaults(self):
+        """Test every resource carries a name and its own GPU list."""
+        first = ComputeResources()
+        second = ComputeResources()
+        self.assertEqual(first.name, "")
+        self.assertEqual(first.attached_gpus, [])
+        self.assertIsNot(first.attached_gpus, second.attached_gpus)
+
     # TODO: add in later.
     # def test_create_compute_resources_from_system(self):
     #     """Test system-based resource creation (smoke test)."""
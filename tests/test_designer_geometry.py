@@ -0,0 +1,126 @@
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QPointF, QRectF  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from daolite.gui.designer.component_container import ComputeBox, GPUBox  # noqa: E402
+from daolite.gui.designer.connection_manager import (  # noqa: E402
+    find_boundary_intersection,
+)
+from daolite.gui.designer.scene import PipelineScene  # noqa: E402
+
+
+def setUpModule():
+    global _app
+    _app = QApplication.instance() or QApplication([])
+
+
+class TestFindBoundaryIntersection(unittest.TestCase):
+    def setUp(self):
+        self.scene = PipelineScene()
+        self.box = ComputeBox("Computer")
+        self.box.setPos(100, 100)
+        self.scene.addItem(self.box)
+        rect = self.box.scene_rect_cached()
+        self.left, self.top = rect.left(), rect.top()
+        self.right, self.bottom = rect.right(), rect.bottom()
+        self.mid_x, self.mid_y = rect.center().x(), rect.center().y()
+
+    def intersect(self, x1, y1, x2, y2):
+        return find_boundary_intersection(QPointF(x1, y1), QPointF(x2, y2), self.box)
+
+    def assertPointEqual(self, point, x, y):
+        self.assertIsNotNone(point)
+        self.assertAlmostEqual(point.x(), x)
+        self.assertAlmostEqual(point.y(), y)
+
+    def test_crossing_returns_exit_point(self):
+        # Diagonal through the box: enters the left edge, leaves the right
+        point = self.intersect(
+            self.left - 40, self.mid_y - 20, self.right + 40, self.mid_y + 20
+        )
+        self.assertIsNotNone(point)
+        self.assertAlmostEqual(point.x(), self.right)
+        self.assertGreater(point.y(), self.mid_y)
+        self.assertLess(point.y(), self.bottom)
+
+    def test_start_inside_returns_exit_point(self):
+        point = self.intersect(self.mid_x, self.mid_y, self.right + 80, self.mid_y)
+        self.assertPointEqual(point, self.right, self.mid_y)
+
+    def test_end_inside_returns_entry_point(self):
+        point = self.intersect(self.left - 80, self.mid_y, self.mid_x, self.mid_y)
+        self.assertPointEqual(point, self.left, self.mid_y)
+
+    def test_miss_returns_none(self):
+        self.assertIsNone(
+            self.intersect(self.left - 80, self.top - 80, self.left - 10, self.bottom)
+        )
+
+    def test_fully_inside_returns_none(self):
+        self.assertIsNone(
+            self.intersect(self.left + 10, self.top + 10, self.mid_x, self.mid_y)
+        )
+
+    def test_axis_parallel(self):
+        vertical = self.intersect(
+            self.mid_x, self.top - 80, self.mid_x, self.bottom + 80
+        )
+        self.assertPointEqual(vertical, self.mid_x, self.bottom)
+        horizontal = self.intersect(
+            self.right + 80, self.mid_y, self.left - 80, self.mid_y
+        )
+        self.assertPointEqual(horizontal, self.left, self.mid_y)
+        # Parallel to the left edge but outside the box
+        self.assertIsNone(
+            self.intersect(
+                self.left - 10, self.top - 80, self.left - 10, self.bottom + 80
+            )
+        )
+
+    def test_no_container(self):
+        self.assertIsNone(
+            find_boundary_intersection(QPointF(0, 0), QPointF(500, 500), None)
+        )
+
+
+class TestFindDropContainer(unittest.TestCase):
+    def setUp(self):
+        self.scene = PipelineScene()
+        # Overlapping computers, some holding a GPU, so both the overlap test
+        # and the nesting tie-break are exercised
+        for row in range(5):
+            for col in range(6):
+                box = ComputeBox(f"Computer {row}-{col}")
+                box.setPos(col * 250, row * 200)
+                self.scene.addItem(box)
+                if (row + col) % 3 == 0:
+                    gpu = GPUBox(f"GPU {row}-{col}")
+                    gpu.setParentItem(box)
+                    gpu.setPos(40, 60)
+        self.assertGreaterEqual(
+            len(self.scene.containers()), PipelineScene.VECTORIZE_THRESHOLD
+        )
+
+    def _drop_targets(self, threshold):
+        self.scene.VECTORIZE_THRESHOLD = threshold
+        targets = []
+        for y in range(-40, 1100, 37):
+            for x in range(-60, 1600, 53):
+                rect = QRectF(x, y, 160, 80)
+                targets.append(self.scene._find_drop_container(None, rect))
+        return targets
+
+    def test_numpy_matches_scalar(self):
+        vectorized = self._drop_targets(1)
+        scalar = self._drop_targets(len(self.scene.containers()) + 1)
+        self.assertEqual(vectorized, scalar)
+        self.assertTrue(any(isinstance(target, GPUBox) for target in scalar))
+        self.assertTrue(any(target is None for target in scalar))
+
+
+if __name__ == "__main__":
+    unittest.main()